@@ -0,0 +1,93 @@
+# benchmarks/bench_batched_local_search.py
+
+"""
+Success rate against wall time for the single-walker and batched local searches.
+
+Every configuration runs on the same seeded grid or maze scenarios as the
+search benchmark. A run succeeds when the returned path reaches the goal
+(hill_climbing returns the partial path it climbed when it gets stuck).
+The batched searches run once per --walkers count, and simulated
+annealing once per --schedules entry.
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.bench.search_benchmark import make_scenario
+from modules.search_algorithms.local_search import hill_climbing, simulated_annealing
+from modules.search_algorithms.batched_local_search import (
+    batched_hill_climbing, batched_simulated_annealing, exponential_schedule, linear_schedule, logarithmic_schedule)
+
+SCHEDULES = {
+    'exponential': lambda: exponential_schedule(),
+    'slow': lambda: exponential_schedule(cooling_rate=0.999),
+    'linear': lambda: linear_schedule(steps=5000),
+    'logarithmic': lambda: logarithmic_schedule(),
+}
+
+
+def configurations(walker_counts, schedules, max_steps):
+    """Yields (name, search) pairs, where search(grid, start, goal, seed) returns a path or None."""
+    def single(search):
+        def run(grid, start, goal, seed):
+            random.seed(seed)
+            return search(start, goal, grid, set(), len(grid))
+        return run
+
+    yield 'hill_climbing', single(hill_climbing)
+    yield 'simulated_annealing', single(simulated_annealing)
+    for walkers in walker_counts:
+        yield f'batched_hill_climbing x{walkers}', lambda grid, start, goal, seed, walkers=walkers: \
+            batched_hill_climbing(start, goal, grid, set(), len(grid), walkers=walkers, seed=seed)
+        for schedule in schedules:
+            yield f'batched_simulated_annealing x{walkers} {schedule}', \
+                lambda grid, start, goal, seed, walkers=walkers, schedule=schedule: batched_simulated_annealing(
+                    start, goal, grid, set(), len(grid), walkers=walkers, schedule=SCHEDULES[schedule](),
+                    max_steps=max_steps, seed=seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batched local search benchmark')
+    parser.add_argument('--environments', nargs='+', default=['grid', 'maze'], choices=['grid', 'maze'],
+                        help='Scenario types (default: grid maze)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 51, 101],
+                        help='Grid sizes (default: 25 51 101)')
+    parser.add_argument('--walkers', type=int, nargs='+', default=[64, 1024],
+                        help='Walker counts for the batched searches (default: 64 1024)')
+    parser.add_argument('--schedules', nargs='+', default=['exponential', 'slow'], choices=sorted(SCHEDULES),
+                        help='Cooling schedules for batched simulated annealing (default: exponential slow)')
+    parser.add_argument('--max_steps', type=int, default=20000,
+                        help='Step limit for batched simulated annealing (default: 20000)')
+    parser.add_argument('--seeds', type=int, default=5, help='Scenarios per size (default: 5)')
+    args = parser.parse_args()
+
+    print(f"{'environment':<12}{'size':>6}  {'algorithm':<48}{'success':>9}{'mean ms':>10}{'mean path':>11}")
+    for environment in args.environments:
+        for size in args.sizes:
+            scenarios = [make_scenario(environment, size, seed) for seed in range(args.seeds)]
+            for name, search in configurations(args.walkers, args.schedules, args.max_steps):
+                solved = 0
+                seconds = 0.0
+                lengths = []
+                for seed, (grid, start, goal) in enumerate(scenarios):
+                    t0 = time.perf_counter()
+                    path = search(grid, start, goal, seed)
+                    seconds += time.perf_counter() - t0
+                    if path and path[-1] == goal:
+                        solved += 1
+                        lengths.append(len(path))
+                mean_length = f'{sum(lengths) / len(lengths):.1f}' if lengths else '-'
+                print(f"{environment:<12}{size:>6}  {name:<48}{f'{solved}/{args.seeds}':>9}"
+                      f"{seconds / args.seeds * 1000:>10.1f}{mean_length:>11}")
+
+
+if __name__ == "__main__":
+    main()
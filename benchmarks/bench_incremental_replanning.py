@@ -0,0 +1,86 @@
+# benchmarks/bench_incremental_replanning.py
+
+"""
+Compares replanning from scratch against the D* Lite planner when grid
+cells change while a RobotAgent is moving.
+
+A robot walks from the top-left corner to a task in the far corner of a
+seeded GridEnvironment. After every step a few random cells are toggled
+between free and blocked, and the agent is told through update_cells().
+Both algorithms see exactly the same sequence of toggles.
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.agents.robot_agent import RobotAgent
+
+
+def run(algorithm, size, toggles, max_steps, seed):
+    """Returns (reached, steps, initial planning seconds, total update seconds, updates, planner vertex updates)."""
+    env = GridEnvironment(size, num_tasks=0, seed=seed)
+    grid = env.get_grid()
+    start, task = env.get_start_position(), (size - 1, size - 1)
+    grid[task[1]][task[0]] = 0
+    rng = random.Random(seed)
+
+    agent = RobotAgent(start, [task], algorithm=algorithm)
+    t0 = time.perf_counter()
+    agent.find_initial_path(grid)
+    initial_time = time.perf_counter() - t0
+
+    update_time = 0.0
+    updates = 0
+    steps = 0
+    while steps < max_steps and task not in agent.completed_tasks:
+        agent.move()
+        steps += 1
+        changed = []
+        while len(changed) < toggles:
+            cell = (rng.randrange(size), rng.randrange(size))
+            if cell != agent.position and cell != task and cell not in changed:
+                grid[cell[1]][cell[0]] ^= 1
+                changed.append(cell)
+        t0 = time.perf_counter()
+        agent.update_cells(changed)
+        update_time += time.perf_counter() - t0
+        updates += 1
+
+    vertex_updates = agent.planner.vertex_updates if agent.planner is not None else None
+    return task in agent.completed_tasks, steps, initial_time, update_time, updates, vertex_updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental replanning benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200],
+                        help='Grid sizes (default: 50 100 200)')
+    parser.add_argument('--toggles', type=int, default=3, help='Cells toggled after every step (default: 3)')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=['astar', 'dstar'],
+                        help='Algorithms to compare (default: astar dstar)')
+    parser.add_argument('--max_steps', type=int, default=2000, help='Step limit per run (default: 2000)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'size':>6}  {'algorithm':<10}{'reached':>8}{'steps':>7}{'plan ms':>10}"
+          f"{'update ms':>11}{'ms/update':>11}{'vertex updates':>16}")
+    for size in args.sizes:
+        for algorithm in args.algorithms:
+            reached, steps, initial_time, update_time, updates, vertex_updates = run(
+                algorithm, size, args.toggles, args.max_steps, args.seed)
+            per_update = update_time / updates * 1000 if updates else 0.0
+            print(f"{size:>6}  {algorithm:<10}{str(reached):>8}{steps:>7}{initial_time * 1000:>10.1f}"
+                  f"{update_time * 1000:>11.1f}{per_update:>11.3f}"
+                  f"{vertex_updates if vertex_updates is not None else '-':>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_island_ga.py
+
+"""
+Measures the speedup of the island-model genetic algorithm against core count.
+
+Every run evolves the same number of islands for the same seed and spreads
+them over a different number of worker processes (1 runs them all in this
+process). A run stops when an island solves the board or after
+--max_generations. Island generations per second is the throughput that
+extra cores raise, and time to solution is what a user waits.
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.search_algorithms.island_ga import run_islands
+from modules.search_algorithms.queens import max_fitness
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Island-model genetic algorithm speedup benchmark')
+    parser.add_argument('--n', type=int, default=16, help='Number of queens (default: 16)')
+    parser.add_argument('--islands', type=int, default=8, help='Number of islands (default: 8)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker process counts (default: 1 2 4 8)')
+    parser.add_argument('--population_size', type=int, default=100, help='Individuals per island (default: 100)')
+    parser.add_argument('--migration_interval', type=int, default=10,
+                        help='Generations between migrations (default: 10)')
+    parser.add_argument('--migrants', type=int, default=2, help='Individuals sent per migration (default: 2)')
+    parser.add_argument('--max_generations', type=int, default=500, help='Generation limit (default: 500)')
+    parser.add_argument('--seeds', type=int, default=3, help='Runs per worker count (default: 3)')
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'solved':>8}{'mean s':>9}{'island gen/s':>14}{'speedup':>9}")
+    baseline = None
+    for workers in args.workers:
+        solved = 0
+        seconds = island_generations = 0.0
+        for seed in range(args.seeds):
+            t0 = time.perf_counter()
+            _, fitness, _, generation = run_islands(
+                n=args.n, islands=args.islands, workers=workers, population_size=args.population_size,
+                migration_interval=args.migration_interval, migrants=args.migrants,
+                max_generations=args.max_generations, seed=seed)
+            seconds += time.perf_counter() - t0
+            island_generations += generation * args.islands
+            solved += fitness == max_fitness(args.n)
+        throughput = island_generations / seconds if seconds else 0.0
+        baseline = baseline or throughput
+        print(f"{workers:>8}{f'{solved}/{args.seeds}':>8}{seconds / args.seeds:>9.2f}{throughput:>14.0f}"
+              f"{throughput / baseline if baseline else 0.0:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
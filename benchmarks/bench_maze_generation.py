@@ -0,0 +1,54 @@
+# benchmarks/bench_maze_generation.py
+
+"""
+Measures MazeEnvironment generation time and peak traced memory against maze size.
+"""
+
+import sys
+import os
+import time
+import argparse
+import tracemalloc
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.environments.maze_environment import MazeEnvironment
+
+
+def measure(size, complexity, density, seed):
+    """Generates one size x size maze and returns (seconds, peak_bytes)."""
+    t0 = time.perf_counter()
+    MazeEnvironment(size, size, complexity=complexity, density=density, seed=seed)
+    elapsed = time.perf_counter() - t0
+    # Separate run so tracemalloc's overhead does not distort the timing
+    tracemalloc.start()
+    MazeEnvironment(size, size, complexity=complexity, density=density, seed=seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Maze generation benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[101, 251, 501, 1001, 2001],
+                        help='Maze sizes to generate (odd numbers, default: 101 251 501 1001 2001)')
+    parser.add_argument('--complexity', type=float, default=0.75,
+                        help='Maze complexity (0.0 to 1.0, default: 0.75)')
+    parser.add_argument('--density', type=float, default=0.75,
+                        help='Maze density (0.0 to 1.0, default: 0.75)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'size':>6}{'cells':>12}{'seconds':>10}{'peak MiB':>10}")
+    for size in args.sizes:
+        if size % 2 == 0:
+            size += 1
+        elapsed, peak = measure(size, args.complexity, args.density, args.seed)
+        print(f"{size:>6}{size * size:>12}{elapsed:>10.2f}{peak / (1024 * 1024):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_multi_agent.py
+
+"""
+Measures how a RobotFleet scales with the number of robots.
+
+Every run builds a seeded GridEnvironment sized so that the robots cover
+about the same share of its cells, deals each robot its own tasks and
+advances the fleet for a fixed number of steps (or until every task is
+done). Planning time is the time spent in cooperative A*; steps/sec counts
+whole fleet steps, planning included. Conflicts should always be 0.
+"""
+
+import sys
+import os
+import math
+import time
+import argparse
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.agents.robot_fleet import RobotFleet
+
+
+def run(num_agents, tasks_per_agent, density, max_steps, seed):
+    """Returns (grid size, steps, seconds, fleet) for one run."""
+    # 20% of the cells are obstacles, so the robots take about density of the free ones
+    size = max(16, math.ceil(math.sqrt(num_agents / (density * 0.8))))
+    env = GridEnvironment(size, num_tasks=num_agents * tasks_per_agent, seed=seed)
+    fleet = RobotFleet.from_environment(env, num_agents, seed=seed)
+    steps = 0
+    t0 = time.perf_counter()
+    while steps < max_steps and fleet.step():
+        steps += 1
+    return size, steps, time.perf_counter() - t0, fleet
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Multi-agent fleet scaling benchmark')
+    parser.add_argument('--agents', type=int, nargs='+', default=[10, 50, 100, 500, 1000],
+                        help='Robot counts (default: 10 50 100 500 1000)')
+    parser.add_argument('--tasks_per_agent', type=int, default=2, help='Tasks dealt to each robot (default: 2)')
+    parser.add_argument('--density', type=float, default=0.04,
+                        help='Share of the free cells occupied by robots (default: 0.04)')
+    parser.add_argument('--max_steps', type=int, default=200, help='Step limit per run (default: 200)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'agents':>7}{'size':>6}{'steps':>7}{'steps/s':>9}{'plan s':>8}{'plan %':>8}"
+          f"{'plans':>7}{'failed':>8}{'tasks':>11}{'conflicts':>11}")
+    for num_agents in args.agents:
+        size, steps, seconds, fleet = run(num_agents, args.tasks_per_agent, args.density,
+                                          args.max_steps, args.seed)
+        tasks = f"{fleet.tasks_completed()}/{num_agents * args.tasks_per_agent}"
+        print(f"{num_agents:>7}{size:>6}{steps:>7}{steps / seconds if seconds else 0.0:>9.1f}"
+              f"{fleet.planning_time:>8.2f}{fleet.planning_time / seconds * 100 if seconds else 0.0:>8.1f}"
+              f"{fleet.plans:>7}{fleet.failed_plans:>8}{tasks:>11}{fleet.conflicts:>11}")
+
+
+if __name__ == "__main__":
+    main()
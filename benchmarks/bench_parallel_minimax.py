@@ -0,0 +1,74 @@
+# benchmarks/bench_parallel_minimax.py
+
+"""
+Speedup of the root-split parallel search against worker count.
+
+Each reference Connect-Four position is played on for --moves moves by a
+headless AdversarialSimulation, once with the serial engine and once per
+worker count with ParallelSearch. Every move is searched to --depth with
+no time budget, so all runs do the same work. The merge is deterministic,
+so every worker count must play the same moves; the last column checks it.
+Speedup is the serial search time over the parallel one.
+"""
+
+import sys
+import os
+import argparse
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+# No window is opened, so the dummy video driver is enough
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from modules.simulations.adversarial_simulation import AdversarialSimulation
+from modules.adversarial_search.games import REFERENCE_POSITIONS
+from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
+
+
+def play(screen, position, depth, moves, workers):
+    """Returns (search seconds, nodes, moves played) of one headless run."""
+    sim = AdversarialSimulation(screen, position=position, time_budget=None, max_depth=depth, workers=workers,
+                                steps_per_second=0)
+    try:
+        sim.run_headless(max_steps=moves)
+    finally:
+        sim.close()
+    return sim.search_time, sim.total_nodes, sim.move_string()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parallel root-split search speedup benchmark')
+    parser.add_argument('--positions', nargs='+', default=list(REFERENCE_POSITIONS),
+                        choices=list(REFERENCE_POSITIONS), help='Connect-Four reference positions (default: all)')
+    parser.add_argument('--depth', type=int, default=9, help='Search depth of every move (default: 9)')
+    parser.add_argument('--moves', type=int, default=4, help='Moves played from each position (default: 4)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker process counts (default: 1 2 4 8)')
+    args = parser.parse_args()
+
+    pygame.init()
+    # An off-screen Surface stands in for the window
+    screen = pygame.Surface((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT))
+
+    print(f"{'position':<12}{'engine':<12}{'search s':>10}{'nodes':>10}{'kN/s':>8}{'speedup':>9}  {'moves':<10}"
+          f"{'same moves':>10}")
+    for name in args.positions:
+        position = REFERENCE_POSITIONS[name]
+        baseline, nodes, serial_moves = play(screen, position, args.depth, args.moves, None)
+        print(f"{name:<12}{'serial':<12}{baseline:>10.2f}{nodes:>10}{nodes / baseline / 1000:>8.1f}{1.0:>9.2f}"
+              f"  {serial_moves:<10}{'-':>10}")
+        parallel_moves = None
+        for workers in args.workers:
+            seconds, nodes, moves = play(screen, position, args.depth, args.moves, workers)
+            parallel_moves = parallel_moves or moves
+            print(f"{name:<12}{f'workers={workers}':<12}{seconds:>10.2f}{nodes:>10}{nodes / seconds / 1000:>8.1f}"
+                  f"{baseline / seconds:>9.2f}  {moves:<10}{'yes' if moves == parallel_moves else 'NO':>10}")
+
+
+if __name__ == "__main__":
+    main()
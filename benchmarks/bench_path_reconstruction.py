@@ -0,0 +1,162 @@
+# benchmarks/bench_path_reconstruction.py
+
+"""
+Compares the parent-pointer searches in modules.search_algorithms against the
+previous implementations, which carried a full copy of the path in every
+frontier entry. Reports wall-clock time and peak traced memory per run.
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import tracemalloc
+import heapq
+from collections import deque
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.environments.maze_environment import MazeEnvironment
+from modules.search_algorithms.uninformed_search import dfs, bfs, ucs, get_neighbors
+from modules.search_algorithms.informed_search import astar, heuristic
+
+
+# Path-copying reference implementations, kept only for comparison
+
+def legacy_dfs(start, goal, grid, blocked_positions, grid_size):
+    stack = [(start, [start])]
+    visited = set()
+    while stack:
+        (vertex, path) = stack.pop()
+        if vertex not in visited:
+            if vertex in blocked_positions:
+                continue
+            visited.add(vertex)
+            if vertex == goal:
+                return path
+            for neighbor in get_neighbors(vertex, grid, blocked_positions, grid_size):
+                stack.append((neighbor, path + [neighbor]))
+    return None
+
+
+def legacy_bfs(start, goal, grid, blocked_positions, grid_size):
+    queue = deque([(start, [start])])
+    visited = set([start])
+    while queue:
+        (vertex, path) = queue.popleft()
+        if vertex == goal:
+            return path
+        for neighbor in get_neighbors(vertex, grid, blocked_positions, grid_size):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, path + [neighbor]))
+    return None
+
+
+def legacy_ucs(start, goal, grid, blocked_positions, grid_size):
+    queue = [(0, start, [start])]
+    visited = set()
+    while queue:
+        (cost, vertex, path) = heapq.heappop(queue)
+        if vertex not in visited:
+            if vertex in blocked_positions:
+                continue
+            visited.add(vertex)
+            if vertex == goal:
+                return path
+            for neighbor in get_neighbors(vertex, grid, blocked_positions, grid_size):
+                heapq.heappush(queue, (cost + 1, neighbor, path + [neighbor]))
+    return None
+
+
+def legacy_astar(start, goal, grid, blocked_positions, grid_size):
+    open_set = [(0, start, [start])]
+    g_scores = {start: 0}
+    while open_set:
+        (_, current, path) = heapq.heappop(open_set)
+        if current == goal:
+            return path
+        for neighbor in get_neighbors(current, grid, blocked_positions, grid_size):
+            tentative_g_score = g_scores[current] + 1
+            if neighbor not in g_scores or tentative_g_score < g_scores[neighbor]:
+                g_scores[neighbor] = tentative_g_score
+                f_score = tentative_g_score + heuristic(neighbor, goal)
+                heapq.heappush(open_set, (f_score, neighbor, path + [neighbor]))
+    return None
+
+
+ALGORITHMS = {
+    'dfs': (legacy_dfs, dfs),
+    'bfs': (legacy_bfs, bfs),
+    'ucs': (legacy_ucs, ucs),
+    'astar': (legacy_astar, astar),
+}
+
+
+def measure(search, start, goal, grid, grid_size):
+    """Runs one search and returns (path, seconds, peak_bytes).
+
+    Timing and memory are taken from separate runs so that tracemalloc's
+    per-allocation overhead does not distort the wall-clock figure.
+    """
+    t0 = time.perf_counter()
+    path = search(start, goal, grid, set(), grid_size)
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    search(start, goal, grid, set(), grid_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return path, elapsed, peak
+
+
+def open_grid_case(size, seed):
+    random.seed(seed)
+    env = GridEnvironment(size, num_tasks=0)
+    grid = env.get_grid()
+    goal = (size - 1, size - 1)
+    grid[goal[1]][goal[0]] = 0
+    return 'grid', size, env.get_start_position(), goal, grid
+
+
+def maze_case(size, seed):
+    env = MazeEnvironment(size, size, seed=seed)
+    return 'maze', size, (1, 0), (size - 2, size - 1), env.get_grid()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Path-copy vs parent-pointer search benchmark')
+    parser.add_argument('--grid_sizes', type=int, nargs='+', default=[100, 200],
+                        help='Sizes of the open GridEnvironment instances (default: 100 200)')
+    parser.add_argument('--maze_sizes', type=int, nargs='+', default=[101, 201],
+                        help='Sizes of the MazeEnvironment instances (odd numbers, default: 101 201)')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS), help='Algorithms to benchmark (default: all)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    cases = [open_grid_case(size, args.seed) for size in args.grid_sizes]
+    cases += [maze_case(size, args.seed) for size in args.maze_sizes]
+
+    print(f"{'env':<6}{'size':>6}  {'algorithm':<8}{'length':>8}"
+          f"{'old ms':>10}{'new ms':>10}{'old KiB':>12}{'new KiB':>12}")
+    for env_name, size, start, goal, grid in cases:
+        for name in args.algorithms:
+            legacy, current = ALGORITHMS[name]
+            old_path, old_time, old_peak = measure(legacy, start, goal, grid, len(grid))
+            new_path, new_time, new_peak = measure(current, start, goal, grid, len(grid))
+            if (old_path is None) != (new_path is None) or (
+                    name != 'dfs' and old_path and len(old_path) != len(new_path)):
+                raise AssertionError(f"{name} returned a different result on {env_name} {size}")
+            length = len(new_path) if new_path else '-'
+            print(f"{env_name:<6}{size:>6}  {name:<8}{length:>8}"
+                  f"{old_time * 1000:>10.1f}{new_time * 1000:>10.1f}"
+                  f"{old_peak / 1024:>12.0f}{new_peak / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/bench_queens.py
+
+"""
+Compares min-conflicts with the genetic algorithm on N-Queens.
+
+For each small board size both solvers run once per seed: the GA is
+QueensPopulation, the engine behind examples/main_8_queen.py, and stops
+after --max_generations. Min-conflicts can stall on small boards, so it
+restarts with a new seed after every --max_steps repair swaps.
+Large boards are solved by min-conflicts alone, and a second traced run
+records their peak memory with tracemalloc. The last table solves the largest board with
+parallel_min_conflicts on an increasing number of worker processes.
+"""
+
+import sys
+import os
+import time
+import argparse
+import tracemalloc
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.search_algorithms.genetic_algorithm import QueensPopulation
+from modules.search_algorithms.min_conflicts import min_conflicts, parallel_min_conflicts
+
+
+def run_ga(n, population_size, max_generations, seed):
+    """Returns (solved, seconds, generations)."""
+    t0 = time.perf_counter()
+    population = QueensPopulation(n, size=population_size, seed=seed)
+    solved = population.evolve(max_generations)
+    return solved, time.perf_counter() - t0, population.generation
+
+
+def run_min_conflicts(n, seed):
+    """Returns (solved, seconds, repair steps) for a single run without a step limit."""
+    t0 = time.perf_counter()
+    _, steps = min_conflicts(n, seed=seed)
+    return True, time.perf_counter() - t0, steps
+
+
+def run_restarts(n, max_steps, seed, restarts=1000):
+    """Returns (solved, seconds, restarts used) for min-conflicts restarted every max_steps repair swaps."""
+    first_seed = seed * restarts  # Keeps the restart seeds of different runs apart
+    t0 = time.perf_counter()
+    result = parallel_min_conflicts(n, restarts=restarts, workers=1, seed=first_seed, max_steps=max_steps)
+    seconds = time.perf_counter() - t0
+    if result is None:
+        return False, seconds, restarts
+    return True, seconds, result[1] - first_seed + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='N-Queens min-conflicts vs genetic algorithm benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[8, 16, 32, 64],
+                        help='Board sizes solved by both (default: 8 16 32 64)')
+    parser.add_argument('--large_sizes', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Board sizes solved by min-conflicts only (default: 10000 100000 1000000)')
+    parser.add_argument('--seeds', type=int, default=5, help='Runs per solver and size (default: 5)')
+    parser.add_argument('--population_size', type=int, default=1000, help='GA population size (default: 1000)')
+    parser.add_argument('--max_generations', type=int, default=1000, help='GA generation limit (default: 1000)')
+    parser.add_argument('--max_steps', type=int, default=500,
+                        help='Min-conflicts repair swaps per restart on small boards (default: 500)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4],
+                        help='Worker counts for the parallel runs (default: 1 2 4)')
+    parser.add_argument('--no_memory', action='store_true', help='Skip tracing peak memory on the large boards')
+    args = parser.parse_args()
+
+    print(f"{'n':>6}{'solver':>16}{'solved':>8}{'mean s':>9}{'mean work':>11}")
+    for n in args.sizes:
+        for name in ('genetic', 'min_conflicts'):
+            runs = []
+            for seed in range(args.seeds):
+                if name == 'genetic':
+                    runs.append(run_ga(n, args.population_size, args.max_generations, seed))
+                else:
+                    runs.append(run_restarts(n, args.max_steps, seed))
+            solved = sum(run[0] for run in runs)
+            print(f"{n:>6}{name:>16}{f'{solved}/{len(runs)}':>8}{sum(run[1] for run in runs) / len(runs):>9.3f}"
+                  f"{sum(run[2] for run in runs) / len(runs):>11.0f}")
+    print("(work is generations for the GA and restarts for min-conflicts)")
+
+    print()
+    print(f"{'n':>9}{'seconds':>9}{'steps':>8}{'peak MB':>9}")
+    for n in args.large_sizes:
+        solved, seconds, steps = run_min_conflicts(n, 0)
+        peak = float('nan')
+        if not args.no_memory:
+            # A separate traced run, since tracing slows the solver down several times
+            tracemalloc.start()
+            run_min_conflicts(n, 0)
+            peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.stop()
+        print(f"{n:>9}{seconds:>9.2f}{steps:>8}{peak:>9.1f}")
+
+    n = max(args.large_sizes)
+    print()
+    print(f"{'n':>9}{'workers':>9}{'seconds':>9}{'seed':>6}{'speedup':>9}")
+    baseline = None
+    for workers in args.workers:
+        t0 = time.perf_counter()
+        _, seed, _ = parallel_min_conflicts(n, workers=workers)
+        seconds = time.perf_counter() - t0
+        baseline = baseline or seconds
+        print(f"{n:>9}{workers:>9}{seconds:>9.2f}{seed:>6}{baseline / seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
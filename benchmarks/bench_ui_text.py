@@ -0,0 +1,92 @@
+# benchmarks/bench_ui_text.py
+
+"""
+Measures per-frame CPU time of the simulation side panel with and without
+the shared font and text caches, plus the cost of a full MazeSimulation frame.
+Runs headless through SDL's dummy video driver.
+"""
+
+import sys
+import os
+import time
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import pygame
+
+from modules.simulations.maze_simulation import MazeSimulation
+from modules.utils.text_cache import font_cache, text_cache, get_font, render_text
+from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, BLACK
+
+FONT_SIZE = 20
+
+
+def panel_labels(frame):
+    """The strings draw_ui shows on one frame of a moving agent."""
+    return ["Agent Status", f"Position: ({frame % 21}, {frame // 21 % 21})", "Status: Moving",
+            f"Path Length: {frame % 120}", "Algorithm: ASTAR", "Start", "Reset"]
+
+
+def legacy_frame(screen, frame):
+    """Rebuilds the three fonts with SysFont and renders every label, as update()/draw_ui() used to."""
+    font_small = pygame.font.SysFont(None, FONT_SIZE)
+    pygame.font.SysFont(None, int(FONT_SIZE * 1.2))
+    pygame.font.SysFont(None, int(FONT_SIZE * 1.5))
+    for i, label in enumerate(panel_labels(frame)):
+        screen.blit(font_small.render(label, True, BLACK), (10, 10 + i * FONT_SIZE))
+
+
+def cached_frame(screen, frame):
+    font_small = get_font(None, FONT_SIZE)
+    for i, label in enumerate(panel_labels(frame)):
+        screen.blit(render_text(label, font_small, BLACK), (10, 10 + i * FONT_SIZE))
+
+
+def cpu_per_frame(draw_frame, frames):
+    t0 = time.process_time()
+    for frame in range(frames):
+        draw_frame(frame)
+    return (time.process_time() - t0) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description='UI font and text cache benchmark')
+    parser.add_argument('--frames', type=int, default=500, help='Frames to time per variant (default: 500)')
+    parser.add_argument('--maze_size', type=int, default=41, help='Maze width and height (default: 41)')
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT))
+
+    legacy = cpu_per_frame(lambda frame: legacy_frame(screen, frame), args.frames)
+    cached = cpu_per_frame(lambda frame: cached_frame(screen, frame), args.frames)
+
+    simulation = MazeSimulation(screen, algorithm='astar', maze_width=args.maze_size,
+                                maze_height=args.maze_size)
+    simulation.agent.find_path(simulation.grid)
+    simulation.animation_started = bool(simulation.agent.path)
+
+    def simulation_frame(frame):
+        simulation.update()
+        simulation.draw()
+
+    full = cpu_per_frame(simulation_frame, args.frames)
+    pygame.quit()
+
+    print(f"{'variant':<24}{'ms/frame':>10}")
+    print(f"{'panel, uncached':<24}{legacy * 1000:>10.3f}")
+    print(f"{'panel, cached':<24}{cached * 1000:>10.3f}")
+    print(f"{'maze simulation frame':<24}{full * 1000:>10.3f}")
+    print(f"panel CPU saved per frame: {(legacy - cached) * 1000:.3f} ms")
+    print(f"font cache: {font_cache.stats()}")
+    print(f"text cache: {text_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
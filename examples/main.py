@@ -8,30 +8,66 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
+import time
 import pygame
 import argparse
 from modules.simulations.search_simulation import SearchSimulation
+from modules.simulations.frame_capture import FrameWriter
 from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
 
 def main():
     parser = argparse.ArgumentParser(description='Robot Task Simulation (Task Order Based)')
     parser.add_argument('--algorithm', type=str, default='astar',
-                        choices=['dfs', 'bfs', 'ucs', 'astar'],
+                        choices=['dfs', 'bfs', 'ucs', 'astar', 'bibfs', 'biastar', 'jps', 'dstar'],
                         help='Search algorithm to use (default: astar)')
     parser.add_argument('--grid_size', type=int, default=16, help='Size of the grid (default: 16)')
     parser.add_argument('--num_tasks', type=int, default=5, help='Number of tasks (default: 5)')
+    parser.add_argument('--plan_tour', action='store_true',
+                        help='Plan the shortest task tour over true path distances before moving')
+    parser.add_argument('--steps_per_second', type=float, default=5,
+                        help='Agent steps per second; 0 runs as fast as possible (default: 5)')
+    parser.add_argument('--render_every', type=int, default=1,
+                        help='Redraw the window once every N agent steps (default: 1)')
+    parser.add_argument('--expansions_per_frame', type=int, default=64,
+                        help='Search expansions animated per frame; 0 finds the path at once (default: 64)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Run the simulation to completion without a window and print the result')
+    parser.add_argument('--capture', type=str, default=None,
+                        help='Record frames to a PNG directory, or to a video file (.mp4, .mkv, ...) if ffmpeg is installed')
+    parser.add_argument('--capture_fps', type=int, default=30, help='Frame rate of a captured video (default: 30)')
     args = parser.parse_args()
 
     algorithm = args.algorithm
     grid_size = args.grid_size
     num_tasks = args.num_tasks
 
+    if args.headless:
+        # No window is opened, so the dummy video driver is enough
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
     pygame.init()
-    screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
-    pygame.display.set_caption("Robot Task Simulation (Task Order Based)")
+    if args.headless:
+        # An off-screen Surface stands in for the window; it is only drawn to when capturing
+        screen = pygame.Surface((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT))
+    else:
+        screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
+        pygame.display.set_caption("Robot Task Simulation (Task Order Based)")
 
-    sim = SearchSimulation(screen, algorithm=algorithm, grid_size=grid_size, num_tasks=num_tasks)
-    sim.run()
+    sim = SearchSimulation(screen, algorithm=algorithm, grid_size=grid_size, num_tasks=num_tasks,
+                           plan_tour=args.plan_tour, steps_per_second=args.steps_per_second,
+                           render_every=args.render_every,
+                           expansions_per_frame=args.expansions_per_frame)
+    if args.capture:
+        sim.capture = FrameWriter(args.capture, fps=args.capture_fps)
+    if args.headless:
+        t0 = time.perf_counter()
+        steps = sim.run_headless()
+        print(f"{steps} steps ({len(sim.agent.path_traveled)} moves), "
+              f"{len(sim.agent.completed_tasks)}/{len(sim.tasks)} tasks completed in {time.perf_counter() - t0:.3f} s")
+    else:
+        sim.run()
+    if sim.capture is not None:
+        sim.capture.close()
+        print(f"Frames captured: {sim.capture.stats()}")
 
 if __name__ == "__main__":
     main()
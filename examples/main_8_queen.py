@@ -13,12 +13,14 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 from modules.search_algorithms import local_search
+from modules.search_algorithms.genetic_algorithm import QueensPopulation
+from modules.search_algorithms.queens import max_fitness
+from modules.utils.text_cache import get_font, render_text
 
 # Constants for Pygame visualization
 WINDOW_SIZE = 400
 INFO_WIDTH = 200
 TOTAL_WIDTH = WINDOW_SIZE + INFO_WIDTH
-CELL_SIZE = WINDOW_SIZE // 8
 LIGHT_GRAY = (211, 211, 211)
 DARK_BLUE = (30, 144, 255)
 PURPLE = (138, 43, 226)
@@ -28,18 +30,23 @@ FONT_COLOR = (50, 50, 50)
 
 def draw_board(screen, font, individual):
     """Draws the chessboard and the queens."""
-    for y in range(8):
-        for x in range(8):
-            rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+    n = len(individual)
+    cell_size = max(1, WINDOW_SIZE // n)
+    for y in range(n):
+        for x in range(n):
+            rect = pygame.Rect(x * cell_size, y * cell_size, cell_size, cell_size)
             color = LIGHT_GRAY if (x + y) % 2 == 0 else DARK_BLUE
             pygame.draw.rect(screen, color, rect)
 
-            # Draw the queens
+            # Draw the queens, as labels while they still fit in a cell
             if individual[x] == y:
-                queen_text = f"Q{x + 1}"
-                text_surface = font.render(queen_text, True, PURPLE)
-                text_rect = text_surface.get_rect(center=rect.center)
-                screen.blit(text_surface, text_rect)
+                if cell_size >= 32:
+                    queen_text = f"Q{x + 1}"
+                    text_surface = render_text(queen_text, font, PURPLE)
+                    text_rect = text_surface.get_rect(center=rect.center)
+                    screen.blit(text_surface, text_rect)
+                else:
+                    pygame.draw.rect(screen, PURPLE, rect)
 
 def draw_info_panel(screen, font, generation, individual, max_generations):
     """Draws the information panel showing the generation and queens' status."""
@@ -48,19 +55,19 @@ def draw_info_panel(screen, font, generation, individual, max_generations):
     
     # Draw generation number
     generation_text = f"Generation: {generation}/{max_generations}"
-    generation_surface = font.render(generation_text, True, WHITE)
+    generation_surface = render_text(generation_text, font, WHITE)
     screen.blit(generation_surface, (WINDOW_SIZE + 10, 10))
 
     # Draw fitness score
     fitness_score = local_search.fitness(individual)
-    fitness_text = f"Fitness: {fitness_score}/28"
-    fitness_surface = font.render(fitness_text, True, WHITE)
+    fitness_text = f"Fitness: {fitness_score}/{max_fitness(len(individual))}"
+    fitness_surface = render_text(fitness_text, font, WHITE)
     screen.blit(fitness_surface, (WINDOW_SIZE + 10, 40))
 
-    # Draw queens' positions
-    for i, pos in enumerate(individual):
+    # Draw queens' positions, as many as fit in the panel
+    for i, pos in enumerate(individual[:(WINDOW_SIZE - 70) // 30]):
         queen_text = f"Q{i + 1}: Row {pos + 1}"
-        queen_surface = font.render(queen_text, True, WHITE)
+        queen_surface = render_text(queen_text, font, WHITE)
         screen.blit(queen_surface, (WINDOW_SIZE + 10, 70 + i * 30))
 
 def main():
@@ -68,6 +75,9 @@ def main():
     parser = argparse.ArgumentParser(description='8-Queens Genetic Algorithm Simulation')
     parser.add_argument('--max_generations', type=int, default=1000, help='Maximum number of generations')
     parser.add_argument('--delay', type=float, default=0.1, help='Delay between generations in seconds')
+    parser.add_argument('--n', type=int, default=8, help='Number of queens (default: 8)')
+    parser.add_argument('--population_size', type=int, default=local_search.POPULATION_SIZE,
+                        help=f'Individuals per generation (default: {local_search.POPULATION_SIZE})')
     args = parser.parse_args()
 
     MAX_GENERATIONS = args.max_generations
@@ -76,12 +86,16 @@ def main():
     # Initialize Pygame
     pygame.init()
     screen = pygame.display.set_mode((TOTAL_WIDTH, WINDOW_SIZE))
-    pygame.display.set_caption("8-Queens Genetic Algorithm")
+    pygame.display.set_caption(f"{args.n}-Queens Genetic Algorithm")
     clock = pygame.time.Clock()
-    font = pygame.font.Font(None, 24)
+    font = get_font(None, 24)
 
-    # Genetic Algorithm parameters
-    population = [local_search.generate_individual() for _ in range(local_search.POPULATION_SIZE)]
+    # The NumPy engine evolves the whole population at once; without NumPy the list functions do it
+    if local_search.np is not None:
+        engine = QueensPopulation(args.n, size=args.population_size)
+    else:
+        engine = None
+        population = [local_search.generate_individual(args.n) for _ in range(args.population_size)]
     generation = 0
     running = True
     solution_found = False
@@ -92,26 +106,32 @@ def main():
             if event.type == pygame.QUIT:
                 running = False
 
-        # Select the best individuals
-        population = local_search.select_population(population)
+        if engine is not None:
+            best_individual, best_fitness = engine.best()
+        else:
+            # Select the best individuals
+            population = local_search.select_population(population, args.population_size)
+            best_individual = population[0]
+            best_fitness = local_search.fitness(best_individual)
 
         # Check for a solution
-        best_individual = population[0]
-        if local_search.fitness(best_individual) == 28:
+        if best_fitness == max_fitness(args.n):
             print(f"Solution found in generation {generation}: {best_individual}")
             solution_found = True
             running = False  # Exit the loop when solution is found
 
         # Generate next generation
-        next_generation = []
-        while len(next_generation) < local_search.POPULATION_SIZE:
-            parent1 = random.choice(population)
-            parent2 = random.choice(population)
-            child = local_search.crossover(parent1, parent2)
-            local_search.mutate(child)
-            next_generation.append(child)
-
-        population = next_generation
+        if engine is not None:
+            engine.step()
+        else:
+            next_generation = []
+            while len(next_generation) < args.population_size:
+                parent1 = random.choice(population)
+                parent2 = random.choice(population)
+                child = local_search.crossover(parent1, parent2)
+                local_search.mutate(child)
+                next_generation.append(child)
+            population = next_generation
         generation += 1
 
         # Draw the best individual (visualize the board and info panel)
@@ -140,8 +160,8 @@ def main():
     else:
         # Display no solution message
         screen.fill(WHITE)
-        font_large = pygame.font.Font(None, 36)
-        text_surface = font_large.render("No solution found!", True, FONT_COLOR)
+        font_large = get_font(None, 36)
+        text_surface = render_text("No solution found!", font_large, FONT_COLOR)
         text_rect = text_surface.get_rect(center=(TOTAL_WIDTH // 2, WINDOW_SIZE // 2))
         screen.blit(text_surface, text_rect)
         pygame.display.flip()
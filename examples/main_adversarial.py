@@ -0,0 +1,74 @@
+# examples/main_adversarial.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import time
+import pygame
+import argparse
+from modules.simulations.adversarial_simulation import AdversarialSimulation
+from modules.simulations.frame_capture import FrameWriter
+from modules.adversarial_search.games import GAMES, REFERENCE_POSITIONS
+from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
+
+def main():
+    parser = argparse.ArgumentParser(description='Adversarial Search Simulation (Alpha-Beta Self-Play)')
+    parser.add_argument('--game', type=str, default='connect4', choices=sorted(GAMES),
+                        help='Game to play (default: connect4)')
+    parser.add_argument('--position', type=str, default='',
+                        help='Opening moves in 1-based notation, e.g. 4453, or a reference position name: '
+                             + ', '.join(REFERENCE_POSITIONS))
+    parser.add_argument('--time_budget', type=float, default=1.0, help='Seconds of search per move (default: 1.0)')
+    parser.add_argument('--max_depth', type=int, default=None, help='Depth limit per move (default: none)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Split the root moves across this many processes (default: one process, no split)')
+    parser.add_argument('--steps_per_second', type=float, default=1,
+                        help='Moves per second; 0 plays as fast as possible (default: 1)')
+    parser.add_argument('--render_every', type=int, default=1,
+                        help='Redraw the window once every N moves (default: 1)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Run the simulation without a window and print the result')
+    parser.add_argument('--capture', type=str, default=None,
+                        help='Record frames to a PNG directory, or to a video file (.mp4, .mkv, ...) if ffmpeg is installed')
+    parser.add_argument('--capture_fps', type=int, default=30, help='Frame rate of a captured video (default: 30)')
+    args = parser.parse_args()
+
+    position = REFERENCE_POSITIONS.get(args.position, args.position)
+
+    if args.headless:
+        # No window is opened, so the dummy video driver is enough
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    if args.headless:
+        # An off-screen Surface stands in for the window; it is only drawn to when capturing
+        screen = pygame.Surface((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT))
+    else:
+        screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
+        pygame.display.set_caption("Adversarial Search Simulation (Alpha-Beta Self-Play)")
+
+    sim = AdversarialSimulation(screen, game=args.game, position=position, time_budget=args.time_budget,
+                                max_depth=args.max_depth, workers=args.workers,
+                                steps_per_second=args.steps_per_second, render_every=args.render_every)
+    if args.capture:
+        sim.capture = FrameWriter(args.capture, fps=args.capture_fps)
+    if args.headless:
+        t0 = time.perf_counter()
+        steps = sim.run_headless()
+        print(sim.state)
+        print(f"{sim.result()} after {steps} moves ({position}{sim.move_string()}), "
+              f"{sim.total_nodes} nodes at {sim.nodes_per_second():.0f} nodes/s "
+              f"in {time.perf_counter() - t0:.3f} s")
+    else:
+        sim.run()
+    sim.close()
+    if sim.capture is not None:
+        sim.capture.close()
+        print(f"Frames captured: {sim.capture.stats()}")
+
+if __name__ == "__main__":
+    main()
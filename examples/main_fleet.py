@@ -0,0 +1,67 @@
+# examples/main_fleet.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import time
+import pygame
+import argparse
+from modules.simulations.fleet_simulation import FleetSimulation
+from modules.simulations.frame_capture import FrameWriter
+from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
+
+def main():
+    parser = argparse.ArgumentParser(description='Multi-Robot Fleet Simulation (Cooperative A*)')
+    parser.add_argument('--grid_size', type=int, default=32, help='Size of the grid (default: 32)')
+    parser.add_argument('--num_agents', type=int, default=20, help='Number of robots (default: 20)')
+    parser.add_argument('--tasks_per_agent', type=int, default=3, help='Tasks dealt to each robot (default: 3)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (default: none)')
+    parser.add_argument('--steps_per_second', type=float, default=5,
+                        help='Fleet steps per second; 0 runs as fast as possible (default: 5)')
+    parser.add_argument('--render_every', type=int, default=1,
+                        help='Redraw the window once every N fleet steps (default: 1)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Run the simulation without a window and print the result')
+    parser.add_argument('--max_steps', type=int, default=1000,
+                        help='Step limit of a headless run, since a boxed-in robot may never finish (default: 1000)')
+    parser.add_argument('--capture', type=str, default=None,
+                        help='Record frames to a PNG directory, or to a video file (.mp4, .mkv, ...) if ffmpeg is installed')
+    parser.add_argument('--capture_fps', type=int, default=30, help='Frame rate of a captured video (default: 30)')
+    args = parser.parse_args()
+
+    if args.headless:
+        # No window is opened, so the dummy video driver is enough
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    if args.headless:
+        # An off-screen Surface stands in for the window; it is only drawn to when capturing
+        screen = pygame.Surface((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT))
+    else:
+        screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
+        pygame.display.set_caption("Multi-Robot Fleet Simulation (Cooperative A*)")
+
+    sim = FleetSimulation(screen, grid_size=args.grid_size, num_agents=args.num_agents,
+                          tasks_per_agent=args.tasks_per_agent, seed=args.seed,
+                          steps_per_second=args.steps_per_second, render_every=args.render_every)
+    if args.capture:
+        sim.capture = FrameWriter(args.capture, fps=args.capture_fps)
+    if args.headless:
+        t0 = time.perf_counter()
+        steps = sim.run_headless(max_steps=args.max_steps)
+        fleet = sim.fleet
+        print(f"{steps} steps, {fleet.tasks_completed()}/{args.num_agents * args.tasks_per_agent} tasks completed, "
+              f"{fleet.conflicts} conflicts, {fleet.planning_time:.3f} s planning "
+              f"in {time.perf_counter() - t0:.3f} s")
+    else:
+        sim.run()
+    if sim.capture is not None:
+        sim.capture.close()
+        print(f"Frames captured: {sim.capture.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -8,15 +8,17 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
+import time
 import pygame
 import argparse
 from modules.simulations.maze_simulation import MazeSimulation
+from modules.simulations.frame_capture import FrameWriter
 from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
 
 def main():
     parser = argparse.ArgumentParser(description='Maze Solver Simulation')
     parser.add_argument('--algorithm', type=str, default='dfs',
-                        choices=['dfs', 'bfs', 'ucs', 'astar'],
+                        choices=['dfs', 'bfs', 'ucs', 'astar', 'bibfs', 'biastar', 'jps'],
                         help='Search algorithm to use (default: dfs)')
     parser.add_argument('--maze_width', type=int, default=21, help='Width of the maze (odd number, default: 21)')
     parser.add_argument('--maze_height', type=int, default=21, help='Height of the maze (odd number, default: 21)')
@@ -24,6 +26,17 @@ def main():
                         help='Maze complexity (0.0 to 1.0, default: 0.75)')
     parser.add_argument('--density', type=float, default=0.75,
                         help='Maze density (0.0 to 1.0, default: 0.75)')
+    parser.add_argument('--steps_per_second', type=float, default=5,
+                        help='Agent steps per second; 0 runs as fast as possible (default: 5)')
+    parser.add_argument('--render_every', type=int, default=1,
+                        help='Redraw the window once every N agent steps (default: 1)')
+    parser.add_argument('--expansions_per_frame', type=int, default=64,
+                        help='Search expansions animated per frame; 0 finds the path at once (default: 64)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Run the simulation to completion without a window and print the result')
+    parser.add_argument('--capture', type=str, default=None,
+                        help='Record frames to a PNG directory, or to a video file (.mp4, .mkv, ...) if ffmpeg is installed')
+    parser.add_argument('--capture_fps', type=int, default=30, help='Frame rate of a captured video (default: 30)')
     args = parser.parse_args()
 
     algorithm = args.algorithm
@@ -36,13 +49,34 @@ def main():
     if maze_height % 2 == 0:
         maze_height += 1
 
+    if args.headless:
+        # No window is opened, so the dummy video driver is enough
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
     pygame.init()
-    screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
-    pygame.display.set_caption("Maze Solver Simulation")
+    if args.headless:
+        # An off-screen Surface stands in for the window; it is only drawn to when capturing
+        screen = pygame.Surface((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT))
+    else:
+        screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
+        pygame.display.set_caption("Maze Solver Simulation")
 
     sim = MazeSimulation(screen, algorithm=algorithm, maze_width=maze_width, maze_height=maze_height,
-                         complexity=args.complexity, density=args.density)
-    sim.run()
+                         complexity=args.complexity, density=args.density,
+                         steps_per_second=args.steps_per_second, render_every=args.render_every,
+                         expansions_per_frame=args.expansions_per_frame)
+    if args.capture:
+        sim.capture = FrameWriter(args.capture, fps=args.capture_fps)
+    if args.headless:
+        t0 = time.perf_counter()
+        steps = sim.run_headless()
+        reached = sim.agent.position == sim.goal_pos
+        print(f"{steps} steps ({len(sim.agent.path_traveled)} moves), goal {'reached' if reached else 'not reached'} "
+              f"in {time.perf_counter() - t0:.3f} s")
+    else:
+        sim.run()
+    if sim.capture is not None:
+        sim.capture.close()
+        print(f"Frames captured: {sim.capture.stats()}")
 
 if __name__ == "__main__":
     main()
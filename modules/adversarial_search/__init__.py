@@ -0,0 +1,8 @@
+# modules/adversarial_search/__init__.py
+
+from .minimax import GameState, ZobristKeys, TranspositionTable, AlphaBetaSearch
+from .parallel_search import ParallelSearch
+from .games import TicTacToe, ConnectFour, GAMES, REFERENCE_POSITIONS
+
+__all__ = ['GameState', 'ZobristKeys', 'TranspositionTable', 'AlphaBetaSearch', 'ParallelSearch',
+           'TicTacToe', 'ConnectFour', 'GAMES', 'REFERENCE_POSITIONS']
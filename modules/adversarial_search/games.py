@@ -0,0 +1,237 @@
+# modules/adversarial_search/games.py
+
+"""
+Reference games for the alpha-beta engine: tic-tac-toe and Connect-Four.
+
+Both keep one bitboard per player, so playing a move, testing for a win
+and updating the Zobrist hash take a few integer operations. Player 0
+(X) moves first. Moves are 0-based internally; from_moves() reads the
+usual 1-based notation, e.g. ConnectFour.from_moves('4453') is the
+position after four moves in the centre and neighbouring columns.
+"""
+
+from modules.adversarial_search.minimax import GameState, ZobristKeys
+
+SYMBOLS = ('X', 'O')
+
+
+def line_masks(width, height, length, index):
+    """Returns the bitmask of every run of length cells in a row, column or diagonal."""
+    masks = []
+    for dx, dy in ((1, 0), (0, 1), (1, 1), (1, -1)):
+        for x in range(width):
+            for y in range(height):
+                end_x, end_y = x + dx * (length - 1), y + dy * (length - 1)
+                if 0 <= end_x < width and 0 <= end_y < height:
+                    mask = 0
+                    for step in range(length):
+                        mask |= 1 << index(x + dx * step, y + dy * step)
+                    masks.append(mask)
+    return masks
+
+
+def lines_through(masks, squares):
+    """Returns, for every square, the line masks that contain it."""
+    return [[mask for mask in masks if mask >> square & 1] for square in range(squares)]
+
+
+def line_weights(masks, weights):
+    """Pairs each line mask with a table from the subset of its cells a player holds to weights[count]."""
+    tables = []
+    for mask in masks:
+        bits = [bit for bit in range(mask.bit_length()) if mask >> bit & 1]
+        table = {}
+        for subset in range(1 << len(bits)):
+            cells = 0
+            for i, bit in enumerate(bits):
+                if subset >> i & 1:
+                    cells |= 1 << bit
+            table[cells] = weights[bin(subset).count('1')]
+        tables.append((mask, table))
+    return tables
+
+
+def line_score(own, other, tables):
+    """Sums the weights of the lines only one player has pieces on, positive for own."""
+    score = 0
+    for mask, table in tables:
+        mine = own & mask
+        theirs = other & mask
+        if not theirs:
+            score += table[mine]
+        elif not mine:
+            score -= table[theirs]
+    return score
+
+
+class BitboardGame(GameState):
+    """Shared parts of the two games: bitboards, hash, winner and move count."""
+
+    keys = None  # ZobristKeys of the subclass
+    size = 0  # Number of squares a game can fill
+
+    def __init__(self):
+        self.boards = [0, 0]
+        self.player = 0
+        self.hash = 0
+        self.moves_played = 0
+        self.winner = None
+
+    def outcome(self):
+        if self.winner is not None:
+            return 1 if self.winner == self.player else -1
+        if self.moves_played == self.size:
+            return 0
+        return None
+
+    def moves_left(self):
+        return 0 if self.winner is not None else self.size - self.moves_played
+
+    def place(self, bit):
+        """Puts a piece of the side to move on bit and passes the turn."""
+        player = self.player
+        self.boards[player] |= 1 << bit
+        self.hash ^= self.keys.pieces[player][bit] ^ self.keys.side
+        self.moves_played += 1
+        if self.wins(self.boards[player], bit):
+            self.winner = player
+        self.player = 1 - player
+
+    def remove(self, bit):
+        """Takes back the piece on bit, which the previous player placed last."""
+        player = self.player = 1 - self.player
+        self.boards[player] ^= 1 << bit
+        self.hash ^= self.keys.pieces[player][bit] ^ self.keys.side
+        self.moves_played -= 1
+        self.winner = None
+
+    def copy(self):
+        state = self.__class__.__new__(self.__class__)
+        state.__dict__.update(self.__dict__)
+        state.boards = list(self.boards)
+        return state
+
+    @classmethod
+    def from_moves(cls, moves):
+        """Plays a string of 1-based moves from the empty position, e.g. '4453'."""
+        state = cls()
+        for char in moves:
+            move = int(char) - 1
+            if state.outcome() is not None or move not in state.legal_moves():
+                raise ValueError(f"Illegal move {char} in {moves!r}")
+            state.play(move)
+        return state
+
+    def cells(self):
+        """The board as rows from top to bottom, each cell 0, 1 or None."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def owner(self, bit):
+        for player in (0, 1):
+            if self.boards[player] >> bit & 1:
+                return player
+        return None
+
+    def __str__(self):
+        return '\n'.join(''.join('.' if cell is None else SYMBOLS[cell] for cell in row) for row in self.cells())
+
+
+class TicTacToe(BitboardGame):
+    """Tic-tac-toe on squares 0-8, row by row from the top left. A move is a square."""
+
+    width = height = 3
+    size = 9
+    keys = ZobristKeys(9)
+    lines = line_masks(3, 3, 3, lambda x, y: y * 3 + x)
+    lines_through = lines_through(lines, 9)
+    tables = line_weights(lines, (0, 1, 10, 0))
+    order = (4, 0, 2, 6, 8, 1, 3, 5, 7)  # Centre, corners, edges
+
+    def legal_moves(self):
+        if self.winner is not None:
+            return []
+        taken = self.boards[0] | self.boards[1]
+        return [square for square in self.order if not taken >> square & 1]
+
+    def play(self, move):
+        self.place(move)
+
+    def undo(self, move):
+        self.remove(move)
+
+    def wins(self, board, bit):
+        return any(board & mask == mask for mask in self.lines_through[bit])
+
+    def evaluate(self):
+        return line_score(self.boards[self.player], self.boards[1 - self.player], self.tables)
+
+    def cells(self):
+        return [[self.owner(y * 3 + x) for x in range(3)] for y in range(3)]
+
+
+class ConnectFour(BitboardGame):
+    """
+    Connect-Four on 7 columns of 6. A move is a column. Column c uses bits
+    7c to 7c + 5 from the bottom up, and bit 7c + 6 stays empty, so that the
+    shifted copies of a board in the win test never wrap into the next column.
+    """
+
+    width, height = 7, 6
+    size = 42
+    stride = height + 1
+    keys = ZobristKeys(7 * 7)
+    lines = line_masks(7, 6, 4, lambda x, y: x * 7 + y)
+    tables = line_weights(lines, (0, 1, 4, 32, 0))
+    order = (3, 2, 4, 1, 5, 0, 6)  # Centre columns first
+
+    def __init__(self):
+        super().__init__()
+        self.heights = [column * self.stride for column in range(self.width)]  # Next free bit per column
+
+    def legal_moves(self):
+        if self.winner is not None:
+            return []
+        heights = self.heights
+        return [column for column in self.order if heights[column] < column * 7 + 6]
+
+    def play(self, move):
+        bit = self.heights[move]
+        self.heights[move] = bit + 1
+        self.place(bit)
+
+    def undo(self, move):
+        self.heights[move] -= 1
+        self.remove(self.heights[move])
+
+    def wins(self, board, bit):
+        # Vertical, horizontal and both diagonals: four in a row leave a bit after two shifted ANDs
+        for shift in (1, 7, 6, 8):
+            pairs = board & (board >> shift)
+            if pairs & (pairs >> 2 * shift):
+                return True
+        return False
+
+    def evaluate(self):
+        return line_score(self.boards[self.player], self.boards[1 - self.player], self.tables)
+
+    def copy(self):
+        state = super().copy()
+        state.heights = list(self.heights)
+        return state
+
+    def cells(self):
+        return [[self.owner(x * 7 + y) for x in range(7)] for y in range(5, -1, -1)]
+
+
+GAMES = {
+    'tictactoe': TicTacToe,
+    'connect4': ConnectFour,
+}
+
+# Connect-Four positions for benchmarks, as 1-based moves from the empty board
+REFERENCE_POSITIONS = {
+    'opening': '',
+    'early': '4453',
+    'middlegame': '455552444224',
+    'late': '4555524442242522',
+}
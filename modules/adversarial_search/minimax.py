@@ -0,0 +1,323 @@
+# modules/adversarial_search/minimax.py
+
+"""
+Alpha-beta game-tree search for two-player, zero-sum games.
+
+Games implement the GameState interface. The search is written in negamax
+form: a score is always from the point of view of the side to move, and a
+child's score is negated on the way up. AlphaBetaSearch adds the usual
+enhancements on top of alpha-beta pruning:
+
+* iterative deepening under a time budget, keeping the best move of the
+  deepest iteration that finished,
+* a transposition table of earlier results, indexed by the Zobrist hash of
+  the position,
+* move ordering: the table's best move first, then the two killer moves of
+  the ply (moves that caused a cutoff in a sibling), then the rest by their
+  history score (how often and how deep they caused cutoffs).
+"""
+
+import time
+import random
+
+WIN = 1000000  # Score of a won position, minus the plies it takes to win
+MAX_PLY = 1000  # Scores within MAX_PLY of WIN are forced wins or losses
+INFINITY = WIN + 1
+TIME_CHECK_INTERVAL = 1024  # Nodes between clock checks
+
+# Bound types of transposition table entries
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when the time budget runs out."""
+
+
+class ZobristKeys:
+    """
+    Random 64-bit keys, one per (player, square) and one for the side to
+    move. A position's hash is the XOR of the keys of its pieces, so a move
+    updates it with one or two XORs. The keys are seeded, so every process
+    computes the same hash for the same position.
+    """
+
+    def __init__(self, squares, players=2, seed=0):
+        rng = random.Random(seed)
+        self.pieces = [[rng.getrandbits(64) for _ in range(squares)] for _ in range(players)]
+        self.side = rng.getrandbits(64)
+
+
+class GameState:
+    """
+    The interface AlphaBetaSearch searches. Moves are made and taken back
+    in place, so the search needs no copies of the board.
+
+    player is the side to move (0 or 1) and hash the Zobrist key of the
+    position; play() and undo() keep both up to date.
+    """
+
+    player = 0
+    hash = 0
+
+    def legal_moves(self):
+        """Returns the moves of the side to move as a list, in a good default order."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def play(self, move):
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def undo(self, move):
+        """Takes back move, which must be the last move played."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def outcome(self):
+        """None while the game goes on, otherwise 1, 0 or -1: a win, draw or loss for the side to move."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def evaluate(self):
+        """Heuristic score of a position that is not over, for the side to move, well inside +-WIN."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def moves_left(self):
+        """An upper bound on the number of plies before the game ends."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def copy(self):
+        raise NotImplementedError("Subclasses should implement this method.")
+
+
+def is_mate_score(score):
+    """True for the score of a forced win or loss."""
+    return abs(score) >= WIN - MAX_PLY
+
+
+class TranspositionTable:
+    """
+    A fixed number of slots, indexed by the low bits of the Zobrist hash.
+    Each slot holds (hash, depth, score, bound, best move, generation).
+
+    Replacement is depth-preferred with aging: a slot holding a different
+    position is only overwritten by a result searched at least as deep, or
+    when its entry is left over from an earlier search (an older
+    generation). Results for the same position always replace the old one.
+    """
+
+    def __init__(self, size=1 << 18):
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Table size must be a power of two: {size}")
+        self.size = size
+        self.mask = size - 1
+        self.slots = [None] * size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0  # Entries of another position overwritten
+        self.rejections = 0  # Stores dropped to keep a deeper entry
+
+    def new_search(self):
+        """Ages the current entries, so the next search may replace them."""
+        self.generation += 1
+
+    def probe(self, key):
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, score, bound, move):
+        index = key & self.mask
+        entry = self.slots[index]
+        if entry is not None and entry[0] != key:
+            if entry[5] == self.generation and entry[1] > depth:
+                self.rejections += 1
+                return
+            self.replacements += 1
+        self.slots[index] = (key, depth, score, bound, move, self.generation)
+        self.stores += 1
+
+    def stats(self):
+        """Returns the probe and store counters and current occupancy."""
+        probes = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / probes if probes else 0.0,
+            'stores': self.stores,
+            'replacements': self.replacements,
+            'rejections': self.rejections,
+            'entries': self.size - self.slots.count(None),
+        }
+
+    def clear(self):
+        self.slots = [None] * self.size
+        self.generation = 0
+        self.hits = self.misses = self.stores = self.replacements = self.rejections = 0
+
+
+class AlphaBetaSearch:
+    """
+    Negamax alpha-beta search with a transposition table and killer and
+    history move ordering. The table, killers and history persist between
+    searches, so an engine playing a whole game reuses what it learned.
+    table_size=0 turns the table off, and killers / history turn off the
+    other two enhancements, for comparing them.
+    """
+
+    def __init__(self, table_size=1 << 18, killers=True, history=True):
+        self.table = TranspositionTable(table_size) if table_size else None
+        self.use_killers = killers
+        self.use_history = history
+        self.killers = []  # Two killer moves per ply
+        self.history = {}  # (player, move) -> cutoff score
+        self.nodes = 0
+        self.deadline = None
+        self.root_move = None
+
+    def search(self, state, depth, alpha=-INFINITY, beta=INFINITY):
+        """Searches state to a fixed depth and returns (best move, score)."""
+        if self.table is not None:
+            self.table.new_search()
+        score = self.negamax(state.copy(), depth, alpha, beta, 0)
+        return self.root_move, score
+
+    def iterative_deepening(self, state, time_budget=None, max_depth=None):
+        """
+        Searches to depth 1, 2, ... until max_depth, the end of the game or
+        a forced result is reached, or time_budget seconds have passed.
+        Returns (best move, score, depth) of the deepest finished iteration;
+        an iteration cut short by the clock is thrown away, except for depth
+        1, which always finishes. The move is None if the game is over.
+        """
+        outcome = state.outcome()
+        if outcome is not None:
+            return None, outcome * WIN, 0
+        if self.table is not None:
+            self.table.new_search()
+        start = time.perf_counter()
+        result = None, 0, 0
+        limit = state.moves_left() if max_depth is None else min(max_depth, state.moves_left())
+        for depth in range(1, limit + 1):
+            # Depth 1 runs without a deadline, so there is always a move to return
+            self.deadline = start + time_budget if time_budget is not None and depth > 1 else None
+            try:
+                score = self.negamax(state.copy(), depth, -INFINITY, INFINITY, 0)
+            except SearchTimeout:
+                break
+            finally:
+                self.deadline = None
+            result = self.root_move, score, depth
+            if is_mate_score(score):
+                break
+        return result
+
+    def negamax(self, state, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % TIME_CHECK_INTERVAL == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+        outcome = state.outcome()
+        if outcome is not None:
+            return outcome * (WIN - ply)  # Sooner wins and later losses score higher
+        if depth == 0:
+            return state.evaluate()
+
+        original_alpha = alpha
+        table_move = None
+        table = self.table
+        if table is not None:
+            entry = table.probe(state.hash)
+            if entry is not None:
+                table_move = entry[4]
+                # The root always searches, so that it sets root_move
+                if ply and entry[1] >= depth:
+                    score = score_from_table(entry[2], ply)
+                    bound = entry[3]
+                    if bound == EXACT:
+                        return score
+                    if bound == LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+                    if alpha >= beta:
+                        return score
+
+        best_score, best_move = -INFINITY, None
+        for move in self.order_moves(state, table_move, ply):
+            state.play(move)
+            score = -self.negamax(state, depth - 1, -beta, -alpha, ply + 1)
+            state.undo(move)
+            if score > best_score:
+                best_score, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.record_cutoff(state.player, move, depth, ply)
+                        break
+
+        if table is not None:
+            if best_score <= original_alpha:
+                bound = UPPER
+            elif best_score >= beta:
+                bound = LOWER
+            else:
+                bound = EXACT
+            table.store(state.hash, depth, score_to_table(best_score, ply), bound, best_move)
+        if ply == 0:
+            self.root_move = best_move
+        return best_score
+
+    def order_moves(self, state, table_move, ply):
+        moves = state.legal_moves()
+        if self.use_history and self.history:
+            history, player = self.history, state.player
+            # sort is stable, so moves without history keep the game's order
+            moves.sort(key=lambda move: history.get((player, move), 0), reverse=True)
+        first = []
+        if table_move is not None and table_move in moves:
+            first.append(table_move)
+        if self.use_killers and ply < len(self.killers):
+            for killer in self.killers[ply]:
+                if killer is not None and killer not in first and killer in moves:
+                    first.append(killer)
+        if first:
+            moves = first + [move for move in moves if move not in first]
+        return moves
+
+    def record_cutoff(self, player, move, depth, ply):
+        """Remembers a move that refuted the opponent's last move."""
+        if self.use_killers:
+            while len(self.killers) <= ply:
+                self.killers.append([None, None])
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        if self.use_history:
+            key = (player, move)
+            self.history[key] = self.history.get(key, 0) + depth * depth
+
+    def stats(self):
+        """Returns the node count and, with a table, its counters."""
+        stats = {'nodes': self.nodes}
+        if self.table is not None:
+            stats.update({f'table_{name}': value for name, value in self.table.stats().items()})
+        return stats
+
+
+def score_to_table(score, ply):
+    """Mate scores count plies from the root; the table stores them counted from the entry's position."""
+    if score >= WIN - MAX_PLY:
+        return score + ply
+    if score <= -(WIN - MAX_PLY):
+        return score - ply
+    return score
+
+
+def score_from_table(score, ply):
+    if score >= WIN - MAX_PLY:
+        return score - ply
+    if score <= -(WIN - MAX_PLY):
+        return score + ply
+    return score
@@ -0,0 +1,176 @@
+# modules/adversarial_search/parallel_search.py
+
+"""
+Root-split alpha-beta search across worker processes.
+
+Each iteration of iterative deepening follows Young Brothers Wait at the
+root. The first root move (the best move of the previous iteration) is
+searched in this process with a full window, which sets alpha. The other
+root moves are then searched in parallel by a process pool. A shared
+multiprocessing.Value holds the best root score found so far. Each worker
+reads it as its alpha when it starts a root move, and raises it when its
+move scores higher, so later root moves search with a narrower window.
+
+The merge does not depend on timing: the result is the first root move,
+in root order, with the best score, which is the move a serial search
+with the same order picks. A move that failed low against an alpha equal
+to the best score may tie it, so those moves are searched again with a
+null window around the best score. Every worker starts each search with
+an empty transposition table, so scores never depend on which worker
+searched what before. The tables are kept between the iterations of one
+search, and so are the killer and history scores.
+"""
+
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.adversarial_search.minimax import AlphaBetaSearch, SearchTimeout, WIN, INFINITY, is_mate_score
+
+_shared_alpha = None  # Set in pool workers by init_worker
+_engine = None  # The worker's engine and the search it belongs to
+_search_id = None
+
+
+def init_worker(shared_alpha):
+    global _shared_alpha
+    _shared_alpha = shared_alpha
+
+
+def worker_engine(search_id, table_size):
+    """Returns this process's engine, with empty tables when a new search starts."""
+    global _engine, _search_id
+    if _search_id != search_id:
+        _engine = AlphaBetaSearch(table_size=table_size)
+        _search_id = search_id
+    return _engine
+
+
+def search_root_move(state, move, depth, search_id, deadline, table_size, shared_alpha=None, engine=None):
+    """
+    Worker entry point: searches one root move to depth with the shared
+    alpha as the lower bound. Returns (move, score, alpha used, nodes);
+    the score is None if the deadline (a time.time() value) passed first.
+    A score at or below the alpha used is only an upper bound.
+    """
+    shared_alpha = shared_alpha if shared_alpha is not None else _shared_alpha
+    engine = engine if engine is not None else worker_engine(search_id, table_size)
+    alpha = shared_alpha.value
+    nodes = engine.nodes
+    if deadline is not None:
+        engine.deadline = time.perf_counter() + (deadline - time.time())
+    state.play(move)
+    try:
+        score = -engine.negamax(state, depth - 1, -INFINITY, -alpha, 1)
+    except SearchTimeout:
+        return move, None, alpha, engine.nodes - nodes
+    finally:
+        engine.deadline = None
+    if score > alpha:
+        with shared_alpha.get_lock():
+            if score > shared_alpha.value:
+                shared_alpha.value = score
+    return move, score, alpha, engine.nodes - nodes
+
+
+class ParallelSearch:
+    """
+    Root-split search with the iterative_deepening() interface of
+    AlphaBetaSearch. With workers=1 the root moves are searched one after
+    another in this process, which gives the same moves and scores as any
+    other worker count. Call close() to shut the pool down.
+    """
+
+    def __init__(self, workers=None, table_size=1 << 18):
+        self.workers = workers or os.cpu_count() or 1
+        self.table_size = table_size
+        self.engine = AlphaBetaSearch(table_size=table_size)  # Searches the first root move and ties
+        self.table = self.engine.table
+        self.context = multiprocessing.get_context()
+        self.shared_alpha = self.context.Value('q', -INFINITY)
+        self.executor = None
+        self.searches = 0
+        self.nodes = 0
+
+    def pool(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context,
+                                                initializer=init_worker, initargs=(self.shared_alpha,))
+        return self.executor
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def iterative_deepening(self, state, time_budget=None, max_depth=None):
+        """
+        Searches to depth 1, 2, ... like AlphaBetaSearch.iterative_deepening
+        and returns (best move, score, depth) of the deepest iteration that
+        every root move finished in time.
+        """
+        outcome = state.outcome()
+        if outcome is not None:
+            return None, outcome * WIN, 0
+        self.searches += 1
+        search_id = (os.getpid(), id(self), self.searches)
+        self.engine = AlphaBetaSearch(table_size=self.table_size)
+        self.table = self.engine.table
+        deadline = time.time() + time_budget if time_budget is not None else None
+        result = None, 0, 0
+        limit = state.moves_left() if max_depth is None else min(max_depth, state.moves_left())
+        for depth in range(1, limit + 1):
+            searched = self.search_root(state, depth, result[0], search_id,
+                                        deadline if depth > 1 else None)
+            if searched is None:
+                break
+            result = searched + (depth,)
+            if is_mate_score(result[1]):
+                break
+        return result
+
+    def search_root(self, state, depth, first_move, search_id, deadline):
+        """Searches every root move to depth and returns (best move, score), or None on timeout."""
+        moves = state.legal_moves()
+        if first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+
+        # The eldest brother sets alpha before the others start
+        self.shared_alpha.value = -INFINITY
+        first = search_root_move(state.copy(), moves[0], depth, search_id, deadline, self.table_size,
+                                 shared_alpha=self.shared_alpha, engine=self.engine)
+        results = [first]
+        rest = moves[1:]
+        if self.workers == 1:
+            for move in rest:
+                results.append(search_root_move(state.copy(), move, depth, search_id, deadline, self.table_size,
+                                                shared_alpha=self.shared_alpha, engine=self.engine))
+        elif rest:
+            executor = self.pool()
+            futures = [executor.submit(search_root_move, state, move, depth, search_id, deadline, self.table_size)
+                       for move in rest]
+            results += [future.result() for future in futures]
+        self.nodes += sum(nodes for _, _, _, nodes in results)
+        if any(score is None for _, score, _, _ in results):
+            return None
+
+        # An exact score beats the alpha it was searched with; the best score is always exact
+        best_score = max(score for _, score, alpha, _ in results if score > alpha)
+        for move, score, alpha, _ in results:
+            if score > alpha and score == best_score:
+                return move, best_score
+            if score <= alpha and alpha >= best_score:
+                # Failed low against the best score, so it may tie: test score >= best_score with a null window
+                child = state.copy()
+                child.play(move)
+                nodes = self.engine.nodes
+                tie = -self.engine.negamax(child, depth - 1, -best_score, -best_score + 1, 1)
+                self.nodes += self.engine.nodes - nodes
+                if tie >= best_score:
+                    return move, best_score
+        return None
+
+    def stats(self):
+        return {'nodes': self.nodes, 'workers': self.workers}
@@ -2,5 +2,6 @@
 
 from .robot_agent import RobotAgent
 from .maze_agent import MazeAgent
+from .robot_fleet import RobotFleet
 
-__all__ = ['RobotAgent', 'MazeAgent']
+__all__ = ['RobotAgent', 'MazeAgent', 'RobotFleet']
@@ -1,32 +1,82 @@
 # modules/agents/maze_agent.py
 
-from modules.search_algorithms.uninformed_search import dfs, bfs, ucs
-from modules.search_algorithms.informed_search import astar
+from collections import deque
+from functools import partial
+
+from modules.search_algorithms.uninformed_search import dfs, bfs, ucs, bidirectional_bfs
+from modules.search_algorithms.informed_search import astar, bidirectional_astar, jump_point_search
+from modules.search_algorithms.stepwise_search import STEP_SEARCHES, BATCH_SIZE
+from modules.utils.path_history import PathHistory
 
 class MazeAgent:
-    def __init__(self, start_position, goal_position, algorithm='dfs'):
+    def __init__(self, start_position, goal_position, algorithm='dfs', path_cache=None, stats=None, history_limit=None):
         self.position = start_position
         self.goal_position = goal_position
         self.algorithm = algorithm
+        self.path_cache = path_cache  # Optional PathCache, can be shared between agents
+        self.stats = stats  # Optional SearchStats, accumulates the counters of every search
         self.path = []
-        self.path_traveled = []
+        self.path_traveled = PathHistory(max_length=history_limit)  # Optionally capped for very long runs
+
+    @property
+    def path(self):
+        """Remaining path as a deque, so each move pops its next cell in O(1)."""
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        # Searches return a list or None; both become a deque
+        self._path = deque(path) if path else deque()
 
     def find_path(self, grid):
         blocked_positions = set()
         grid_size = len(grid)
         if self.algorithm == 'dfs':
-            self.path = dfs(self.position, self.goal_position, grid, blocked_positions, grid_size)
+            search = dfs
         elif self.algorithm == 'bfs':
-            self.path = bfs(self.position, self.goal_position, grid, blocked_positions, grid_size)
+            search = bfs
         elif self.algorithm == 'ucs':
-            self.path = ucs(self.position, self.goal_position, grid, blocked_positions, grid_size)
+            search = ucs
         elif self.algorithm == 'astar':
-            self.path = astar(self.position, self.goal_position, grid, blocked_positions, grid_size)
+            search = astar
+        elif self.algorithm == 'bibfs':
+            search = bidirectional_bfs
+        elif self.algorithm == 'biastar':
+            search = bidirectional_astar
+        elif self.algorithm == 'jps':
+            search = jump_point_search
         else:
             raise ValueError(f"Unknown algorithm: {self.algorithm}")
+        if self.stats is not None:
+            search = partial(search, stats=self.stats)
+
+        if self.path_cache is not None:
+            self.path = self.path_cache.find_path(self.algorithm, search, self.position, self.goal_position,
+                                                  grid, blocked_positions, grid_size)
+        else:
+            self.path = search(self.position, self.goal_position, grid, blocked_positions, grid_size)
+
+    def search_steps(self, grid, batch_size=BATCH_SIZE):
+        """
+        Generator version of find_path that yields the search's (expanded,
+        frontier) batches and sets self.path when the search finishes.
+        """
+        blocked_positions = set()
+        grid_size = len(grid)
+        steps = STEP_SEARCHES.get(self.algorithm)
+        if steps is None:
+            raise ValueError(f"Unknown algorithm: {self.algorithm}")
+
+        if self.path_cache is not None:
+            self.path = yield from self.path_cache.find_path_steps(
+                self.algorithm, steps, self.position, self.goal_position, grid, blocked_positions, grid_size,
+                batch_size=batch_size, stats=self.stats)
+        else:
+            self.path = yield from steps(self.position, self.goal_position, grid, blocked_positions, grid_size,
+                                         batch_size=batch_size, stats=self.stats)
 
     def move(self):
         if self.path:
-            next_position = self.path.pop(0)
+            next_position = self.path.popleft()
             self.position = next_position
             self.path_traveled.append(self.position)
@@ -1,24 +1,53 @@
 # modules/agents/robot_agent.py
 
-from modules.search_algorithms.uninformed_search import bfs
-from modules.search_algorithms.informed_search import astar
+from collections import deque
+from functools import partial
+
+from modules.search_algorithms.uninformed_search import dfs, bfs, ucs, bidirectional_bfs
+from modules.search_algorithms.informed_search import astar, bidirectional_astar, jump_point_search
+from modules.search_algorithms.incremental_search import DStarLite
+from modules.search_algorithms.stepwise_search import STEP_SEARCHES, BATCH_SIZE
+from modules.utils.path_history import PathHistory
+from modules.search_algorithms.tour_planning import INFINITY, distance_matrix
+from modules.search_algorithms.tour_planning import plan_tour as solve_tour
 
 class RobotAgent:
-    def __init__(self, start_position, tasks, algorithm='astar', nearest_task=False):
+    def __init__(self, start_position, tasks, algorithm='astar', nearest_task=False, plan_tour=False,
+                 path_cache=None, stats=None, history_limit=None):
         self.position = start_position
         self.tasks = tasks.copy()  # Original list of tasks
         self.algorithm = algorithm
         self.nearest_task = nearest_task  # Determines behavior
+        self.plan_tour = plan_tour  # Plan the whole task order up front, takes precedence over nearest_task
         self.path = []
-        self.path_traveled = []
+        self.path_traveled = PathHistory(max_length=history_limit)  # Optionally capped for very long runs
         self.completed_tasks = []
         self.current_task_index = 0  # For task order-based behavior
         self.grid = None  # Will be set when find_initial_path is called
         self.current_task = None
+        self.tour = []  # Task visiting order when plan_tour is set
+        self.tour_legs = []  # Cached path for each leg of the tour
+        self.path_cache = path_cache  # Optional PathCache, can be shared between agents
+        self.stats = stats  # Optional SearchStats, accumulates the counters of every search
+        self.planner = None  # D* Lite planner for the current task when algorithm is 'dstar'
+
+    @property
+    def path(self):
+        """Remaining path as a deque, so each move pops its next cell in O(1)."""
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        # Searches return a list or None; both become a deque
+        self._path = deque(path) if path else deque()
 
     def find_initial_path(self, grid):
         self.grid = grid
-        if self.nearest_task:
+        if self.plan_tour:
+            # Plan the full tour once, then follow its first leg
+            self.plan_task_tour()
+            self.follow_next_leg()
+        elif self.nearest_task:
             # Start by finding a path to the nearest task
             self.find_path_to_nearest_task()
         else:
@@ -30,20 +59,79 @@ class RobotAgent:
     def find_path_to_current_task(self):
         blocked_positions = set()
         grid_size = len(self.grid)
+        if self.algorithm == 'dstar':
+            # Keep the planner so update_cells can repair the path instead of searching again
+            self.planner = DStarLite(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            self.path = self.planner.find_path()
+            return
+
         if self.algorithm == 'dfs':
-            from modules.search_algorithms.uninformed_search import dfs
-            self.path = dfs(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            search = dfs
         elif self.algorithm == 'bfs':
-            self.path = bfs(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            search = bfs
         elif self.algorithm == 'ucs':
-            from modules.search_algorithms.uninformed_search import ucs
-            self.path = ucs(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            search = ucs
         elif self.algorithm == 'astar':
-            self.path = astar(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            search = astar
+        elif self.algorithm == 'bibfs':
+            search = bidirectional_bfs
+        elif self.algorithm == 'biastar':
+            search = bidirectional_astar
+        elif self.algorithm == 'jps':
+            search = jump_point_search
         else:
             raise ValueError(f"Unknown algorithm: {self.algorithm}")
+        if self.stats is not None:
+            search = partial(search, stats=self.stats)
+
+        if self.path_cache is not None:
+            self.path = self.path_cache.find_path(self.algorithm, search, self.position, self.current_task,
+                                                  self.grid, blocked_positions, grid_size)
+        else:
+            self.path = search(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+
+    def initial_path_steps(self, grid, batch_size=BATCH_SIZE):
+        """
+        Generator version of find_initial_path that yields the (expanded,
+        frontier) batches of the search for the first task. Planned tours
+        and D* Lite have no stepwise version and are planned at once.
+        """
+        if self.plan_tour or self.algorithm == 'dstar':
+            self.find_initial_path(grid)
+            return
+        self.grid = grid
+        if self.nearest_task:
+            if not self.select_nearest_task():
+                return
+        elif self.current_task_index < len(self.tasks):
+            self.current_task = self.tasks[self.current_task_index]
+        else:
+            return
+        yield from self.search_steps(batch_size)
+
+    def search_steps(self, batch_size=BATCH_SIZE):
+        """Generator version of find_path_to_current_task for the stepwise searches."""
+        blocked_positions = set()
+        grid_size = len(self.grid)
+        steps = STEP_SEARCHES.get(self.algorithm)
+        if steps is None:
+            raise ValueError(f"Unknown algorithm: {self.algorithm}")
+
+        if self.path_cache is not None:
+            self.path = yield from self.path_cache.find_path_steps(
+                self.algorithm, steps, self.position, self.current_task, self.grid, blocked_positions, grid_size,
+                batch_size=batch_size, stats=self.stats)
+        else:
+            self.path = yield from steps(self.position, self.current_task, self.grid, blocked_positions, grid_size,
+                                         batch_size=batch_size, stats=self.stats)
 
     def find_path_to_nearest_task(self):
+        if self.select_nearest_task():
+            # Plan path to the nearest task
+            self.find_path_to_current_task()
+
+    def select_nearest_task(self):
+        """Sets current_task to the nearest uncompleted task. Returns False if there is none."""
         if not self.tasks:
             return False  # No tasks left
 
@@ -60,21 +148,40 @@ class RobotAgent:
         # Find the nearest task
         task_distances.sort()
         self.current_task = task_distances[0][1]
+        return True
+
+    def plan_task_tour(self):
+        # One BFS per point gives obstacle-aware distances between the start and every task
+        points = [self.position] + [task for task in self.tasks if task not in self.completed_tasks]
+        distances, legs = distance_matrix(points, self.grid, set(), len(self.grid))
+        # Tasks that cannot be reached from the start are left out of the tour
+        reachable = [i for i in range(len(points)) if distances[0][i] != INFINITY]
+        order = solve_tour([[distances[i][j] for j in reachable] for i in reachable])
+        order = [reachable[k] for k in order]
+        self.tour = [points[i] for i in order[1:]]
+        self.tour_legs = [legs[(a, b)] for a, b in zip(order, order[1:])]
 
-        # Plan path to the nearest task
-        self.find_path_to_current_task()
+    def follow_next_leg(self):
+        if self.tour_legs:
+            self.current_task = self.tour.pop(0)
+            self.path = self.tour_legs.pop(0)
 
     def move(self):
         if self.path:
-            next_position = self.path.pop(0)
+            next_position = self.path.popleft()
             self.position = next_position
             self.path_traveled.append(self.position)
+            if self.planner is not None:
+                self.planner.move_to(self.position)
             # Check if reached the current task
             if self.position == self.current_task:
                 self.completed_tasks.append(self.current_task)
                 self.path = []
                 # Decide next action
-                if self.nearest_task:
+                if self.plan_tour:
+                    # Follow the next cached leg of the planned tour
+                    self.follow_next_leg()
+                elif self.nearest_task:
                     # Find path to the next nearest task
                     if len(self.completed_tasks) < len(self.tasks):
                         self.find_path_to_nearest_task()
@@ -88,6 +195,28 @@ class RobotAgent:
             # No path, agent is idle or tasks are completed
             pass
 
+    def update_cells(self, changed):
+        """
+        Tells the agent that the given (x, y) cells of its grid have changed,
+        and repairs the path to the current task. With the 'dstar' algorithm
+        only the affected part of the planner's tables is updated; otherwise
+        the path is searched again from scratch.
+        """
+        if self.grid is None or self.current_task is None or self.current_task in self.completed_tasks:
+            return
+        if self.planner is not None:
+            self.planner.update_cells(changed)
+            self.path = self.planner.find_path()
+        elif self.plan_tour:
+            # Cached legs may now cross new obstacles, so plan the remaining tour again
+            self.plan_task_tour()
+            self.follow_next_leg()
+        else:
+            self.find_path_to_current_task()
+        # The agent is already on the first cell of the new path
+        if self.path and self.path[0] == self.position:
+            self.path.popleft()
+
     def manhattan_distance(self, pos1, pos2):
         x1, y1 = pos1
         x2, y2 = pos2
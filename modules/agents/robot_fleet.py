@@ -0,0 +1,165 @@
+# modules/agents/robot_fleet.py
+
+"""
+Many RobotAgents working through their own task lists on one shared grid.
+
+The fleet plans every robot with cooperative A* against one shared
+ReservationTable, so the planned paths never put two robots on the same
+cell or swap two robots across an edge. All robots advance together in
+step(): each one takes the next cell (or wait) of its path, the spatial
+hash is updated for the robots that moved, and collisions are checked
+only between robots in neighbouring buckets. A robot that cannot plan
+stays parked and tries again retry_interval steps later.
+"""
+
+import random
+import time
+
+from modules.agents.robot_agent import RobotAgent
+from modules.search_algorithms.uninformed_search import UNVISITED
+from modules.search_algorithms.cooperative_search import (
+    ReservationTable, cooperative_astar, label_components
+)
+from modules.utils.compact_grid import as_compact
+from modules.utils.spatial_hash import SpatialHash
+
+
+class RobotFleet:
+    def __init__(self, grid, starts, task_lists, max_delay=None, max_expansions=4096, retry_interval=4,
+                 bucket_size=8, stats=None, history_limit=None):
+        self.grid = as_compact(grid)  # Converted once so every search reuses the same cells
+        self.components = label_components(self.grid)
+        if len(set(starts)) != len(starts):
+            raise ValueError("Robots must start on distinct cells")
+        for start in starts:
+            if not self.grid.contains(start) or self.grid.get(*start):
+                raise ValueError(f"Start position {start} is not an open cell")
+        # The fleet plans for the robots, so their own algorithm is never used
+        self.agents = [RobotAgent(start, tasks, history_limit=history_limit)
+                       for start, tasks in zip(starts, task_lists)]
+        self.max_delay = max_delay  # Extra steps over the shortest distance a plan may take, None for width + height
+        self.max_expansions = max_expansions  # Search budget per plan, so a blocked robot fails fast
+        self.retry_interval = retry_interval  # Steps a robot waits after a failed plan
+        self.stats = stats  # Optional SearchStats for every cooperative search
+        self.reservations = ReservationTable()
+        self.spatial_hash = SpatialHash(bucket_size)
+        self.retry_at = [0] * len(self.agents)
+        self.time = 0
+        self.moves = 0
+        self.waits = 0
+        self.conflicts = 0  # Robots that ended a step on the same cell or swapped cells, should stay 0
+        self.plans = 0
+        self.failed_plans = 0
+        self.unreachable_tasks = 0
+        self.planning_time = 0.0
+        for robot, agent in enumerate(self.agents):
+            self.spatial_hash.insert(robot, agent.position)
+            self.reservations.park(robot, self.grid.index(agent.position), 0)
+            self.select_task(robot)
+
+    @classmethod
+    def from_environment(cls, env, num_agents, seed=None, **kwargs):
+        """
+        Builds a fleet on a GridEnvironment. The environment's tasks are dealt
+        out round robin, and the robots start on distinct random free cells
+        that are not tasks.
+        """
+        rng = random.Random(seed)
+        grid = env.get_grid()
+        tasks = env.get_tasks()
+        taken = set(tasks)
+        free = [(x, y) for y in range(len(grid)) for x in range(len(grid[0]))
+                if not grid[y][x] and (x, y) not in taken]
+        if len(free) < num_agents:
+            raise ValueError(f"Only {len(free)} free cells for {num_agents} robots")
+        starts = rng.sample(free, num_agents)
+        task_lists = [tasks[robot::num_agents] for robot in range(num_agents)]
+        return cls(grid, starts, task_lists, **kwargs)
+
+    def select_task(self, robot):
+        """Makes the robot's next reachable task current, or sets current_task to None when none are left."""
+        agent = self.agents[robot]
+        label = self.components[self.grid.index(agent.position)]
+        while agent.current_task_index < len(agent.tasks):
+            task = agent.tasks[agent.current_task_index]
+            if self.grid.contains(task) and self.components[self.grid.index(task)] == label != UNVISITED:
+                agent.current_task = task
+                return
+            self.unreachable_tasks += 1
+            agent.current_task_index += 1
+        agent.current_task = None
+
+    def plan(self, robot):
+        """Plans the robot's path to its current task and reserves it. Returns False if no plan was found."""
+        agent = self.agents[robot]
+        self.plans += 1
+        path = cooperative_astar(agent.position, agent.current_task, self.grid, set(), self.grid.height,
+                                 self.reservations, robot, start_time=self.time, max_delay=self.max_delay,
+                                 max_expansions=self.max_expansions,
+                                 stats=self.stats)
+        if path is None:
+            # The robot keeps its parked reservation and tries again later
+            self.failed_plans += 1
+            self.retry_at[robot] = self.time + self.retry_interval
+            return False
+        self.reservations.reserve(robot, [self.grid.index(position) for position in path], self.time)
+        agent.path = path[1:]
+        return True
+
+    def step(self):
+        """Advances every robot by one time step. Returns False once no robot has a task left."""
+        t0 = time.perf_counter()
+        for robot, agent in enumerate(self.agents):
+            if agent.current_task is not None and not agent.path and self.retry_at[robot] <= self.time:
+                self.plan(robot)
+        self.planning_time += time.perf_counter() - t0
+
+        previous = {}  # Robot -> position before this step, for the robots that moved
+        for robot, agent in enumerate(self.agents):
+            if not agent.path:
+                continue
+            position = agent.path.popleft()
+            if position == agent.position:
+                self.waits += 1
+            else:
+                previous[robot] = agent.position
+                agent.position = position
+                agent.path_traveled.append(position)
+            if not agent.path and position == agent.current_task:
+                agent.completed_tasks.append(position)
+                agent.current_task_index += 1
+                self.select_task(robot)
+        self.time += 1
+
+        for robot in previous:
+            self.spatial_hash.move(robot, self.agents[robot].position)
+        self.moves += len(previous)
+        self.conflicts += self.count_conflicts(previous)
+        return not self.done
+
+    def count_conflicts(self, previous):
+        """Counts the robots that moved onto an occupied cell or swapped cells with a neighbour this step."""
+        conflicts = 0
+        for robot, old_position in previous.items():
+            position = self.agents[robot].position
+            for other in self.spatial_hash.nearby(position, 1):
+                if other == robot:
+                    continue
+                other_position = self.agents[other].position
+                if other_position == position:
+                    # Count a pair of moving robots only once
+                    if other not in previous or other > robot:
+                        conflicts += 1
+                elif other > robot and other_position == old_position and previous.get(other) == position:
+                    conflicts += 1
+        return conflicts
+
+    @property
+    def done(self):
+        return all(agent.current_task is None for agent in self.agents)
+
+    def tasks_completed(self):
+        return sum(len(agent.completed_tasks) for agent in self.agents)
+
+    def positions(self):
+        return [agent.position for agent in self.agents]
@@ -0,0 +1,5 @@
+# modules/bench/__init__.py
+
+from .search_benchmark import ALGORITHMS, LOCAL_ALGORITHMS, make_scenario, run_search, run_benchmark, write_results
+
+__all__ = ['ALGORITHMS', 'LOCAL_ALGORITHMS', 'make_scenario', 'run_search', 'run_benchmark', 'write_results']
@@ -0,0 +1,46 @@
+# modules/bench/__main__.py
+
+"""
+Command-line entry point for the headless search benchmark:
+
+    python -m modules.bench --sizes 50 100 200 --seeds 3 --repeats 5 --output results.csv
+"""
+
+import sys
+import argparse
+
+from modules.bench.search_benchmark import ALGORITHMS, LOCAL_ALGORITHMS, run_benchmark, write_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless search algorithm benchmark')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS) + list(LOCAL_ALGORITHMS),
+                        help='Algorithms to run (default: all complete searches)')
+    parser.add_argument('--environments', type=str, nargs='+', default=['grid', 'maze'],
+                        choices=['grid', 'maze'], help='Environments to generate (default: grid maze)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 51, 101],
+                        help='Grid and maze sizes to sweep (default: 25 51 101)')
+    parser.add_argument('--seeds', type=int, default=3, help='Number of seeds per size (default: 3)')
+    parser.add_argument('--first_seed', type=int, default=0, help='First seed of the sweep (default: 0)')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per algorithm and scenario (default: 3)')
+    parser.add_argument('--format', type=str, default='csv', choices=['csv', 'json'],
+                        help='Output format, JSON is written one object per line (default: csv)')
+    parser.add_argument('--output', type=str, default=None, help='Output file (default: stdout)')
+    parser.add_argument('--no_memory', action='store_true',
+                        help='Skip the traced run that measures peak memory')
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    rows = run_benchmark(args.environments, args.sizes, args.algorithms, seeds,
+                         repeats=args.repeats, measure_memory=not args.no_memory)
+
+    if args.output:
+        with open(args.output, 'w', newline='') as stream:
+            write_results(rows, stream, args.format)
+    else:
+        write_results(rows, sys.stdout, args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# modules/bench/search_benchmark.py
+
+"""
+Headless benchmark runner for the grid search algorithms.
+
+Builds seeded GridEnvironment and MazeEnvironment instances over a sweep of
+sizes, runs every algorithm on each of them and records one result row per
+run. Nothing here touches pygame, so it runs without a display.
+"""
+
+import csv
+import json
+import time
+import tracemalloc
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.environments.maze_environment import MazeEnvironment
+from modules.search_algorithms.uninformed_search import dfs, bfs, ucs, bidirectional_bfs
+from modules.search_algorithms.informed_search import astar, bidirectional_astar, jump_point_search
+from modules.search_algorithms.local_search import hill_climbing, simulated_annealing
+from modules.search_algorithms.batched_local_search import batched_hill_climbing, batched_simulated_annealing
+
+ALGORITHMS = {
+    'dfs': dfs,
+    'bfs': bfs,
+    'ucs': ucs,
+    'astar': astar,
+    'bibfs': bidirectional_bfs,
+    'biastar': bidirectional_astar,
+    'jps': jump_point_search,
+}
+
+# Local searches may stop at a local optimum, so they are benchmarked but not swept with the agents
+LOCAL_ALGORITHMS = {
+    'hill_climbing': hill_climbing,
+    'simulated_annealing': simulated_annealing,
+    'batched_hill_climbing': batched_hill_climbing,
+    'batched_simulated_annealing': batched_simulated_annealing,
+}
+
+FIELDS = ['environment', 'size', 'seed', 'algorithm', 'repeat', 'wall_time',
+          'nodes_expanded', 'peak_frontier', 'heap_pushes', 'neighbor_calls', 'neighbor_time',
+          'peak_memory', 'path_length']
+
+
+def make_scenario(environment, size, seed):
+    """
+    Returns (grid, start, goal) for a seeded environment.
+
+    Grid scenarios run from the top-left to the bottom-right corner, which is
+    cleared if an obstacle landed on it. Maze scenarios use the entrance and
+    exit that MazeSimulation uses.
+    """
+    if environment == 'grid':
+        env = GridEnvironment(size, num_tasks=0, seed=seed)
+        grid = env.get_grid()
+        goal = (size - 1, size - 1)
+        grid[goal[1]][goal[0]] = 0
+        return grid, env.get_start_position(), goal
+    elif environment == 'maze':
+        if size % 2 == 0:
+            size += 1  # Mazes need odd dimensions
+        env = MazeEnvironment(size, size, seed=seed)
+        return env.get_grid(), (1, 0), (size - 2, size - 1)
+    else:
+        raise ValueError(f"Unknown environment: {environment}")
+
+
+def run_search(algorithm, grid, start, goal, measure_memory=True):
+    """
+    Runs one search and returns a dict with its wall time, counters,
+    peak traced memory and path length.
+
+    Memory is traced in a second run so that tracemalloc's overhead does not
+    distort the wall-clock figure.
+    """
+    search = ALGORITHMS.get(algorithm) or LOCAL_ALGORITHMS[algorithm]
+    stats = {}
+    t0 = time.perf_counter()
+    path = search(start, goal, grid, set(), len(grid), stats=stats)
+    wall_time = time.perf_counter() - t0
+
+    peak_memory = None
+    if measure_memory:
+        tracemalloc.start()
+        search(start, goal, grid, set(), len(grid))
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        'wall_time': wall_time,
+        'nodes_expanded': stats.get('nodes_expanded', 0),
+        'peak_frontier': stats.get('peak_frontier', 0),
+        'heap_pushes': stats.get('heap_pushes'),  # None for searches without a heap
+        'neighbor_calls': stats.get('neighbor_calls'),  # Only local searches call get_neighbors
+        'neighbor_time': stats.get('neighbor_time'),
+        'peak_memory': peak_memory,
+        'path_length': len(path) if path else None,
+    }
+
+
+def run_benchmark(environments, sizes, algorithms, seeds, repeats=1, measure_memory=True):
+    """Yields one result row per (environment, size, seed, algorithm, repeat)."""
+    for environment in environments:
+        for size in sizes:
+            for seed in seeds:
+                grid, start, goal = make_scenario(environment, size, seed)
+                for algorithm in algorithms:
+                    for repeat in range(repeats):
+                        row = {'environment': environment, 'size': size, 'seed': seed,
+                               'algorithm': algorithm, 'repeat': repeat}
+                        row.update(run_search(algorithm, grid, start, goal, measure_memory))
+                        yield row
+
+
+def write_results(rows, stream, output_format='csv', fields=FIELDS):
+    """Writes result rows to an open text stream as CSV or JSON lines, flushing after each row."""
+    if output_format == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            stream.flush()
+    elif output_format == 'json':
+        for row in rows:
+            stream.write(json.dumps(row) + '\n')
+            stream.flush()
+    else:
+        raise ValueError(f"Unknown output format: {output_format}")
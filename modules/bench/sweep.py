@@ -0,0 +1,160 @@
+# modules/bench/sweep.py
+
+"""
+Multiprocess experiment sweep over algorithms x sizes x task counts x seeds.
+
+Scenarios are plain dicts, so they pickle cheaply. Each worker rebuilds its
+environment from the seed, which means grids never cross process boundaries.
+Scenarios are submitted in chunks with a bounded number of chunks in flight.
+Result rows are written to the output stream as soon as their chunk finishes.
+
+    python -m modules.bench.sweep --agent robot --sizes 16 32 --num_tasks 5 10 --seeds 100 \\
+        --output sweep.jsonl
+"""
+
+import os
+import sys
+import time
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.environments.maze_environment import MazeEnvironment
+from modules.agents.robot_agent import RobotAgent
+from modules.agents.maze_agent import MazeAgent
+from modules.search_algorithms.instrumentation import SearchStats
+from modules.bench.search_benchmark import ALGORITHMS, write_results
+
+SWEEP_FIELDS = ['agent', 'algorithm', 'size', 'num_tasks', 'seed', 'nearest_task', 'plan_tour', 'wall_time',
+                'steps', 'tasks_completed', 'solved', 'searches', 'nodes_expanded', 'peak_frontier', 'heap_pushes']
+
+
+def make_scenarios(agent, algorithms, sizes, num_tasks, seeds, nearest_task=False, plan_tour=False):
+    """Yields one scenario dict per combination of the given parameters."""
+    if agent == 'maze':
+        num_tasks = [0]  # Mazes have a single goal and no tasks
+    for algorithm, size, tasks, seed in itertools.product(algorithms, sizes, num_tasks, seeds):
+        yield {'agent': agent, 'algorithm': algorithm, 'size': size, 'num_tasks': tasks,
+               'seed': seed, 'nearest_task': nearest_task, 'plan_tour': plan_tour}
+
+
+def run_scenario(scenario):
+    """Builds the scenario's environment from its seed, runs the agent to completion and returns a result row."""
+    size = scenario['size']
+    stats = SearchStats()
+    t0 = time.perf_counter()
+    if scenario['agent'] == 'robot':
+        env = GridEnvironment(size, num_tasks=scenario['num_tasks'], seed=scenario['seed'])
+        agent = RobotAgent(env.get_start_position(), env.get_tasks(), algorithm=scenario['algorithm'],
+                           nearest_task=scenario['nearest_task'], plan_tour=scenario['plan_tour'],
+                           stats=stats)
+        agent.find_initial_path(env.get_grid())
+        while agent.path:
+            agent.move()
+        tasks_completed = len(agent.completed_tasks)
+        solved = tasks_completed == len(env.get_tasks())
+    elif scenario['agent'] == 'maze':
+        if size % 2 == 0:
+            size += 1  # Mazes need odd dimensions
+        env = MazeEnvironment(size, size, seed=scenario['seed'])
+        agent = MazeAgent((1, 0), (size - 2, size - 1), algorithm=scenario['algorithm'], stats=stats)
+        agent.find_path(env.get_grid())
+        while agent.path:
+            agent.move()
+        tasks_completed = 0
+        solved = agent.position == agent.goal_position
+    else:
+        raise ValueError(f"Unknown agent: {scenario['agent']}")
+
+    row = dict(scenario)
+    row.update({
+        'wall_time': time.perf_counter() - t0,
+        'steps': len(agent.path_traveled),
+        'tasks_completed': tasks_completed,
+        'solved': solved,
+        'searches': stats.searches,  # Tour planning and D* Lite are not counted
+        'nodes_expanded': stats.get('nodes_expanded', 0),
+        'peak_frontier': stats.get('peak_frontier', 0),
+        'heap_pushes': stats.get('heap_pushes'),
+    })
+    return row
+
+
+def run_chunk(chunk):
+    """Worker entry point: runs a list of scenarios and returns their result rows."""
+    return [run_scenario(scenario) for scenario in chunk]
+
+
+def chunked(iterable, chunk_size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_sweep(scenarios, workers=None, chunk_size=16):
+    """
+    Runs scenarios across a process pool and yields result rows as chunks complete.
+
+    At most two chunks per worker are queued at a time, so very large sweeps
+    are never materialised in the executor all at once. With workers=1 the
+    sweep runs in the current process, which is handy for debugging.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunked(scenarios, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from run_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk in itertools.islice(chunks, workers * 2):
+            pending.add(executor.submit(run_chunk, chunk))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.add(executor.submit(run_chunk, chunk))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Multiprocess agent experiment sweep')
+    parser.add_argument('--agent', type=str, default='robot', choices=['robot', 'maze'],
+                        help='Agent to run, RobotAgent on grids or MazeAgent on mazes (default: robot)')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS), help='Algorithms to sweep (default: all)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 32],
+                        help='Grid or maze sizes to sweep (default: 16 32)')
+    parser.add_argument('--num_tasks', type=int, nargs='+', default=[5],
+                        help='Task counts to sweep, robot agent only (default: 5)')
+    parser.add_argument('--seeds', type=int, default=10, help='Number of seeds per combination (default: 10)')
+    parser.add_argument('--first_seed', type=int, default=0, help='First seed of the sweep (default: 0)')
+    parser.add_argument('--nearest_task', action='store_true', help='Use nearest-task-first robots')
+    parser.add_argument('--plan_tour', action='store_true', help='Use robots that plan their whole task tour up front')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunk_size', type=int, default=16, help='Scenarios per submitted chunk (default: 16)')
+    parser.add_argument('--format', type=str, default='json', choices=['csv', 'json'],
+                        help='Output format, JSON is written one object per line (default: json)')
+    parser.add_argument('--output', type=str, default=None, help='Output file (default: stdout)')
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    scenarios = make_scenarios(args.agent, args.algorithms, args.sizes, args.num_tasks, seeds,
+                               nearest_task=args.nearest_task, plan_tour=args.plan_tour)
+    rows = run_sweep(scenarios, workers=args.workers, chunk_size=args.chunk_size)
+
+    if args.output:
+        with open(args.output, 'w', newline='') as stream:
+            write_results(rows, stream, args.format, fields=SWEEP_FIELDS)
+    else:
+        write_results(rows, sys.stdout, args.format, fields=SWEEP_FIELDS)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@
 
 import random
 
+from modules.utils.compact_grid import CompactGrid
+
 class GridEnvironment:
-    def __init__(self, size, num_tasks=5):
+    def __init__(self, size, num_tasks=5, seed=None):
         self.size = size
         self.num_tasks = num_tasks
+        # Use the global random module unless a seed is given, so random.seed() still applies
+        self.random = random if seed is None else random.Random(seed)
         self.grid = [[0 for _ in range(size)] for _ in range(size)]
         self.obstacles = []
         self.tasks = []
@@ -16,22 +20,26 @@ class GridEnvironment:
         # Place obstacles randomly
         num_obstacles = int(self.size * self.size * 0.2)  # 20% of the grid cells
         while len(self.obstacles) < num_obstacles:
-            x = random.randint(0, self.size - 1)
-            y = random.randint(0, self.size - 1)
+            x = self.random.randint(0, self.size - 1)
+            y = self.random.randint(0, self.size - 1)
             if self.grid[y][x] == 0 and (x, y) != self.start_position:
                 self.grid[y][x] = 1
                 self.obstacles.append((x, y))
 
         # Place tasks randomly
         while len(self.tasks) < self.num_tasks:
-            x = random.randint(0, self.size - 1)
-            y = random.randint(0, self.size - 1)
+            x = self.random.randint(0, self.size - 1)
+            y = self.random.randint(0, self.size - 1)
             if self.grid[y][x] == 0 and (x, y) != self.start_position and (x, y) not in self.tasks:
                 self.tasks.append((x, y))
 
     def get_grid(self):
         return self.grid
 
+    def get_compact_grid(self):
+        """Returns the grid as a one-byte-per-cell CompactGrid."""
+        return CompactGrid.from_rows(self.grid)
+
     def get_tasks(self):
         return self.tasks
 
@@ -1,63 +1,80 @@
 # modules/environments/maze_environment.py
 
 import random
+from itertools import permutations
+
+from modules.utils.compact_grid import CompactGrid
+
+# Every ordering of the four carving directions (N, S, E, W); picking one at
+# random is equivalent to shuffling the direction list for each cell
+DIRECTION_ORDERS = list(permutations([(0, -1), (0, 1), (1, 0), (-1, 0)]))
+
+# Fraction of the remaining interior walls that are knocked out to create loops
+# when complexity and density are both 1.0
+LOOP_RATE = 0.05
+
 
 class MazeEnvironment:
-    def __init__(self, width, height, complexity=0.75, density=0.75):
+    def __init__(self, width, height, complexity=0.75, density=0.75, seed=None):
         self.width = width  # Number of cells horizontally
         self.height = height  # Number of cells vertically
-        self.grid = [[1 for _ in range(width)] for _ in range(height)]  # Initialize grid with walls
-        self.visited = [[False for _ in range(width)] for _ in range(height)]
         self.complexity = complexity
         self.density = density
+        # Use the global random module unless a seed is given, so random.seed() still applies
+        self.random = random if seed is None else random.Random(seed)
         self.generate_maze()
         self.add_additional_paths()
-        
+
     def generate_maze(self):
-        def carve_passages_from(cx, cy):
-            directions = [('N', (0, -1)), ('S', (0, 1)), ('E', (1, 0)), ('W', (-1, 0))]
-            random.shuffle(directions)
-            self.visited[cy][cx] = True
-            self.grid[cy][cx] = 0  # Mark as passage
+        width, height = self.width, self.height
+        cells = bytearray([1]) * (width * height)  # Initialize grid with walls
+        choose_order = self.random.choice
 
-            for direction, (dx, dy) in directions:
+        # Carve passages with an explicit stack instead of recursion, starting
+        # from the top-left corner (1,1). Each entry keeps an iterator over the
+        # directions that cell has not tried yet.
+        cells[1 * width + 1] = 0
+        stack = [(1, 1, iter(choose_order(DIRECTION_ORDERS)))]
+        while stack:
+            cx, cy, directions = stack[-1]
+            for dx, dy in directions:
                 nx, ny = cx + dx * 2, cy + dy * 2
-                if 0 <= nx < self.width and 0 <= ny < self.height and not self.visited[ny][nx]:
-                    self.grid[cy + dy][cx + dx] = 0  # Remove wall between cells
-                    carve_passages_from(nx, ny)
+                if 0 <= nx < width and 0 <= ny < height and cells[ny * width + nx]:
+                    cells[(cy + dy) * width + cx + dx] = 0  # Remove wall between cells
+                    cells[ny * width + nx] = 0  # Mark as passage
+                    stack.append((nx, ny, iter(choose_order(DIRECTION_ORDERS))))
+                    break
+            else:
+                stack.pop()  # Dead end, backtrack
 
-        # Start maze generation from the top-left corner (1,1)
-        carve_passages_from(1, 1)
+        self.grid = [list(cells[y * width:(y + 1) * width]) for y in range(height)]
 
         # Ensure entrance and exit
         self.grid[0][1] = 0  # Entrance
         self.grid[self.height - 1][self.width - 2] = 0  # Exit
 
     def add_additional_paths(self):
-        # Adjust complexity and density relative to maze size
-        complexity = int(self.complexity * (5 * (self.width + self.height)))
-        density = int(self.density * ((self.width // 2) * (self.height // 2)))
+        # The carved maze is a spanning tree, so every wall between two cells
+        # that is knocked out here adds a loop. Pick them all in one batch.
+        columns = self.width // 2  # Cells per row, at odd x
+        rows = self.height // 2  # Cells per column, at odd y
+        horizontal = (columns - 1) * rows  # Walls between horizontally adjacent cells
+        vertical = columns * (rows - 1)  # Walls between vertically adjacent cells
+        total = max(horizontal, 0) + max(vertical, 0)
+        count = int(self.complexity * self.density * LOOP_RATE * total)
 
-        for i in range(density):
-            x = random.randrange(1, self.width - 1, 2)
-            y = random.randrange(1, self.height - 1, 2)
+        for wall in self.random.sample(range(total), count):
+            if wall < horizontal:
+                row, column = divmod(wall, columns - 1)
+                x, y = 2 * column + 2, 2 * row + 1
+            else:
+                row, column = divmod(wall - horizontal, columns)
+                x, y = 2 * column + 1, 2 * row + 2
             self.grid[y][x] = 0
-            for j in range(complexity):
-                neighbors = []
-                if x > 1:
-                    neighbors.append((x - 2, y))
-                if x < self.width - 2:
-                    neighbors.append((x + 2, y))
-                if y > 1:
-                    neighbors.append((x, y - 2))
-                if y < self.height - 2:
-                    neighbors.append((x, y + 2))
-                if neighbors:
-                    nx, ny = random.choice(neighbors)
-                    if self.grid[ny][nx] == 1:
-                        self.grid[ny][nx] = 0
-                        self.grid[ny + (y - ny) // 2][nx + (x - nx) // 2] = 0
-                        x, y = nx, ny
 
     def get_grid(self):
         return self.grid
+
+    def get_compact_grid(self):
+        """Returns the grid as a one-byte-per-cell CompactGrid."""
+        return CompactGrid.from_rows(self.grid)
@@ -1,8 +1,23 @@
 # modules/search_algorithms/__init__.py
 
-from .uninformed_search import dfs, bfs, ucs
-from .informed_search import astar
+from .uninformed_search import dfs, bfs, ucs, bidirectional_bfs
+from .informed_search import astar, bidirectional_astar, jump_point_search
+from .incremental_search import DStarLite
+from .tour_planning import multi_target_bfs, distance_matrix, plan_tour
+from .path_cache import PathCache
+from .instrumentation import SearchStats
+from .cooperative_search import ReservationTable, cooperative_astar
 from .local_search import hill_climbing, simulated_annealing, generate_individual, fitness, crossover, mutate, select_population
+from .batched_local_search import batched_hill_climbing, batched_simulated_annealing
+from .genetic_algorithm import QueensPopulation, population_fitness
+from .queens import count_conflicts, QueensBoard, FitnessCache
+from .min_conflicts import min_conflicts, parallel_min_conflicts
+from .island_ga import run_islands
 
-__all__ = ['dfs', 'bfs', 'ucs', 'astar', 'hill_climbing', 'simulated_annealing',
-           'generate_individual', 'fitness', 'crossover', 'mutate', 'select_population']
+__all__ = ['dfs', 'bfs', 'ucs', 'astar', 'bidirectional_bfs', 'bidirectional_astar',
+           'jump_point_search', 'DStarLite', 'multi_target_bfs', 'distance_matrix', 'plan_tour', 'PathCache',
+           'SearchStats', 'ReservationTable', 'cooperative_astar',
+           'hill_climbing', 'simulated_annealing', 'batched_hill_climbing', 'batched_simulated_annealing',
+           'generate_individual', 'fitness', 'crossover', 'mutate', 'select_population',
+           'QueensPopulation', 'population_fitness', 'count_conflicts', 'QueensBoard', 'FitnessCache',
+           'min_conflicts', 'parallel_min_conflicts', 'run_islands']
@@ -0,0 +1,172 @@
+# modules/search_algorithms/batched_local_search.py
+
+"""
+Hill climbing and simulated annealing with many walkers advanced at once.
+
+The grid is read as a NumPy view of its CompactGrid cells, and every walker
+is a flat cell index, so one step of all walkers is a handful of array
+operations: pick the moves, look up the cells and the Manhattan distance
+table, and apply the acceptance test to the whole batch. Each step stores
+the direction every walker took (STAY if it did not move) as one byte,
+which is enough to replay the walk of the walker that reached the goal.
+The search stops at the first step a walker arrives. Among the walkers
+that arrived it returns the shortest walk, with its loops erased.
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from modules.utils.compact_grid import as_compact
+from modules.search_algorithms.uninformed_search import record_stats
+
+WALKERS = 1024  # Default number of walkers
+STAY = 4  # Direction recorded for a walker that did not move
+
+
+def exponential_schedule(initial_temperature=1000, cooling_rate=0.99):
+    """The schedule of simulated_annealing: the temperature is multiplied by cooling_rate every step."""
+    return lambda step: initial_temperature * cooling_rate ** step
+
+
+def linear_schedule(initial_temperature=1000, steps=1000):
+    """The temperature falls by the same amount every step and reaches 0 after steps."""
+    return lambda step: initial_temperature * (1 - step / steps)
+
+
+def logarithmic_schedule(initial_temperature=1000, steps=20000):
+    """
+    Slow cooling, T = initial / ln(step + e), for long runs. It would take
+    about e^(initial / T) steps to cool to T, so the temperature drops to 0
+    after steps instead.
+    """
+    return lambda step: initial_temperature / math.log(step + math.e) if step < steps else 0
+
+
+def batched_hill_climbing(start, goal, grid, blocked_positions, grid_size, stats=None, walkers=WALKERS,
+                          max_steps=None, seed=None):
+    """
+    Stochastic hill climbing: every step each walker moves to a random one of
+    its neighbours that is closer to the goal. A walker with none is stuck
+    for good, and the search fails once every walker is stuck.
+    """
+    search = BatchedWalk(start, goal, grid, blocked_positions, grid_size, walkers, seed)
+    if search.done:
+        return search.path
+    h, offsets, cells, rng = search.h, search.offsets, search.cells, search.rng
+    active = np.ones(walkers, dtype=bool)
+    while active.any() and (max_steps is None or search.steps < max_steps):
+        positions = search.positions
+        candidates = positions[:, None] + offsets
+        improving = (cells[candidates] == 0) & (h[candidates] < h[positions][:, None]) & active[:, None]
+        # A random improving direction per walker: the largest random key among the improving ones
+        directions = np.argmax(rng.random(candidates.shape) * improving, axis=1)
+        active &= improving.any(axis=1)
+        if search.advance(np.where(active, directions, STAY), int(active.sum())):
+            break
+    return search.finish(stats)
+
+
+def batched_simulated_annealing(start, goal, grid, blocked_positions, grid_size, stats=None, walkers=WALKERS,
+                                schedule=None, min_temperature=0.1, max_steps=None, seed=None):
+    """
+    Simulated annealing run by many independent walkers. Each step every
+    walker proposes a random direction. The move is accepted if the cell is
+    open and either closer to the goal or passes the Metropolis test
+    exp(delta / T) > u. schedule maps the step number to the temperature
+    (exponential_schedule() by default, the cooling of simulated_annealing).
+    The search ends when the temperature drops to min_temperature or after
+    max_steps steps. All three schedules here reach it, but a custom
+    schedule that may not needs max_steps, or the search never ends when
+    the goal cannot be reached.
+    """
+    search = BatchedWalk(start, goal, grid, blocked_positions, grid_size, walkers, seed)
+    if search.done:
+        return search.path
+    h, offsets, cells, rng = search.h, search.offsets, search.cells, search.rng
+    schedule = schedule or exponential_schedule()
+    while max_steps is None or search.steps < max_steps:
+        temperature = schedule(search.steps)
+        if temperature <= min_temperature:
+            break
+        positions = search.positions
+        directions = rng.integers(0, 4, size=walkers)
+        candidates = positions + offsets[directions]
+        delta = h[positions] - h[candidates]  # Positive when the move gets closer to the goal
+        accept = (cells[candidates] == 0) & (
+            (delta > 0) | (rng.random(walkers) < np.exp(np.minimum(delta, 0) / temperature)))
+        if search.advance(np.where(accept, directions, STAY), walkers):
+            break
+    return search.finish(stats)
+
+
+class BatchedWalk:
+    """The walker positions, the move history and the tables both batched searches share."""
+
+    def __init__(self, start, goal, grid, blocked_positions, grid_size, walkers, seed):
+        if np is None:
+            raise ImportError("NumPy is required for the batched local searches")
+        self.compact = compact = as_compact(grid, blocked_positions, grid_size)
+        # Searches return path right away when done is already set
+        self.done = not (compact.contains(start) and compact.contains(goal)) or start == goal
+        self.path = [start] if start == goal else None
+        if self.done:
+            return
+        self.cells = np.frombuffer(compact.cells, dtype=np.uint8)
+        self.offsets = np.array(compact.offsets, dtype=np.intp)
+        self.start_index = compact.index(start)
+        self.goal_index = compact.index(goal)
+        # Manhattan distance to the goal of every cell, border included
+        rows, columns = np.divmod(np.arange(len(compact.cells), dtype=np.intp), compact.stride)
+        goal_row, goal_column = divmod(self.goal_index, compact.stride)
+        self.h = np.abs(rows - goal_row) + np.abs(columns - goal_column)
+        self.rng = np.random.default_rng(seed)
+        self.positions = np.full(walkers, self.start_index, dtype=np.intp)
+        self.moves = []  # One uint8 array of directions per step
+        self.steps = 0
+        self.walker_steps = 0
+        self.arrived = None
+
+    def advance(self, directions, active):
+        """Applies one step of directions and returns True once a walker has reached the goal."""
+        directions = directions.astype(np.uint8)
+        moving = directions != STAY
+        self.positions[moving] += self.offsets[directions[moving]]
+        self.moves.append(directions)
+        self.steps += 1
+        self.walker_steps += active
+        arrived = np.flatnonzero(self.positions == self.goal_index)
+        if len(arrived):
+            self.arrived = arrived
+            return True
+        return False
+
+    def finish(self, stats):
+        record_stats(stats, self.walker_steps, len(self.positions), neighbor_calls=self.walker_steps)
+        if self.arrived is None:
+            return None
+        history = np.stack(self.moves)
+        lengths = (history[:, self.arrived] != STAY).sum(axis=0)
+        walker = self.arrived[int(lengths.argmin())]
+        directions = history[:, walker]
+        indexes = self.start_index + np.cumsum(self.offsets[directions[directions != STAY]])
+        return erase_loops([self.compact.position(self.start_index)] +
+                           [self.compact.position(int(index)) for index in indexes])
+
+
+def erase_loops(walk):
+    """Cuts every loop out of a walk, leaving a simple path between the same end points."""
+    path = []
+    seen = {}
+    for position in walk:
+        if position in seen:
+            for dropped in path[seen[position] + 1:]:
+                del seen[dropped]
+            del path[seen[position] + 1:]
+        else:
+            seen[position] = len(path)
+            path.append(position)
+    return path
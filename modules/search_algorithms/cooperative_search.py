@@ -0,0 +1,267 @@
+# modules/search_algorithms/cooperative_search.py
+
+"""
+Cooperative A* for many agents sharing one grid.
+
+Agents plan one after another in space-time: a search state is a cell at a
+time step, and waiting in place is a move like any other. Every planned
+path is written into a ReservationTable, so the agents that plan later
+route around the cells, and the swaps across an edge, that earlier agents
+have claimed. An agent that has arrived stays parked on its cell until it
+plans again, and a goal is only accepted once no other agent needs the
+cell afterwards, so parked agents never block a path that was planned
+before them.
+"""
+
+from array import array
+from collections import deque
+import heapq
+
+from modules.utils.compact_grid import WALL, as_compact
+from modules.search_algorithms.uninformed_search import UNVISITED, record_stats
+from modules.search_algorithms.instrumentation import expansion_listener
+
+
+class ReservationTable:
+    """
+    Space-time reservations keyed by the flat cell indexes of a CompactGrid.
+
+    Path cells are held for single time steps; a parked agent holds its cell
+    from a time step onwards. Each agent's reservations are tracked so that
+    release() can drop them before the agent plans again.
+    """
+
+    def __init__(self):
+        self.cells = {}  # (time, index) -> agent
+        self.edges = {}  # (time, from index, to index) -> agent moving between time and time + 1
+        self.parked = {}  # index -> (time, agent) that stays on the cell from time onwards
+        self.latest = {}  # index -> last time step any path held the cell
+        self.owned = {}  # agent -> (cell keys, edge keys, parked index)
+
+    def is_free(self, index, time, agent):
+        owner = self.cells.get((time, index))
+        if owner is not None and owner != agent:
+            return False
+        park = self.parked.get(index)
+        return park is None or park[1] == agent or time < park[0]
+
+    def can_move(self, from_index, to_index, time, agent):
+        """True if agent may move from from_index at time to to_index at time + 1."""
+        if not self.is_free(to_index, time + 1, agent):
+            return False
+        owner = self.edges.get((time, to_index, from_index))
+        return owner is None or owner == agent  # Two agents may not swap cells
+
+    def is_goal_free(self, index, time, agent):
+        """True if agent can arrive at index at time and stay there for good."""
+        if self.latest.get(index, -1) >= time:
+            return False  # Conservative: the entry may belong to a path that was since released
+        park = self.parked.get(index)
+        return park is None or park[1] == agent
+
+    def reserve(self, agent, indexes, start_time):
+        """Reserves a path of cell indexes, one per time step from start_time, and parks agent at its end."""
+        self.release(agent)
+        cell_keys, edge_keys = [], []
+        previous = None
+        for time, index in enumerate(indexes, start_time):
+            key = (time, index)
+            self.cells[key] = agent
+            cell_keys.append(key)
+            if self.latest.get(index, -1) < time:
+                self.latest[index] = time
+            if previous is not None and previous != index:
+                key = (time - 1, previous, index)
+                self.edges[key] = agent
+                edge_keys.append(key)
+            previous = index
+        self.parked[previous] = (start_time + len(indexes) - 1, agent)
+        self.owned[agent] = (cell_keys, edge_keys, previous)
+
+    def park(self, agent, index, time):
+        """Parks agent on index from time onwards, dropping its other reservations."""
+        self.reserve(agent, [index], time)
+
+    def release(self, agent):
+        owned = self.owned.pop(agent, None)
+        if owned is None:
+            return
+        cell_keys, edge_keys, parked_index = owned
+        for key in cell_keys:
+            if self.cells.get(key) == agent:
+                del self.cells[key]
+        for key in edge_keys:
+            if self.edges.get(key) == agent:
+                del self.edges[key]
+        park = self.parked.get(parked_index)
+        if park is not None and park[1] == agent:
+            del self.parked[parked_index]
+
+
+def label_components(compact):
+    """
+    Returns an array('i') that gives every open cell index the label of its
+    4-connected component, and UNVISITED for walls. Two cells are reachable
+    from each other exactly when their labels match.
+    """
+    cells, offsets = compact.cells, compact.offsets
+    labels = array('i', [UNVISITED]) * len(cells)
+    label = 0
+    for index in range(len(cells)):
+        if cells[index] or labels[index] != UNVISITED:
+            continue
+        labels[index] = label
+        queue = deque([index])
+        while queue:
+            vertex = queue.popleft()
+            for offset in offsets:
+                neighbor = vertex + offset
+                if not cells[neighbor] and labels[neighbor] == UNVISITED:
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+        label += 1
+    return labels
+
+
+class GoalDistances:
+    """
+    True distances to one goal, ignoring the other agents, used as the
+    heuristic of cooperative_astar. They come from a reverse A* that runs
+    from the goal towards the start and is resumed only until the cell
+    asked about is closed, so cells away from the route to the start are
+    rarely searched at all.
+    """
+
+    def __init__(self, compact, goal_index, start_index):
+        self.cells, self.offsets, self.stride = compact.cells, compact.offsets, compact.stride
+        self.start_y, self.start_x = divmod(start_index, self.stride)
+        self.distances = array('i', [UNVISITED]) * len(compact.cells)
+        self.closed = bytearray(len(compact.cells))
+        self.distances[goal_index] = 0
+        self.open_set = [(self.heuristic(goal_index), 0, goal_index)]  # (f, -distance, index)
+        self.expanded = 0
+
+    def heuristic(self, index):
+        y, x = divmod(index, self.stride)
+        return abs(x - self.start_x) + abs(y - self.start_y)
+
+    def get(self, index):
+        """Returns the distance from index to the goal, or UNVISITED if the goal cannot be reached."""
+        closed = self.closed
+        if closed[index]:
+            return self.distances[index]
+        distances, cells, offsets, open_set = self.distances, self.cells, self.offsets, self.open_set
+        while open_set:
+            (_, distance, vertex) = heapq.heappop(open_set)
+            if closed[vertex]:
+                continue  # Stale entry left behind by a cheaper push
+            closed[vertex] = 1
+            self.expanded += 1
+            distance = -distance
+            for offset in offsets:
+                neighbor = vertex + offset
+                if not cells[neighbor] and not closed[neighbor] and (
+                        distances[neighbor] == UNVISITED or distance + 1 < distances[neighbor]):
+                    distances[neighbor] = distance + 1
+                    # Ties prefer the larger distance, which is closer to the start
+                    heapq.heappush(open_set, (distance + 1 + self.heuristic(neighbor), -distance - 1, neighbor))
+            if vertex == index:
+                return distance
+        return UNVISITED
+
+
+def cooperative_astar(start, goal, grid, blocked_positions, grid_size, reservations, agent,
+                      start_time=0, max_delay=None, max_expansions=None, stats=None):
+    """
+    Space-time A* from start at start_time to goal that respects the
+    reservations of the other agents.
+
+    Returns one (x, y) position per time step from start_time to the arrival,
+    where a repeated position is a wait, or None if the goal cannot be
+    reached within max_delay steps over its true distance (by default the
+    grid's width plus height) or within max_expansions expansions. The
+    cells other agents are parked on, or will park on once they arrive, are
+    walls for the whole search, heuristic included. That gives up slipping
+    through such a cell before its agent arrives, but keeps a detour around
+    parked agents as cheap as a static one. The path is not reserved; pass
+    its cell indexes to reservations.reserve() to claim it.
+    """
+    compact = as_compact(grid, blocked_positions, grid_size)
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    cells, offsets = compact.cells, compact.offsets
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    if cells[goal_index]:
+        return None
+    park = reservations.parked.get(goal_index)
+    if park is not None and park[1] != agent:
+        return None  # Another agent stays on the goal
+    if compact is grid:
+        compact = compact.copy()
+    for index, (_, owner) in reservations.parked.items():
+        if owner != agent:
+            compact.cells[index] = WALL
+    compact.touch()
+    cells = compact.cells
+    distance = GoalDistances(compact, goal_index, start_index).get
+    start_distance = distance(start_index)
+    if start_distance == UNVISITED:
+        return None
+    if max_delay is None:
+        max_delay = compact.width + compact.height
+    deadline = start_time + start_distance + max_delay
+    # The goal cannot be taken for good before the last path through it has passed
+    earliest = reservations.latest.get(goal_index, -1) + 1
+    if earliest > deadline:
+        return None
+    moves = (0,) + offsets  # Waiting is a move too
+    is_free, can_move = reservations.is_free, reservations.can_move
+
+    came_from = {(start_time, start_index): None}
+    # Ties on f prefer the later time step, which is the deeper state
+    open_set = [(max(start_time + start_distance, earliest), -start_time, start_index)]
+    expanded = peak_frontier = 0
+    heap_pushes = 1
+    on_expand = expansion_listener(stats)
+
+    while open_set:
+        if len(open_set) > peak_frontier:
+            peak_frontier = len(open_set)
+        (_, time, current) = heapq.heappop(open_set)
+        time = -time
+        if current == goal_index and reservations.is_goal_free(current, time, agent):
+            record_stats(stats, expanded, peak_frontier, heap_pushes)
+            path = []
+            state = (time, current)
+            while state is not None:
+                path.append(compact.position(state[1]))
+                state = came_from[state]
+            path.reverse()
+            return path
+        if expanded == max_expansions:
+            break
+        expanded += 1
+        if on_expand is not None:
+            on_expand(compact.position(current))
+
+        next_time = time + 1
+        for offset in moves:
+            neighbor = current + offset
+            if cells[neighbor] or (next_time, neighbor) in came_from:
+                continue
+            f_score = next_time + distance(neighbor)
+            if f_score > deadline:
+                continue
+            if f_score < earliest:
+                f_score = earliest
+            if offset == 0:
+                if not is_free(neighbor, next_time, agent):
+                    continue
+            elif not can_move(current, neighbor, time, agent):
+                continue
+            came_from[(next_time, neighbor)] = (time, current)
+            heapq.heappush(open_set, (f_score, -next_time, neighbor))
+            heap_pushes += 1
+    record_stats(stats, expanded, peak_frontier, heap_pushes)
+    return None
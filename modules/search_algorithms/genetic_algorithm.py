@@ -0,0 +1,118 @@
+# modules/search_algorithms/genetic_algorithm.py
+
+"""
+Vectorized genetic algorithm for the N-Queens problem.
+
+A population of P individuals for N queens is one (P, N) NumPy array. Row p
+is an individual and genes[p, column] is the row of the queen in that
+column, the same encoding local_search.generate_individual returns. Fitness
+is the number of non-attacking queen pairs, N * (N - 1) / 2 for a solution,
+and is computed for the whole population at once by counting how many
+queens share each row, diagonal and anti-diagonal.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from modules.search_algorithms.queens import max_fitness
+
+# Population parameters
+POPULATION_SIZE = 100
+MUTATION_RATE = 0.1
+
+
+def population_fitness(genes):
+    """Returns the fitness of every row of a (P, N) array of individuals."""
+    if np is None:
+        raise ImportError("NumPy is required for population_fitness()")
+    genes = np.asarray(genes, dtype=np.int64)
+    size, n = genes.shape
+    columns = np.arange(n)
+    width = 2 * n - 1  # Number of diagonals; rows only use the first n slots
+    base = (np.arange(size) * width)[:, None]  # Gives every individual its own histogram
+    conflicts = np.zeros(size, dtype=np.int64)
+    # Two queens in different columns share at most one of these lines
+    for lines in (genes, genes - columns + n - 1, genes + columns):
+        counts = np.bincount((lines + base).ravel(), minlength=size * width).reshape(size, width)
+        conflicts += (counts * (counts - 1) // 2).sum(axis=1)
+    return max_fitness(n) - conflicts
+
+
+class QueensPopulation:
+    """
+    An N-Queens GA population that evolves one generation per step().
+
+    Each generation keeps the elite fittest individuals, and fills the rest
+    of the population with one-point crossovers of parents picked by
+    tournament selection. A child then has one random gene replaced with
+    probability mutation_rate. Every stage is a whole-array operation, so
+    a generation costs a handful of NumPy calls whatever P and N are.
+    """
+
+    def __init__(self, n=8, size=POPULATION_SIZE, mutation_rate=MUTATION_RATE, tournament_size=2, elite=1,
+                 seed=None, genes=None):
+        if np is None:
+            raise ImportError("NumPy is required for QueensPopulation")
+        self.rng = np.random.default_rng(seed)
+        if genes is None:
+            genes = self.rng.integers(0, n, size=(size, n))
+        self.genes = np.asarray(genes, dtype=np.int32)
+        self.n = self.genes.shape[1]
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.elite = min(elite, len(self.genes))
+        self.max_fitness = max_fitness(self.n)
+        self.scores = population_fitness(self.genes)
+        self.generation = 0
+
+    @classmethod
+    def from_individuals(cls, individuals, **kwargs):
+        """Builds a population from a list of list individuals."""
+        return cls(genes=individuals, **kwargs)
+
+    def __len__(self):
+        return len(self.genes)
+
+    def best(self):
+        """Returns the fittest individual as a list and its fitness."""
+        index = int(self.scores.argmax())
+        return self.genes[index].tolist(), int(self.scores[index])
+
+    def solved(self):
+        return int(self.scores.max()) == self.max_fitness
+
+    def step(self):
+        """Replaces the population with the next generation."""
+        rng, genes, scores = self.rng, self.genes, self.scores
+        size, n = genes.shape
+        children = size - self.elite
+
+        # Tournament selection: each parent is the fittest of tournament_size random picks
+        picks = rng.integers(0, size, size=(2, children, self.tournament_size))
+        winners = np.take_along_axis(picks, scores[picks].argmax(axis=2)[..., None], axis=2)[..., 0]
+
+        # One-point crossover: the head of the first parent and the tail of the second
+        points = rng.integers(0, n, size=(children, 1))
+        offspring = np.where(np.arange(n) < points, genes[winners[0]], genes[winners[1]])
+
+        mutants = np.flatnonzero(rng.random(children) < self.mutation_rate)
+        offspring[mutants, rng.integers(0, n, size=len(mutants))] = rng.integers(0, n, size=len(mutants))
+
+        if self.elite:
+            elite = np.argpartition(scores, size - self.elite)[size - self.elite:]
+            self.genes = np.concatenate((genes[elite], offspring))
+            self.scores = np.concatenate((scores[elite], population_fitness(offspring)))
+        else:
+            self.genes = offspring
+            self.scores = population_fitness(offspring)
+        self.generation += 1
+
+    def evolve(self, max_generations):
+        """Steps until a solution appears or max_generations have run. Returns whether it was solved."""
+        for _ in range(max_generations):
+            if self.solved():
+                return True
+            self.step()
+        return self.solved()
@@ -0,0 +1,168 @@
+# modules/search_algorithms/incremental_search.py
+
+"""
+D* Lite incremental planner for 4-connected grids with unit step costs.
+
+The planner searches backwards from the goal and keeps its g/rhs tables
+between calls. When a few cells change, only the vertices whose
+shortest-path distance is affected are repaired, so there is no full
+re-search. The agent's moves are handled with the key modifier km, as in
+Koenig and Likhachev's optimised D* Lite.
+"""
+
+import heapq
+from array import array
+
+from modules.utils.compact_grid import as_compact
+
+INFINITY = float('inf')
+
+
+class DStarLite:
+    def __init__(self, start, goal, grid, blocked_positions=(), grid_size=None):
+        self.grid = grid  # Source grid, re-read by update_cells
+        self.compact = as_compact(grid, blocked_positions, grid_size)
+        if self.compact is grid:
+            self.compact = grid.copy()  # Keep our own copy so edits are seen as changes
+        self.blocked_positions = set(blocked_positions)
+        size = len(self.compact.cells)
+        self.g = array('d', [INFINITY]) * size
+        self.rhs = array('d', [INFINITY]) * size
+        self.queue = []  # Heap of (k1, k2, index), with stale entries skipped on pop
+        self.queued = {}  # index -> current key of the vertices in the queue
+        self.km = 0
+        self.start = self.compact.index(start)
+        self.last = self.start
+        self.goal = self.compact.index(goal)
+        self.vertex_updates = 0  # Number of vertices expanded, over all calls
+        self.rhs[self.goal] = 0
+        self.push(self.goal)
+        self.compute_shortest_path()
+
+    def heuristic(self, a, b):
+        stride = self.compact.stride
+        ay, ax = divmod(a, stride)
+        by, bx = divmod(b, stride)
+        return abs(ax - bx) + abs(ay - by)
+
+    def calculate_key(self, index):
+        best = min(self.g[index], self.rhs[index])
+        return (best + self.heuristic(self.start, index) + self.km, best)
+
+    def push(self, index):
+        key = self.calculate_key(index)
+        self.queued[index] = key
+        heapq.heappush(self.queue, (key[0], key[1], index))
+
+    def top(self):
+        """Returns (key, index) of the best live queue entry, or (None, None) if the queue is empty."""
+        queue = self.queue
+        while queue:
+            k1, k2, index = queue[0]
+            if self.queued.get(index) == (k1, k2):
+                return (k1, k2), index
+            heapq.heappop(queue)  # Stale entry
+        return None, None
+
+    def best_successor_cost(self, index):
+        cells = self.compact.cells
+        if cells[index]:
+            return INFINITY
+        g = self.g
+        best = INFINITY
+        for offset in self.compact.offsets:
+            neighbor = index + offset
+            if not cells[neighbor] and g[neighbor] + 1 < best:
+                best = g[neighbor] + 1
+        return best
+
+    def update_vertex(self, index):
+        if self.g[index] != self.rhs[index]:
+            self.push(index)
+        else:
+            self.queued.pop(index, None)
+
+    def compute_shortest_path(self):
+        g, rhs, offsets, cells = self.g, self.rhs, self.compact.offsets, self.compact.cells
+        while True:
+            key, u = self.top()
+            if key is None:
+                return
+            start_key = self.calculate_key(self.start)
+            if key >= start_key and rhs[self.start] <= g[self.start]:
+                return
+            self.vertex_updates += 1
+            new_key = self.calculate_key(u)
+            if key < new_key:
+                self.push(u)
+            elif g[u] > rhs[u]:
+                g[u] = rhs[u]
+                del self.queued[u]
+                for offset in offsets:
+                    s = u + offset
+                    if s != self.goal and not cells[s] and not cells[u]:
+                        if g[u] + 1 < rhs[s]:
+                            rhs[s] = g[u] + 1
+                            self.update_vertex(s)
+            else:
+                g_old = g[u]
+                g[u] = INFINITY
+                for s in [u + offset for offset in offsets] + [u]:
+                    if s != self.goal and (rhs[s] == g_old + 1 or s == u):
+                        rhs[s] = self.best_successor_cost(s)
+                    self.update_vertex(s)
+
+    def move_to(self, position):
+        """Records that the agent now stands at position."""
+        self.start = self.compact.index(position)
+
+    def update_cells(self, changed):
+        """
+        Re-reads the given (x, y) positions from the source grid and repairs
+        the g/rhs tables around the ones whose value actually changed.
+        """
+        compact = self.compact
+        affected = set()
+        for position in changed:
+            if not compact.contains(position):
+                continue
+            x, y = position
+            value = 1 if self.grid[y][x] or position in self.blocked_positions else 0
+            index = compact.index(position)
+            if compact.cells[index] != value:
+                compact.set(x, y, value)
+                affected.add(index)
+                affected.update(index + offset for offset in compact.offsets)
+        if not affected:
+            return False
+        self.km += self.heuristic(self.last, self.start)
+        self.last = self.start
+        for index in affected:
+            if index != self.goal and not self.is_border(index):
+                self.rhs[index] = self.best_successor_cost(index)
+                self.update_vertex(index)
+        self.compute_shortest_path()
+        return True
+
+    def is_border(self, index):
+        y, x = divmod(index, self.compact.stride)
+        return x == 0 or y == 0 or x == self.compact.stride - 1 or y == self.compact.height + 1
+
+    def find_path(self):
+        """Returns the current shortest path from the agent to the goal, or None if there is none."""
+        if self.rhs[self.start] == INFINITY:
+            return None
+        compact, g, cells = self.compact, self.g, self.compact.cells
+        path = [compact.position(self.start)]
+        index = self.start
+        while index != self.goal:
+            best, best_cost = None, INFINITY
+            for offset in compact.offsets:
+                neighbor = index + offset
+                if not cells[neighbor] and g[neighbor] + 1 < best_cost:
+                    best, best_cost = neighbor, g[neighbor] + 1
+            if best is None:
+                return None
+            index = best
+            path.append(compact.position(index))
+        return path
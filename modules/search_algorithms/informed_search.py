@@ -1,30 +1,303 @@
 # modules/search_algorithms/informed_search.py
 
+from array import array
 import heapq
 
+from modules.search_algorithms.uninformed_search import (
+    UNVISITED, BATCH_SIZE, parent_table, reconstruct_path, record_stats, join_paths, run_steps
+)
+from modules.utils.compact_grid import CompactGrid, as_compact
+from modules.search_algorithms.instrumentation import expansion_listener
 
-def astar(start, goal, grid, blocked_positions, grid_size):
+
+def astar(start, goal, grid, blocked_positions, grid_size, stats=None):
+    return run_steps(astar_steps(start, goal, grid, blocked_positions, grid_size, batch_size=None, stats=stats))
+
+
+def astar_steps(start, goal, grid, blocked_positions, grid_size, batch_size=BATCH_SIZE, stats=None):
+    compact = as_compact(grid, blocked_positions, grid_size)
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    cells, offsets, stride, position = compact.cells, compact.offsets, compact.stride, compact.position
+    came_from = parent_table(compact)
+    g_scores = array('i', [UNVISITED]) * len(came_from)
+    closed_set = bytearray(len(came_from))
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    goal_y, goal_x = divmod(goal_index, stride)
+    came_from[start_index] = start_index
+    g_scores[start_index] = 0
     open_set = []
-    heapq.heappush(open_set, (0, start, [start]))
-    g_scores = {start: 0}
-    f_scores = {start: heuristic(start, goal)}
+    heapq.heappush(open_set, (heuristic(start, goal), start_index))
+    expanded = peak_frontier = 0
+    heap_pushes = 1
+    path = None
+    on_expand = expansion_listener(stats)
+    expanded_batch, frontier_batch = ([], []) if batch_size else (None, None)
 
     while open_set:
-        (_, current, path) = heapq.heappop(open_set)
-        if current == goal:
-            return path
-
-        neighbors = get_neighbors(current, grid, blocked_positions, grid_size)
-        for neighbor in neighbors:
-            tentative_g_score = g_scores[current] + 1
-            if neighbor in blocked_positions:
+        if len(open_set) > peak_frontier:
+            peak_frontier = len(open_set)
+        (_, current) = heapq.heappop(open_set)
+        if closed_set[current]:
+            continue  # Stale entry left behind by a cheaper push
+        if current == goal_index:
+            path = reconstruct_path(came_from, goal_index, compact)
+            break
+        closed_set[current] = 1
+        expanded += 1
+        if on_expand is not None:
+            on_expand(position(current))
+
+        tentative_g_score = g_scores[current] + 1
+        for offset in offsets:
+            neighbor = current + offset
+            if cells[neighbor]:
                 continue
-            if neighbor not in g_scores or tentative_g_score < g_scores[neighbor]:
+            if g_scores[neighbor] == UNVISITED or tentative_g_score < g_scores[neighbor]:
                 g_scores[neighbor] = tentative_g_score
-                f_score = tentative_g_score + heuristic(neighbor, goal)
-                f_scores[neighbor] = f_score
-                heapq.heappush(open_set, (f_score, neighbor, path + [neighbor]))
-    return None
+                came_from[neighbor] = current
+                ny, nx = divmod(neighbor, stride)
+                f_score = tentative_g_score + abs(nx - goal_x) + abs(ny - goal_y)
+                heapq.heappush(open_set, (f_score, neighbor))
+                heap_pushes += 1
+                if frontier_batch is not None:
+                    frontier_batch.append(position(neighbor))
+        if expanded_batch is not None:
+            expanded_batch.append(position(current))
+            if len(expanded_batch) >= batch_size:
+                yield expanded_batch, frontier_batch
+                expanded_batch, frontier_batch = [], []
+    if expanded_batch or frontier_batch:
+        yield expanded_batch, frontier_batch
+    record_stats(stats, expanded, peak_frontier, heap_pushes)
+    return path
+
+
+def bidirectional_astar(start, goal, grid, blocked_positions, grid_size, stats=None):
+    """
+    A* run from both ends at once with the balanced (average) potential
+    p(v) = (h(v, goal) - h(v, start)) / 2, so both searches share one
+    consistent heuristic. Keys are doubled to stay integral: the forward key
+    is 2g + h(v, goal) - h(v, start) and the backward key is its mirror.
+    The search stops once the two smallest keys add up to at least twice
+    the best meeting length found so far, which guarantees a shortest path.
+    """
+    return run_steps(bidirectional_astar_steps(start, goal, grid, blocked_positions, grid_size,
+                                               batch_size=None, stats=stats))
+
+
+def bidirectional_astar_steps(start, goal, grid, blocked_positions, grid_size, batch_size=BATCH_SIZE, stats=None):
+    compact = as_compact(grid, blocked_positions, grid_size)
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    cells, offsets, stride, position = compact.cells, compact.offsets, compact.stride, compact.position
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    if start_index == goal_index:
+        record_stats(stats, 0, 1)
+        return [start]
+    if cells[goal_index]:
+        return None  # The goal can never be entered
+    size = len(cells)
+    came_from = (parent_table(compact), parent_table(compact))  # Forward, backward
+    g_scores = (array('i', [UNVISITED]) * size, array('i', [UNVISITED]) * size)
+    closed_sets = (bytearray(size), bytearray(size))
+    start_y, start_x = divmod(start_index, stride)
+    goal_y, goal_x = divmod(goal_index, stride)
+    came_from[0][start_index] = start_index
+    came_from[1][goal_index] = goal_index
+    g_scores[0][start_index] = 0
+    g_scores[1][goal_index] = 0
+    h = heuristic(start, goal)
+    open_sets = ([(h, start_index)], [(h, goal_index)])
+    expanded = peak_frontier = 0
+    heap_pushes = 2
+    best = None  # (length, meeting index)
+    on_expand = expansion_listener(stats)
+    expanded_batch, frontier_batch = ([], []) if batch_size else (None, None)
+
+    while True:
+        # Drop stale entries so both heap tops are live keys
+        for side in (0, 1):
+            while open_sets[side] and closed_sets[side][open_sets[side][0][1]]:
+                heapq.heappop(open_sets[side])
+        if not (open_sets[0] and open_sets[1]):
+            break
+        peak_frontier = max(peak_frontier, len(open_sets[0]) + len(open_sets[1]))
+        if best is not None and open_sets[0][0][0] + open_sets[1][0][0] >= 2 * best[0]:
+            break
+
+        side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+        open_set, closed_set = open_sets[side], closed_sets[side]
+        this_g, other_g = g_scores[side], g_scores[1 - side]
+        this_came_from = came_from[side]
+        sign = 1 if side == 0 else -1  # The backward potential is the negated forward one
+
+        (_, current) = heapq.heappop(open_set)
+        closed_set[current] = 1
+        expanded += 1
+        if on_expand is not None:
+            on_expand(position(current))
+
+        tentative_g_score = this_g[current] + 1
+        for offset in offsets:
+            neighbor = current + offset
+            if cells[neighbor]:
+                continue
+            if this_g[neighbor] == UNVISITED or tentative_g_score < this_g[neighbor]:
+                this_g[neighbor] = tentative_g_score
+                this_came_from[neighbor] = current
+                ny, nx = divmod(neighbor, stride)
+                potential = (abs(nx - goal_x) + abs(ny - goal_y)) - (abs(nx - start_x) + abs(ny - start_y))
+                heapq.heappush(open_set, (2 * tentative_g_score + sign * potential, neighbor))
+                heap_pushes += 1
+                if frontier_batch is not None:
+                    frontier_batch.append(position(neighbor))
+                if other_g[neighbor] != UNVISITED:
+                    length = tentative_g_score + other_g[neighbor]
+                    if best is None or length < best[0]:
+                        best = (length, neighbor)
+        if expanded_batch is not None:
+            expanded_batch.append(position(current))
+            if len(expanded_batch) >= batch_size:
+                yield expanded_batch, frontier_batch
+                expanded_batch, frontier_batch = [], []
+
+    if expanded_batch or frontier_batch:
+        yield expanded_batch, frontier_batch
+    record_stats(stats, expanded, peak_frontier, heap_pushes)
+    if best is None:
+        return None
+    return join_paths(came_from[0], best[1], came_from[1], best[1], compact)
+
+
+def jump_point_search(start, goal, grid, blocked_positions, grid_size, stats=None):
+    """
+    Jump Point Search for 4-connected grids with unit step costs.
+
+    A* runs over jump points only. A horizontal scan stops where a cell
+    above or below opens up behind a wall (a forced neighbour). A vertical
+    scan also stops wherever a horizontal scan from that cell would find a
+    jump point. The returned path is filled in cell by cell and has the same
+    length as the one astar finds.
+    """
+    return run_steps(jump_point_search_steps(start, goal, grid, blocked_positions, grid_size,
+                                             batch_size=None, stats=stats))
+
+
+def jump_point_search_steps(start, goal, grid, blocked_positions, grid_size, batch_size=BATCH_SIZE, stats=None):
+    """The frontier batches of jump_point_search hold the jump points it pushes."""
+    compact = as_compact(grid, blocked_positions, grid_size)
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    cells, stride, position = compact.cells, compact.stride, compact.position
+    came_from = parent_table(compact)
+    g_scores = array('i', [UNVISITED]) * len(came_from)
+    closed_set = bytearray(len(came_from))
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    goal_y, goal_x = divmod(goal_index, stride)
+    came_from[start_index] = start_index
+    g_scores[start_index] = 0
+    open_set = [(heuristic(start, goal), start_index)]
+    expanded = peak_frontier = 0
+    heap_pushes = 1
+    path = None
+    on_expand = expansion_listener(stats)
+    expanded_batch, frontier_batch = ([], []) if batch_size else (None, None)
+
+    def jump(node, step):
+        """Scans from node in direction step and returns the first jump point or None."""
+        if step == 1 or step == -1:
+            while True:
+                node += step
+                if cells[node]:
+                    return None
+                if node == goal_index:
+                    return node
+                if (not cells[node - stride] and cells[node - step - stride]) or \
+                        (not cells[node + stride] and cells[node - step + stride]):
+                    return node
+        while True:
+            node += step
+            if cells[node]:
+                return None
+            if node == goal_index:
+                return node
+            if (not cells[node - 1] and cells[node - 1 - step]) or \
+                    (not cells[node + 1] and cells[node + 1 - step]):
+                return node
+            if jump(node, 1) is not None or jump(node, -1) is not None:
+                return node
+
+    while open_set:
+        if len(open_set) > peak_frontier:
+            peak_frontier = len(open_set)
+        (_, current) = heapq.heappop(open_set)
+        if closed_set[current]:
+            continue  # Stale entry left behind by a cheaper push
+        if current == goal_index:
+            path = fill_in_path(reconstruct_path(came_from, goal_index, compact))
+            break
+        closed_set[current] = 1
+        expanded += 1
+        if on_expand is not None:
+            on_expand(position(current))
+
+        parent = came_from[current]
+        if parent == current:
+            directions = (-1, 1, -stride, stride)
+        elif abs(current - parent) < stride:
+            # Arrived horizontally: keep going, or turn up or down
+            step = 1 if current > parent else -1
+            directions = (step, -stride, stride)
+        else:
+            # Arrived vertically: keep going, or turn left or right
+            step = stride if current > parent else -stride
+            directions = (step, -1, 1)
+
+        for step in directions:
+            if cells[current + step]:
+                continue
+            jump_point = jump(current, step)
+            if jump_point is None:
+                continue
+            distance = abs(jump_point - current)
+            if distance >= stride:
+                distance //= stride
+            tentative_g_score = g_scores[current] + distance
+            if g_scores[jump_point] == UNVISITED or tentative_g_score < g_scores[jump_point]:
+                g_scores[jump_point] = tentative_g_score
+                came_from[jump_point] = current
+                ny, nx = divmod(jump_point, stride)
+                f_score = tentative_g_score + abs(nx - goal_x) + abs(ny - goal_y)
+                heapq.heappush(open_set, (f_score, jump_point))
+                heap_pushes += 1
+                if frontier_batch is not None:
+                    frontier_batch.append(position(jump_point))
+        if expanded_batch is not None:
+            expanded_batch.append(position(current))
+            if len(expanded_batch) >= batch_size:
+                yield expanded_batch, frontier_batch
+                expanded_batch, frontier_batch = [], []
+    if expanded_batch or frontier_batch:
+        yield expanded_batch, frontier_batch
+    record_stats(stats, expanded, peak_frontier, heap_pushes)
+    return path
+
+
+def fill_in_path(jump_points):
+    """Expands a list of axis-aligned jump points into a cell-by-cell path."""
+    path = [jump_points[0]]
+    for (x, y) in jump_points[1:]:
+        px, py = path[-1]
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        while (px, py) != (x, y):
+            px, py = px + dx, py + dy
+            path.append((px, py))
+    return path
 
 
 def heuristic(a, b):
@@ -35,6 +308,8 @@ def heuristic(a, b):
 
 
 def get_neighbors(position, grid, blocked_positions, grid_size):
+    if isinstance(grid, CompactGrid):
+        return grid.neighbors(position, blocked_positions, grid_size)
     x, y = position
     neighbors = []
     moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
@@ -0,0 +1,41 @@
+# modules/search_algorithms/instrumentation.py
+
+"""
+Optional instrumentation for the search functions.
+
+Every search takes a stats argument. A plain dict receives the counters of
+that one search, as before. A SearchStats instance is also a dict, but it
+accumulates the counters over every search it is passed to, which is what
+an agent that searches once per task needs. It can stream expansion events
+to an on_expand callback as well. With stats=None the searches only keep a
+few local integers, so instrumentation costs nothing when it is off.
+"""
+
+COUNTERS = ('nodes_expanded', 'peak_frontier', 'heap_pushes', 'neighbor_calls', 'neighbor_time')
+
+
+class SearchStats(dict):
+    def __init__(self, on_expand=None):
+        super().__init__()
+        self.on_expand = on_expand  # Called with each expanded (x, y) position when set
+        self.searches = 0
+
+    def record(self, nodes_expanded, peak_frontier, heap_pushes=None, neighbor_calls=None, neighbor_time=None):
+        """Adds one search's counters to the totals; peak_frontier keeps the maximum."""
+        self.searches += 1
+        self['nodes_expanded'] = self.get('nodes_expanded', 0) + nodes_expanded
+        self['peak_frontier'] = max(self.get('peak_frontier', 0), peak_frontier)
+        if heap_pushes is not None:
+            self['heap_pushes'] = self.get('heap_pushes', 0) + heap_pushes
+        if neighbor_calls is not None:
+            self['neighbor_calls'] = self.get('neighbor_calls', 0) + neighbor_calls
+            self['neighbor_time'] = self.get('neighbor_time', 0.0) + neighbor_time
+
+    def reset(self):
+        self.clear()
+        self.searches = 0
+
+
+def expansion_listener(stats):
+    """Returns the on_expand callback of stats, or None for plain dicts and stats=None."""
+    return getattr(stats, 'on_expand', None)
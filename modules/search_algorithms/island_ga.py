@@ -0,0 +1,162 @@
+# modules/search_algorithms/island_ga.py
+
+"""
+Island-model genetic algorithm for N-Queens across worker processes.
+
+The population is split into islands that evolve independently with the
+list functions of local_search: each generation breeds population_size
+children with crossover and mutate, and select_population keeps the
+fittest of parents and children together. Every migration_interval
+generations an island publishes its best migrants to a SharedMemory block
+and replaces its worst individuals with the migrants its ring neighbour
+published last. The islands are dealt round-robin to the worker processes.
+The first island to reach the maximum fitness sets a shared event, and
+every other island stops at its next generation.
+"""
+
+import os
+import random
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.search_algorithms import local_search
+from modules.search_algorithms.queens import max_fitness
+
+UNPUBLISHED = -1  # Generation slot value of an island that has not published migrants yet
+
+_stop_event = None  # Set in pool workers by init_worker
+_migration_lock = None
+
+
+def init_worker(stop, lock):
+    global _stop_event, _migration_lock
+    _stop_event = stop
+    _migration_lock = lock
+
+
+class MigrationBuffer:
+    """
+    Typed view of the shared block: one published-generation int per island,
+    followed by migrants individuals of n ints per island.
+    """
+
+    def __init__(self, memory, islands, migrants, n):
+        self.memory = memory
+        self.ints = memory.buf.cast('i')
+        self.islands = islands
+        self.migrants = migrants
+        self.n = n
+
+    @staticmethod
+    def size(islands, migrants, n):
+        return 4 * islands * (1 + migrants * n)
+
+    def slot(self, island):
+        start = self.islands + island * self.migrants * self.n
+        return start, start + self.migrants * self.n
+
+    def publish(self, island, generation, individuals):
+        start, end = self.slot(island)
+        self.ints[start:end] = array('i', [row for individual in individuals for row in individual])
+        self.ints[island] = generation
+
+    def read(self, island):
+        """Returns the individuals island published last, or [] if it has not published yet."""
+        if self.ints[island] == UNPUBLISHED:
+            return []
+        start, end = self.slot(island)
+        rows = self.ints[start:end].tolist()
+        return [rows[i:i + self.n] for i in range(0, len(rows), self.n)]
+
+    def close(self):
+        self.ints.release()
+        self.memory.close()
+
+
+def next_generation(population, population_size, rng):
+    """Breeds population_size children and keeps the fittest population_size of parents and children."""
+    children = []
+    while len(children) < population_size:
+        child = local_search.crossover(rng.choice(population), rng.choice(population), rng)
+        local_search.mutate(child, rng)
+        children.append(child)
+    return local_search.select_population(population + children, population_size)
+
+
+def evolve_islands(island_ids, n, islands, population_size, migration_interval, migrants, max_generations,
+                   seed, shared_name, stop=None, lock=None):
+    """
+    Evolves the given islands in turn, one generation each per round.
+    Returns (best individual, fitness, island, generation) of the fittest
+    island, which is the solution if one was found.
+    """
+    stop = stop if stop is not None else _stop_event
+    lock = lock if lock is not None else _migration_lock
+    # A private generator, so an in-process run leaves the caller's random state alone
+    rng = random.Random(seed + island_ids[0])
+    goal = max_fitness(n)
+    buffer = MigrationBuffer(shared_memory.SharedMemory(name=shared_name), islands, migrants, n)
+    try:
+        populations = {island: local_search.select_population(
+            [local_search.generate_individual(n, rng) for _ in range(population_size)], population_size)
+            for island in island_ids}
+        generation = 0
+        while True:
+            for island, population in populations.items():
+                if local_search.fitness(population[0]) == goal:
+                    stop.set()
+                    return population[0], goal, island, generation
+            if generation == max_generations or stop.is_set():
+                break
+            generation += 1
+            for island in island_ids:
+                populations[island] = next_generation(populations[island], population_size, rng)
+            if generation % migration_interval == 0:
+                for island in island_ids:
+                    with lock:
+                        buffer.publish(island, generation, populations[island][:migrants])
+                        arrivals = buffer.read((island - 1) % islands)
+                    if arrivals:
+                        # Migrants replace the worst individuals
+                        populations[island] = local_search.select_population(
+                            populations[island][:population_size - len(arrivals)] + arrivals, population_size)
+        island, population = max(populations.items(), key=lambda item: local_search.fitness(item[1][0]))
+        return population[0], local_search.fitness(population[0]), island, generation
+    finally:
+        buffer.close()
+
+
+def run_islands(n=8, islands=4, workers=None, population_size=local_search.POPULATION_SIZE,
+                migration_interval=10, migrants=2, max_generations=1000, seed=0):
+    """
+    Runs the island model and returns (best individual, fitness, island,
+    generation) of the fittest island when the run stops.
+
+    The islands are split over at most islands worker processes; with
+    workers=1 they all evolve in this process, which is the baseline for
+    measuring speedup against core count.
+    """
+    workers = min(islands, workers or os.cpu_count() or 1)
+    memory = shared_memory.SharedMemory(create=True, size=MigrationBuffer.size(islands, migrants, n))
+    try:
+        buffer = MigrationBuffer(memory, islands, migrants, n)
+        buffer.ints[:islands] = array('i', [UNPUBLISHED]) * islands
+        buffer.ints.release()
+        options = (n, islands, population_size, migration_interval, migrants, max_generations, seed, memory.name)
+        if workers == 1:
+            return evolve_islands(list(range(islands)), *options,
+                                  stop=multiprocessing.Event(), lock=multiprocessing.Lock())
+
+        context = multiprocessing.get_context()
+        stop, lock = context.Event(), context.Lock()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=init_worker, initargs=(stop, lock)) as executor:
+            futures = [executor.submit(evolve_islands, list(range(worker, islands, workers)), *options)
+                       for worker in range(workers)]
+            results = [future.result() for future in futures]
+        return max(results, key=lambda result: result[1])
+    finally:
+        memory.close()
+        memory.unlink()
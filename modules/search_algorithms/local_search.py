@@ -2,40 +2,77 @@
 
 import random
 import math
+import time
+
+from modules.utils.compact_grid import CompactGrid
+from modules.search_algorithms.instrumentation import expansion_listener
+from modules.search_algorithms.uninformed_search import record_stats
+from modules.search_algorithms.genetic_algorithm import np, POPULATION_SIZE, MUTATION_RATE, population_fitness
+from modules.search_algorithms.queens import FitnessCache
 
 # Existing local search algorithms
 
-def hill_climbing(start, goal, grid, blocked_positions, grid_size):
+def hill_climbing(start, goal, grid, blocked_positions, grid_size, stats=None):
     current = start
     path = [current]
+    result = path
+    on_expand = expansion_listener(stats)
+    timed = stats is not None
+    expanded = peak_frontier = 0
+    neighbor_time = 0.0
 
     while current != goal:
+        if timed:
+            t0 = time.perf_counter()
         neighbors = get_neighbors(current, grid, blocked_positions, grid_size)
+        if timed:
+            neighbor_time += time.perf_counter() - t0
+        expanded += 1
+        if on_expand is not None:
+            on_expand(current)
+        if len(neighbors) > peak_frontier:
+            peak_frontier = len(neighbors)
         if not neighbors:
-            return None  # No path found
+            result = None  # No path found
+            break
         next_node = min(neighbors, key=lambda n: heuristic(n, goal))
         if heuristic(next_node, goal) >= heuristic(current, goal):
-            return path  # Local maximum reached
+            break  # Local maximum reached
         current = next_node
         path.append(current)
-    return path
+    record_stats(stats, expanded, peak_frontier, neighbor_calls=expanded, neighbor_time=neighbor_time)
+    return result
 
-def simulated_annealing(start, goal, grid, blocked_positions, grid_size):
+def simulated_annealing(start, goal, grid, blocked_positions, grid_size, stats=None):
     current = start
     path = [current]
     temperature = 1000
     cooling_rate = 0.99
+    on_expand = expansion_listener(stats)
+    timed = stats is not None
+    expanded = peak_frontier = 0
+    neighbor_time = 0.0
 
     while current != goal and temperature > 0.1:
+        if timed:
+            t0 = time.perf_counter()
         neighbors = get_neighbors(current, grid, blocked_positions, grid_size)
+        if timed:
+            neighbor_time += time.perf_counter() - t0
+        expanded += 1
+        if on_expand is not None:
+            on_expand(current)
+        if len(neighbors) > peak_frontier:
+            peak_frontier = len(neighbors)
         if not neighbors:
-            return None  # No path found
+            break  # No path found
         next_node = random.choice(neighbors)
         delta_e = heuristic(current, goal) - heuristic(next_node, goal)
         if delta_e > 0 or math.exp(delta_e / temperature) > random.random():
             current = next_node
             path.append(current)
         temperature *= cooling_rate
+    record_stats(stats, expanded, peak_frontier, neighbor_calls=expanded, neighbor_time=neighbor_time)
     if current == goal:
         return path
     else:
@@ -48,6 +85,8 @@ def heuristic(a, b):
     return abs(x1 - x2) + abs(y1 - y2)
 
 def get_neighbors(position, grid, blocked_positions, grid_size):
+    if isinstance(grid, CompactGrid):
+        return grid.neighbors(position, blocked_positions, grid_size)
     x, y = position
     neighbors = []
     moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
@@ -59,37 +98,37 @@ def get_neighbors(position, grid, blocked_positions, grid_size):
                 neighbors.append((nx, ny))
     return neighbors
 
-# Genetic Algorithm for 8-Queens problem
+# Genetic Algorithm for the N-Queens problem. The functions below work on
+# one list individual at a time; QueensPopulation in genetic_algorithm.py
+# evolves a whole population as one NumPy array.
 
-# Population parameters
-POPULATION_SIZE = 100
-MUTATION_RATE = 0.1
+def generate_individual(n=8, rng=random):
+    """Generates an individual with random queen positions. rng may be a random.Random instance."""
+    return [rng.randint(0, n - 1) for _ in range(n)]
 
-def generate_individual():
-    """Generates an individual with random queen positions."""
-    return [random.randint(0, 7) for _ in range(8)]
+# Survivors are scored again every generation, so scores are memoized
+fitness_cache = FitnessCache()
 
 def fitness(individual):
-    """Calculates the fitness score. Higher is better."""
-    conflicts = 0
-    for i in range(len(individual)):
-        for j in range(i + 1, len(individual)):
-            if individual[i] == individual[j] or abs(individual[i] - individual[j]) == abs(i - j):
-                conflicts += 1
-    return 28 - conflicts  # 28 is the maximum number of non-conflicting pairs
-
-def crossover(parent1, parent2):
+    """Calculates the fitness score (28 for a solved 8-queens board). Higher is better."""
+    return fitness_cache.fitness(individual)
+
+def crossover(parent1, parent2, rng=random):
     """Performs crossover between two parents to create an offspring."""
-    point = random.randint(0, 7)
+    point = rng.randint(0, len(parent1) - 1)
     return parent1[:point] + parent2[point:]
 
-def mutate(individual):
+def mutate(individual, rng=random):
     """Mutates an individual randomly."""
-    if random.random() < MUTATION_RATE:
-        index = random.randint(0, 7)
-        individual[index] = random.randint(0, 7)
+    if rng.random() < MUTATION_RATE:
+        index = rng.randint(0, len(individual) - 1)
+        individual[index] = rng.randint(0, len(individual) - 1)
 
-def select_population(population):
+def select_population(population, size=POPULATION_SIZE):
     """Selects the population based on fitness."""
-    population = sorted(population, key=lambda x: fitness(x), reverse=True)
-    return population[:POPULATION_SIZE]
+    if np is None or not population:
+        population = sorted(population, key=fitness, reverse=True)
+        return population[:size]
+    # Score every individual in one call; the stable sort keeps the order of ties like sorted() does
+    order = np.argsort(-population_fitness(population), kind='stable')
+    return [population[i] for i in order[:size]]
@@ -0,0 +1,150 @@
+# modules/search_algorithms/min_conflicts.py
+
+"""
+Min-conflicts local search for N-Queens, with a multi-start process pool.
+
+The board starts as a permutation, so no two queens share a row. Queens are
+placed column by column on a random unused row whose diagonals are free,
+giving up after a few tries, which leaves only a handful of conflicts even
+for a million queens. The repair phase then picks a conflicted queen and
+swaps rows with whichever of a few sampled partners removes the most
+conflicts. Swaps keep the permutation, and QueensBoard scores each one in
+O(1) from its occupancy counts. The arrays take about BYTES_PER_QUEEN bytes
+per queen, so 1,000,000 queens fit in roughly 30 MB per restart.
+"""
+
+import os
+import random
+import itertools
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from modules.search_algorithms.queens import QueensBoard
+
+# Queens, rows still free and the board's row, diagonal and anti-diagonal counts, as 4-byte ints
+BYTES_PER_QUEEN = 4 * (1 + 1 + 1 + 2 + 2)
+
+STOP_CHECK_INTERVAL = 4096  # Steps between checks of the shared stop event
+
+UNSOLVABLE = (2, 3)  # Board sizes without a solution, where the repair phase would never end
+
+_stop_event = None  # Set in pool workers by init_worker
+
+
+def min_conflicts(n, max_steps=None, seed=None, placement_tries=64, candidates=32, noise=0.2, stop=None):
+    """
+    Returns (queens, steps) for a solved n-queens board, where queens is an
+    array('i') of the row in each column and steps counts repair swaps.
+    Returns None after max_steps repair swaps, or once the stop event
+    (a multiprocessing.Event shared with other restarts) is set, and right
+    away for n = 2 and 3, which have no solution.
+    """
+    if n in UNSOLVABLE:
+        return None
+    rng = random.Random(seed)
+    randrange = rng.randrange
+    board = QueensBoard(n=n)
+    queens, diagonals, anti_diagonals = board.queens, board.diagonals, board.anti_diagonals
+    free_rows = array('i', range(n))  # free_rows[column:] are the rows not used yet
+
+    for column in range(n):
+        if stop is not None and column % STOP_CHECK_INTERVAL == 0 and stop.is_set():
+            return None
+        for _ in range(placement_tries):
+            pick = randrange(column, n)
+            row = free_rows[pick]
+            if not diagonals[row - column + n - 1] and not anti_diagonals[row + column]:
+                break
+        free_rows[pick] = free_rows[column]
+        free_rows[column] = row
+        board.place(column, row)
+    del free_rows
+
+    conflicted = [column for column in range(n) if board.attacks(column, queens[column]) > 3]
+    steps = 0
+    while board.conflicts:
+        if max_steps is not None and steps >= max_steps:
+            return None
+        if stop is not None and steps % STOP_CHECK_INTERVAL == 0 and stop.is_set():
+            return None
+        slot = randrange(len(conflicted))
+        column = conflicted[slot]
+        if board.attacks(column, queens[column]) == 3:
+            # No longer in conflict: drop it from the list
+            conflicted[slot] = conflicted[-1]
+            conflicted.pop()
+            continue
+        steps += 1
+        # Try each sampled partner and keep the swap that removes the most conflicts
+        best_change, best_partner = None, None
+        for _ in range(candidates):
+            partner = randrange(n)
+            if partner == column:
+                continue
+            change = board.swap(column, partner)
+            board.swap(column, partner)
+            if best_change is None or change > best_change or (change == best_change and randrange(2)):
+                best_change, best_partner = change, partner
+        # Take the best swap unless it adds conflicts; a noise share of those is taken anyway to leave plateaus
+        if best_partner is not None and (best_change >= 0 or rng.random() < noise):
+            board.swap(column, best_partner)
+            if board.attacks(best_partner, queens[best_partner]) > 3:
+                conflicted.append(best_partner)
+    return queens, steps
+
+
+def init_worker(stop):
+    global _stop_event
+    _stop_event = stop
+
+
+def run_restart(n, seed, options):
+    """Worker entry point: one min_conflicts restart that gives up when another worker has solved the board."""
+    return seed, min_conflicts(n, seed=seed, stop=_stop_event, **options)
+
+
+def parallel_min_conflicts(n, restarts=None, workers=None, seed=0, memory_budget=None, **options):
+    """
+    Runs independent min_conflicts restarts (seeds seed, seed + 1, ...)
+    across a process pool and returns (queens, seed, steps) from the first
+    one to solve the board, or None once restarts runs have all failed.
+    Other keyword arguments (max_steps, candidates, ...) go to min_conflicts.
+
+    As soon as one restart succeeds a shared event tells the others to stop.
+    memory_budget (bytes) caps the number of concurrent restarts at about
+    BYTES_PER_QUEEN * n each. Without max_steps a restart only ends when it
+    solves the board, so restarts only matter when max_steps is set.
+    With workers=1 the restarts run one after another in this process.
+    Boards of 2 and 3 queens have no solution and return None at once.
+    """
+    if n in UNSOLVABLE:
+        return None
+    workers = workers or os.cpu_count() or 1
+    if memory_budget is not None:
+        workers = max(1, min(workers, memory_budget // (BYTES_PER_QUEEN * n)))
+    seeds = itertools.count(seed) if restarts is None else iter(range(seed, seed + restarts))
+    if workers == 1:
+        for restart_seed in seeds:
+            result = min_conflicts(n, seed=restart_seed, **options)
+            if result is not None:
+                return result[0], restart_seed, result[1]
+        return None
+
+    context = multiprocessing.get_context()
+    stop = context.Event()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_worker, initargs=(stop,)) as executor:
+        pending = set()
+        for restart_seed in itertools.islice(seeds, workers):
+            pending.add(executor.submit(run_restart, n, restart_seed, options))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                restart_seed, result = future.result()
+                if result is not None:
+                    stop.set()
+                    return result[0], restart_seed, result[1]
+                for restart_seed in itertools.islice(seeds, 1):
+                    pending.add(executor.submit(run_restart, n, restart_seed, options))
+    return None
@@ -0,0 +1,133 @@
+# modules/search_algorithms/path_cache.py
+
+"""
+Memoization layer for grid path queries.
+
+Results are keyed on the grid fingerprint, the end points, the blocked
+positions, the grid size and the algorithm name. The in-memory store is an
+LRU bounded both by entry count and by an estimate of the bytes held. An
+optional on-disk shelve file keeps results across runs.
+"""
+
+import sys
+import shelve
+import hashlib
+from collections import OrderedDict
+
+from modules.utils.compact_grid import grid_fingerprint
+
+# Approximate size of one (x, y) tuple of small ints in a cached path
+POSITION_BYTES = sys.getsizeof((0, 0))
+
+NO_PATH = ()  # Stored for queries that have no path, so failures are cached too
+
+
+class PathCache:
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, disk_path=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (path tuple, size in bytes), oldest first
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk = shelve.open(disk_path) if disk_path else None
+
+    @staticmethod
+    def make_key(algorithm, start, goal, grid, blocked_positions, grid_size):
+        return (grid_fingerprint(grid), tuple(start), tuple(goal), algorithm,
+                tuple(sorted(blocked_positions)), grid_size)
+
+    def find_path(self, algorithm, search, start, goal, grid, blocked_positions, grid_size):
+        """
+        Returns the path for a query, running search(start, goal, grid,
+        blocked_positions, grid_size) only on a cache miss. The caller gets
+        a fresh list it may consume.
+        """
+        key = self.make_key(algorithm, start, goal, grid, blocked_positions, grid_size)
+        path = self.get(key)
+        if path is None:
+            path = search(start, goal, grid, blocked_positions, grid_size)
+            self.put(key, path)
+        elif path is NO_PATH:
+            return None
+        return list(path) if path else None
+
+    def find_path_steps(self, algorithm, search_steps, start, goal, grid, blocked_positions, grid_size, **kwargs):
+        """
+        Generator version of find_path for the stepwise searches: on a miss it
+        yields the batches of search_steps(start, goal, grid, blocked_positions,
+        grid_size, **kwargs) and caches the result; a hit yields nothing.
+        Returns the path like find_path.
+        """
+        key = self.make_key(algorithm, start, goal, grid, blocked_positions, grid_size)
+        path = self.get(key)
+        if path is None:
+            path = yield from search_steps(start, goal, grid, blocked_positions, grid_size, **kwargs)
+            self.put(key, path)
+        elif path is NO_PATH:
+            return None
+        return list(path) if path else None
+
+    def get(self, key):
+        """Returns the cached path tuple (NO_PATH if there is none) or None on a miss."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if self.disk is not None:
+            disk_key = self.disk_key(key)
+            if disk_key in self.disk:
+                path = self.disk[disk_key]
+                self.store(key, path)
+                self.hits += 1
+                return path
+        self.misses += 1
+        return None
+
+    def put(self, key, path):
+        path = tuple(path) if path else NO_PATH
+        self.store(key, path)
+        if self.disk is not None:
+            self.disk[self.disk_key(key)] = path
+
+    def store(self, key, path):
+        if key in self.entries:
+            self.current_bytes -= self.entries.pop(key)[1]
+        size = sys.getsizeof(path) + POSITION_BYTES * len(path)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+        self.entries[key] = (path, size)
+        self.current_bytes += size
+        while len(self.entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+
+    @staticmethod
+    def disk_key(key):
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+    def stats(self):
+        """Returns the hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+        }
+
+    def clear(self):
+        """Drops the in-memory entries and resets the counters; the disk store is kept."""
+        self.entries.clear()
+        self.current_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+            self.disk = None
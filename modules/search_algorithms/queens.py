@@ -0,0 +1,157 @@
+# modules/search_algorithms/queens.py
+
+"""
+Conflict counting for N-Queens individuals.
+
+An individual is a list holding, for each column, the row of that column's
+queen. count_conflicts tallies the queens on every row, diagonal and
+anti-diagonal in one pass, so scoring costs O(N) instead of comparing every
+pair. QueensBoard keeps those tallies between moves, which makes the
+fitness change of moving a single queen an O(1) lookup. FitnessCache
+memoizes whole-individual scores for survivors that get scored again.
+"""
+
+import sys
+from array import array
+from collections import OrderedDict
+
+EMPTY = -1  # Row of a column that has no queen yet
+
+
+def max_fitness(n):
+    """The fitness of a solution: every pair of the n queens is non-attacking."""
+    return n * (n - 1) // 2
+
+
+def count_conflicts(individual):
+    """Returns the number of attacking queen pairs."""
+    n = len(individual)
+    rows = array('i', [0]) * n
+    diagonals = array('i', [0]) * (2 * n - 1)
+    anti_diagonals = array('i', [0]) * (2 * n - 1)
+    conflicts = 0
+    for column, row in enumerate(individual):
+        # A queen attacks every queen already placed on its three lines
+        conflicts += rows[row] + diagonals[row - column + n - 1] + anti_diagonals[row + column]
+        rows[row] += 1
+        diagonals[row - column + n - 1] += 1
+        anti_diagonals[row + column] += 1
+    return conflicts
+
+
+class QueensBoard:
+    """
+    An individual together with its row and diagonal occupancy counts.
+
+    Two queens in different columns share at most one line, so the pairs a
+    queen is part of are just the counts of its three lines. delta(), move()
+    and swap() use that to score a change of one or two genes in O(1).
+    QueensBoard(n=n) starts with every column empty, for solvers that
+    place() the queens one column at a time.
+    """
+
+    def __init__(self, individual=None, n=None):
+        n = self.n = len(individual) if individual is not None else n
+        self.queens = array('i', [EMPTY]) * n
+        self.rows = array('i', [0]) * n
+        self.diagonals = array('i', [0]) * (2 * n - 1)  # Indexed by row - column + n - 1
+        self.anti_diagonals = array('i', [0]) * (2 * n - 1)  # Indexed by row + column
+        self.conflicts = 0
+        if individual is not None:
+            for column, row in enumerate(individual):
+                self.place(column, row)
+
+    @property
+    def fitness(self):
+        return max_fitness(self.n) - self.conflicts
+
+    def attacks(self, column, row):
+        """Number of queens on the lines through (column, row), counting a queen standing there three times."""
+        return self.rows[row] + self.diagonals[row - column + self.n - 1] + self.anti_diagonals[row + column]
+
+    def add(self, column, row, count):
+        self.rows[row] += count
+        self.diagonals[row - column + self.n - 1] += count
+        self.anti_diagonals[row + column] += count
+
+    def place(self, column, row):
+        """Puts a queen in an empty column."""
+        self.conflicts += self.attacks(column, row)
+        self.add(column, row, 1)
+        self.queens[column] = row
+
+    def delta(self, column, row):
+        """Fitness change of moving the queen in column to row, without moving it."""
+        current = self.queens[column]
+        if row == current:
+            return 0
+        # The queen never shares a line with its own new square, so only its old lines need the correction
+        return (self.attacks(column, current) - 3) - self.attacks(column, row)
+
+    def move(self, column, row):
+        """Moves the queen in column to row and returns the fitness change."""
+        change = self.delta(column, row)
+        if row != self.queens[column]:
+            self.add(column, self.queens[column], -1)
+            self.add(column, row, 1)
+            self.queens[column] = row
+            self.conflicts -= change
+        return change
+
+    def swap(self, a, b):
+        """Swaps the rows of the queens in columns a and b and returns the fitness change."""
+        row_a = self.queens[a]
+        return self.move(a, self.queens[b]) + self.move(b, row_a)
+
+
+class FitnessCache:
+    """
+    LRU memo of individual fitness keyed by the individual as a tuple. Like
+    PathCache it is bounded both by entry count and by the bytes its keys
+    hold, since a key grows with the number of queens.
+    """
+
+    def __init__(self, max_entries=65536, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # tuple individual -> fitness, oldest first
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def fitness(self, individual):
+        key = tuple(individual)
+        score = self.entries.get(key)
+        if score is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return score
+        self.misses += 1
+        score = max_fitness(len(key)) - count_conflicts(key)
+        size = sys.getsizeof(key)
+        if size <= self.max_bytes:
+            self.entries[key] = score
+            self.current_bytes += size
+            while len(self.entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                evicted, _ = self.entries.popitem(last=False)
+                self.current_bytes -= sys.getsizeof(evicted)
+                self.evictions += 1
+        return score
+
+    def stats(self):
+        """Returns the hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.current_bytes = 0
+        self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,29 @@
+# modules/search_algorithms/stepwise_search.py
+
+"""
+The generator versions of the grid searches, used to animate their progress.
+
+Every search is implemented once, as the *_steps generator next to it in
+uninformed_search.py or informed_search.py; the plain function runs that
+generator with batch_size=None. Each generator yields (expanded, frontier)
+batches of (x, y) positions, batch_size expansions at a time, and returns
+the path. Advancing one batch per frame keeps the work per frame bounded on
+any grid size.
+"""
+
+from modules.search_algorithms.uninformed_search import (
+    BATCH_SIZE, dfs_steps, bfs_steps, ucs_steps, bidirectional_bfs_steps
+)
+from modules.search_algorithms.informed_search import (
+    astar_steps, bidirectional_astar_steps, jump_point_search_steps
+)
+
+STEP_SEARCHES = {
+    'dfs': dfs_steps,
+    'bfs': bfs_steps,
+    'ucs': ucs_steps,
+    'astar': astar_steps,
+    'bibfs': bidirectional_bfs_steps,
+    'biastar': bidirectional_astar_steps,
+    'jps': jump_point_search_steps,
+}
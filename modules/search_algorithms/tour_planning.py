@@ -0,0 +1,157 @@
+# modules/search_algorithms/tour_planning.py
+
+"""
+Obstacle-aware multi-task tour planning.
+
+A breadth-first search from every point fills an all-pairs shortest path
+matrix, and keeps the paths so they can be reused as legs of the tour.
+The tour itself is solved over that matrix, exactly with Held-Karp for
+small task counts and with nearest neighbour plus 2-opt for larger ones.
+"""
+
+from array import array
+from collections import deque
+
+from modules.search_algorithms.uninformed_search import UNVISITED, parent_table, reconstruct_path
+from modules.utils.compact_grid import as_compact
+
+INFINITY = float('inf')
+
+# Largest number of tasks solved exactly with Held-Karp, which is O(2^n * n^2)
+HELD_KARP_LIMIT = 10
+
+
+def multi_target_bfs(start, targets, grid, blocked_positions, grid_size):
+    """
+    Runs a single BFS from start and returns {target: path} for every
+    reachable target. The search stops as soon as all targets are reached.
+    """
+    compact = as_compact(grid, blocked_positions, grid_size)
+    if not compact.contains(start):
+        return {}
+    cells, offsets = compact.cells, compact.offsets
+    came_from = parent_table(compact)
+    start_index = compact.index(start)
+    came_from[start_index] = start_index
+    remaining = {compact.index(target): target for target in targets if compact.contains(target)}
+    found = []
+    queue = deque([start_index])
+
+    while queue and remaining:
+        vertex = queue.popleft()
+        if vertex in remaining:
+            found.append(vertex)
+            del remaining[vertex]
+        for offset in offsets:
+            neighbor = vertex + offset
+            if not cells[neighbor] and came_from[neighbor] == UNVISITED:
+                came_from[neighbor] = vertex
+                queue.append(neighbor)
+    return {compact.position(index): reconstruct_path(came_from, index, compact) for index in found}
+
+
+def distance_matrix(points, grid, blocked_positions, grid_size):
+    """
+    Returns (distances, legs) for a list of points.
+
+    distances[i][j] is the number of moves from points[i] to points[j], or
+    INFINITY if it cannot be reached. legs[(i, j)] is the matching path with
+    both end points included. Only one BFS is run per point, and the path for
+    (j, i) is the reverse of the one found for (i, j).
+    """
+    n = len(points)
+    distances = [[INFINITY] * n for _ in range(n)]
+    legs = {}
+    for i in range(n):
+        distances[i][i] = 0
+        legs[(i, i)] = [points[i]]
+        later = [points[j] for j in range(i + 1, n)]
+        paths = multi_target_bfs(points[i], later, grid, blocked_positions, grid_size) if later else {}
+        for j in range(i + 1, n):
+            path = paths.get(points[j])
+            if path is not None:
+                distances[i][j] = distances[j][i] = len(path) - 1
+                legs[(i, j)] = path
+                legs[(j, i)] = path[::-1]
+    return distances, legs
+
+
+def held_karp(distances):
+    """Returns the shortest open tour that starts at index 0 and visits every index once."""
+    n = len(distances)
+    if n <= 2:
+        return list(range(n))
+    m = n - 1  # Nodes 1..n-1 are encoded as bits 0..m-1
+    full = (1 << m) - 1
+    cost = [array('d', [INFINITY]) * m for _ in range(1 << m)]
+    parent = [array('b', [-1]) * m for _ in range(1 << m)]
+    for j in range(m):
+        cost[1 << j][j] = distances[0][j + 1]
+
+    for mask in range(1, full + 1):
+        row = cost[mask]
+        for j in range(m):
+            if not mask & (1 << j) or row[j] == INFINITY:
+                continue
+            base = row[j]
+            dist_j = distances[j + 1]
+            for k in range(m):
+                if mask & (1 << k):
+                    continue
+                next_mask = mask | (1 << k)
+                candidate = base + dist_j[k + 1]
+                if candidate < cost[next_mask][k]:
+                    cost[next_mask][k] = candidate
+                    parent[next_mask][k] = j
+
+    last = min(range(m), key=lambda j: cost[full][j])
+    order = []
+    mask = full
+    while last != -1:
+        order.append(last + 1)
+        previous = parent[mask][last]
+        mask &= ~(1 << last)
+        last = previous
+    order.append(0)
+    order.reverse()
+    return order
+
+
+def nearest_neighbor_tour(distances):
+    """Builds an open tour from index 0 by always moving to the closest unvisited index."""
+    n = len(distances)
+    tour = [0]
+    unvisited = set(range(1, n))
+    while unvisited:
+        row = distances[tour[-1]]
+        nearest = min(unvisited, key=lambda j: (row[j], j))
+        tour.append(nearest)
+        unvisited.remove(nearest)
+    return tour
+
+
+def two_opt(tour, distances):
+    """Improves an open tour in place by reversing segments while that shortens it; index 0 stays first."""
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            for j in range(i + 1, n):
+                a, b = tour[i - 1], tour[i]
+                c = tour[j]
+                delta = distances[a][c] - distances[a][b]
+                if j + 1 < n:
+                    d = tour[j + 1]
+                    delta += distances[b][d] - distances[c][d]
+                if delta < 0:
+                    tour[i:j + 1] = reversed(tour[i:j + 1])
+                    improved = True
+    return tour
+
+
+def plan_tour(distances, exact_limit=HELD_KARP_LIMIT):
+    """Returns a visiting order over the distance matrix that starts at index 0."""
+    if len(distances) - 1 <= exact_limit:
+        return held_karp(distances)
+    return two_opt(nearest_neighbor_tour(distances), distances)
@@ -1,62 +1,318 @@
 # modules/search_algorithms/uninformed_search.py
 
+"""
+Uninformed grid searches.
+
+Each search is written once, as a *_steps generator that takes the search's
+arguments plus batch_size. With a batch_size it yields (expanded, frontier)
+pairs of (x, y) position lists: the cells expanded since the previous batch
+and the cells pushed onto the frontier, which is what the simulations
+animate. With batch_size=None it collects nothing and never yields. Either
+way the generator returns the path (or None), so callers can write
+path = yield from bfs_steps(...). The plain functions run the generator
+with batch_size=None through run_steps.
+"""
+
+from array import array
 from collections import deque
 import heapq
 
+from modules.utils.compact_grid import CompactGrid, as_compact
+from modules.search_algorithms.instrumentation import SearchStats, expansion_listener
+
+BATCH_SIZE = 64  # Default expansions per yielded batch
+
 
-def dfs(start, goal, grid, blocked_positions, grid_size):
-    stack = [(start, [start])]
-    visited = set()
+def dfs(start, goal, grid, blocked_positions, grid_size, stats=None):
+    return run_steps(dfs_steps(start, goal, grid, blocked_positions, grid_size, batch_size=None, stats=stats))
+
+
+def dfs_steps(start, goal, grid, blocked_positions, grid_size, batch_size=BATCH_SIZE, stats=None):
+    if start in blocked_positions:
+        return None
+    compact = as_compact(grid, blocked_positions, grid_size)
+    cells, offsets, position = compact.cells, compact.offsets, compact.position
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    came_from = parent_table(compact)
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    stack = [(start_index, start_index)]
+    expanded = peak_frontier = 0
+    path = None
+    on_expand = expansion_listener(stats)
+    expanded_batch, frontier_batch = ([], []) if batch_size else (None, None)
 
     while stack:
-        (vertex, path) = stack.pop()
-        if vertex not in visited:
-            if vertex in blocked_positions:
-                continue
-            visited.add(vertex)
-            if vertex == goal:
-                return path
-            neighbors = get_neighbors(vertex, grid, blocked_positions, grid_size)
-            for neighbor in neighbors:
-                stack.append((neighbor, path + [neighbor]))
-    return None
-
-
-def bfs(start, goal, grid, blocked_positions, grid_size):
-    queue = deque([(start, [start])])
-    visited = set([start])
+        if len(stack) > peak_frontier:
+            peak_frontier = len(stack)
+        (vertex, parent) = stack.pop()
+        if came_from[vertex] == UNVISITED:
+            came_from[vertex] = parent
+            if vertex == goal_index:
+                path = reconstruct_path(came_from, goal_index, compact)
+                break
+            expanded += 1
+            if on_expand is not None:
+                on_expand(position(vertex))
+            for offset in offsets:
+                neighbor = vertex + offset
+                if not cells[neighbor]:
+                    stack.append((neighbor, vertex))
+                    if frontier_batch is not None and came_from[neighbor] == UNVISITED:
+                        frontier_batch.append(position(neighbor))
+            if expanded_batch is not None:
+                expanded_batch.append(position(vertex))
+                if len(expanded_batch) >= batch_size:
+                    yield expanded_batch, frontier_batch
+                    expanded_batch, frontier_batch = [], []
+    if expanded_batch or frontier_batch:
+        yield expanded_batch, frontier_batch
+    record_stats(stats, expanded, peak_frontier)
+    return path
+
+
+def bfs(start, goal, grid, blocked_positions, grid_size, stats=None):
+    return run_steps(bfs_steps(start, goal, grid, blocked_positions, grid_size, batch_size=None, stats=stats))
+
+
+def bfs_steps(start, goal, grid, blocked_positions, grid_size, batch_size=BATCH_SIZE, stats=None):
+    compact = as_compact(grid, blocked_positions, grid_size)
+    cells, offsets, position = compact.cells, compact.offsets, compact.position
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    came_from = parent_table(compact)
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    came_from[start_index] = start_index
+    queue = deque([start_index])
+    expanded = peak_frontier = 0
+    path = None
+    on_expand = expansion_listener(stats)
+    expanded_batch, frontier_batch = ([], []) if batch_size else (None, None)
 
     while queue:
-        (vertex, path) = queue.popleft()
-        if vertex == goal:
-            return path
-        neighbors = get_neighbors(vertex, grid, blocked_positions, grid_size)
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
-    return None
+        if len(queue) > peak_frontier:
+            peak_frontier = len(queue)
+        vertex = queue.popleft()
+        if vertex == goal_index:
+            path = reconstruct_path(came_from, goal_index, compact)
+            break
+        expanded += 1
+        if on_expand is not None:
+            on_expand(position(vertex))
+        for offset in offsets:
+            neighbor = vertex + offset
+            if not cells[neighbor] and came_from[neighbor] == UNVISITED:
+                came_from[neighbor] = vertex
+                queue.append(neighbor)
+                if frontier_batch is not None:
+                    frontier_batch.append(position(neighbor))
+        if expanded_batch is not None:
+            expanded_batch.append(position(vertex))
+            if len(expanded_batch) >= batch_size:
+                yield expanded_batch, frontier_batch
+                expanded_batch, frontier_batch = [], []
+    if expanded_batch or frontier_batch:
+        yield expanded_batch, frontier_batch
+    record_stats(stats, expanded, peak_frontier)
+    return path
+
+
+def ucs(start, goal, grid, blocked_positions, grid_size, stats=None):
+    return run_steps(ucs_steps(start, goal, grid, blocked_positions, grid_size, batch_size=None, stats=stats))
 
 
-def ucs(start, goal, grid, blocked_positions, grid_size):
-    queue = [(0, start, [start])]
-    visited = set()
+def ucs_steps(start, goal, grid, blocked_positions, grid_size, batch_size=BATCH_SIZE, stats=None):
+    if start in blocked_positions:
+        return None
+    compact = as_compact(grid, blocked_positions, grid_size)
+    cells, offsets, position = compact.cells, compact.offsets, compact.position
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    came_from = parent_table(compact)
+    costs = array('i', [UNVISITED]) * len(came_from)
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    came_from[start_index] = start_index
+    costs[start_index] = 0
+    queue = [(0, start_index)]
+    expanded = peak_frontier = 0
+    heap_pushes = 1
+    path = None
+    on_expand = expansion_listener(stats)
+    expanded_batch, frontier_batch = ([], []) if batch_size else (None, None)
 
     while queue:
-        (cost, vertex, path) = heapq.heappop(queue)
-        if vertex not in visited:
-            if vertex in blocked_positions:
-                continue
-            visited.add(vertex)
-            if vertex == goal:
-                return path
-            neighbors = get_neighbors(vertex, grid, blocked_positions, grid_size)
-            for neighbor in neighbors:
-                heapq.heappush(queue, (cost + 1, neighbor, path + [neighbor]))
-    return None
+        if len(queue) > peak_frontier:
+            peak_frontier = len(queue)
+        (cost, vertex) = heapq.heappop(queue)
+        if cost > costs[vertex]:
+            continue  # Stale entry, a cheaper one was already expanded
+        if vertex == goal_index:
+            path = reconstruct_path(came_from, goal_index, compact)
+            break
+        expanded += 1
+        if on_expand is not None:
+            on_expand(position(vertex))
+        for offset in offsets:
+            neighbor = vertex + offset
+            if not cells[neighbor] and (costs[neighbor] == UNVISITED or cost + 1 < costs[neighbor]):
+                costs[neighbor] = cost + 1
+                came_from[neighbor] = vertex
+                heapq.heappush(queue, (cost + 1, neighbor))
+                heap_pushes += 1
+                if frontier_batch is not None:
+                    frontier_batch.append(position(neighbor))
+        if expanded_batch is not None:
+            expanded_batch.append(position(vertex))
+            if len(expanded_batch) >= batch_size:
+                yield expanded_batch, frontier_batch
+                expanded_batch, frontier_batch = [], []
+    if expanded_batch or frontier_batch:
+        yield expanded_batch, frontier_batch
+    record_stats(stats, expanded, peak_frontier, heap_pushes)
+    return path
+
+
+def bidirectional_bfs(start, goal, grid, blocked_positions, grid_size, stats=None):
+    """
+    Breadth-first search grown from both ends at once, always extending the
+    smaller frontier by one full layer. Returns a shortest path like bfs.
+    """
+    return run_steps(bidirectional_bfs_steps(start, goal, grid, blocked_positions, grid_size,
+                                             batch_size=None, stats=stats))
+
+
+def bidirectional_bfs_steps(start, goal, grid, blocked_positions, grid_size, batch_size=BATCH_SIZE, stats=None):
+    compact = as_compact(grid, blocked_positions, grid_size)
+    if not (compact.contains(start) and compact.contains(goal)):
+        return None
+    cells, offsets, position = compact.cells, compact.offsets, compact.position
+    start_index = compact.index(start)
+    goal_index = compact.index(goal)
+    if start_index == goal_index:
+        record_stats(stats, 0, 1)
+        return [start]
+    if cells[goal_index]:
+        return None  # The goal can never be entered
+    came_from = (parent_table(compact), parent_table(compact))  # Forward, backward
+    distance = (array('i', [0]) * len(cells), array('i', [0]) * len(cells))
+    came_from[0][start_index] = start_index
+    came_from[1][goal_index] = goal_index
+    frontiers = [[start_index], [goal_index]]
+    expanded = peak_frontier = 0
+    best = None  # (length, forward meeting index, backward meeting index)
+    on_expand = expansion_listener(stats)
+    expanded_batch, frontier_batch = ([], []) if batch_size else (None, None)
+
+    while frontiers[0] and frontiers[1] and best is None:
+        peak_frontier = max(peak_frontier, len(frontiers[0]) + len(frontiers[1]))
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        this_came_from, other_came_from = came_from[side], came_from[1 - side]
+        this_distance, other_distance = distance[side], distance[1 - side]
+        next_frontier = []
+        for vertex in frontiers[side]:
+            expanded += 1
+            if on_expand is not None:
+                on_expand(position(vertex))
+            for offset in offsets:
+                neighbor = vertex + offset
+                if cells[neighbor]:
+                    continue
+                if other_came_from[neighbor] != UNVISITED:
+                    # The two searches touch across the edge vertex -> neighbor
+                    length = this_distance[vertex] + 1 + other_distance[neighbor]
+                    if best is None or length < best[0]:
+                        best = (length, vertex, neighbor) if side == 0 else (length, neighbor, vertex)
+                if this_came_from[neighbor] == UNVISITED:
+                    this_came_from[neighbor] = vertex
+                    this_distance[neighbor] = this_distance[vertex] + 1
+                    next_frontier.append(neighbor)
+                    if frontier_batch is not None:
+                        frontier_batch.append(position(neighbor))
+            if expanded_batch is not None:
+                expanded_batch.append(position(vertex))
+                if len(expanded_batch) >= batch_size:
+                    yield expanded_batch, frontier_batch
+                    expanded_batch, frontier_batch = [], []
+        frontiers[side] = next_frontier
+
+    if expanded_batch or frontier_batch:
+        yield expanded_batch, frontier_batch
+    record_stats(stats, expanded, peak_frontier)
+    if best is None:
+        return None
+    _, forward_index, backward_index = best
+    return join_paths(came_from[0], forward_index, came_from[1], backward_index, compact)
+
+
+def run_steps(steps):
+    """Runs a *_steps generator to the end and returns the path it returns."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+
+
+def join_paths(forward_came_from, forward_index, backward_came_from, backward_index, compact):
+    """Joins the start-to-forward_index and backward_index-to-goal halves of a bidirectional search."""
+    path = reconstruct_path(forward_came_from, forward_index, compact)
+    if backward_index == forward_index:
+        backward_index = backward_came_from[backward_index]
+        if backward_index == forward_index:
+            return path  # The meeting cell is the goal itself
+    while True:
+        path.append(compact.position(backward_index))
+        parent = backward_came_from[backward_index]
+        if parent == backward_index:
+            return path  # The goal cell is its own parent
+        backward_index = parent
+
+
+# Marker for cells that have no parent yet in a parent table
+UNVISITED = -1
+
+
+def parent_table(compact):
+    """Returns a parent table with one slot per flat index of a CompactGrid."""
+    return array('i', [UNVISITED]) * len(compact.cells)
+
+
+def record_stats(stats, nodes_expanded, peak_frontier, heap_pushes=None, neighbor_calls=None, neighbor_time=None):
+    """Fills in the optional stats dict passed to a search, or adds to a SearchStats."""
+    if stats is None:
+        return
+    if isinstance(stats, SearchStats):
+        stats.record(nodes_expanded, peak_frontier, heap_pushes, neighbor_calls, neighbor_time)
+        return
+    stats['nodes_expanded'] = nodes_expanded
+    stats['peak_frontier'] = peak_frontier
+    if heap_pushes is not None:
+        stats['heap_pushes'] = heap_pushes
+    if neighbor_calls is not None:
+        stats['neighbor_calls'] = neighbor_calls
+        stats['neighbor_time'] = neighbor_time
+
+
+def reconstruct_path(came_from, goal_index, compact):
+    """Walks the parent table back from the goal and returns the start-to-goal path."""
+    path = []
+    index = goal_index
+    while True:
+        path.append(compact.position(index))
+        parent = came_from[index]
+        if parent == index:
+            break  # The start cell is its own parent
+        index = parent
+    path.reverse()
+    return path
 
 
 def get_neighbors(position, grid, blocked_positions, grid_size):
+    if isinstance(grid, CompactGrid):
+        return grid.neighbors(position, blocked_positions, grid_size)
     x, y = position
     neighbors = []
     moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
@@ -3,5 +3,8 @@
 from .simulation_base import SimulationBase
 from .search_simulation import SearchSimulation
 from .maze_simulation import MazeSimulation
+from .fleet_simulation import FleetSimulation
+from .adversarial_simulation import AdversarialSimulation
+from .frame_capture import FrameWriter
 
-__all__ = ['SimulationBase', 'SearchSimulation', 'MazeSimulation']
+__all__ = ['SimulationBase', 'SearchSimulation', 'MazeSimulation', 'FleetSimulation', 'AdversarialSimulation', 'FrameWriter']
@@ -0,0 +1,210 @@
+# modules/simulations/adversarial_simulation.py
+
+import time
+import pygame
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(parent_dir)
+
+from modules.simulations.simulation_base import SimulationBase
+from modules.simulations.search_simulation import Button
+from modules.adversarial_search.minimax import AlphaBetaSearch, WIN, is_mate_score
+from modules.adversarial_search.parallel_search import ParallelSearch
+from modules.adversarial_search.games import GAMES, SYMBOLS
+from modules.utils.text_cache import get_font, render_text
+from modules.utils.constants import WHITE, BLACK, BLUE, RED, YELLOW, PANEL_WIDTH, LIGHT_GRAY
+
+PLAYER_COLORS = (RED, YELLOW)
+
+
+def format_score(score):
+    """Shows forced results as the number of plies to the win or loss."""
+    if is_mate_score(score):
+        plies = WIN - abs(score)
+        return f"{'Win' if score > 0 else 'Loss'} in {plies}"
+    return str(score)
+
+
+class AdversarialSimulation(SimulationBase):
+    """
+    The alpha-beta engine playing a game against itself, one move per step.
+    Each move is an iterative-deepening search limited by time_budget
+    seconds and max_depth plies. With workers set, the root moves are split
+    across that many processes by ParallelSearch; call close() afterwards
+    to stop them.
+    """
+
+    def __init__(self, screen, game='connect4', position='', time_budget=1.0, max_depth=None, workers=None,
+                 steps_per_second=1, render_every=1):
+        super().__init__(screen, steps_per_second=steps_per_second, render_every=render_every)
+        if game not in GAMES:
+            raise ValueError(f"Unknown game: {game}")
+        self.game = game
+        self.position = position  # Opening moves in 1-based notation
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.workers = workers
+        self.engine = None
+
+        # Initialize fonts
+        self.font_size = 20
+        self.font_small = get_font(None, self.font_size)
+        self.font_medium = get_font(None, int(self.font_size * 1.2))
+
+        # Start and Reset buttons
+        self.update_buttons()
+
+        self.reset_simulation()
+        self.layout = None  # (window width, window height) the buttons were placed for
+
+    def update_buttons(self):
+        window_width, window_height = self.screen.get_size()
+        button_width = 100
+        button_height = 40
+        margin = 10  # Margin from the edges
+        button_x = window_width - PANEL_WIDTH - button_width - margin
+        button_y = window_height - button_height - margin
+        self.start_button = Button(pygame.Rect(button_x, button_y, button_width, button_height),
+                                   LIGHT_GRAY, "Start", BLACK, self.font_medium)
+        self.reset_button = Button(pygame.Rect(button_x, button_y - button_height - margin, button_width,
+                                               button_height),
+                                   LIGHT_GRAY, "Reset", BLACK, self.font_medium)
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.quit()
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if self.start_button.is_clicked(event.pos):
+                    self.start()
+                elif self.reset_button.is_clicked(event.pos):
+                    self.reset_simulation()
+
+            # Exit on pressing ESC key
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.quit()
+
+    def reset_simulation(self):
+        self.state = GAMES[self.game].from_moves(self.position)
+        self.close()
+        self.engine = AlphaBetaSearch() if self.workers is None else ParallelSearch(workers=self.workers)
+        self.moves = []  # Moves played by the engine
+        self.last_search = None  # (move, score, depth, nodes, seconds) of the latest move
+        self.total_nodes = 0
+        self.search_time = 0.0
+        self.animation_started = False
+
+    def update(self):
+        # Handle window resize
+        size = self.screen.get_size()
+        if size != self.layout:
+            self.layout = size
+            self.update_buttons()
+
+    def start(self):
+        """Let the engine play from the current position."""
+        self.animation_started = True
+
+    def step(self):
+        """Search and play one move for the side to move."""
+        if not self.animation_started:
+            return False
+        if self.state.outcome() is not None:
+            self.animation_started = False
+            return False
+        nodes = self.engine.nodes
+        t0 = time.perf_counter()
+        move, score, depth = self.engine.iterative_deepening(self.state, self.time_budget, self.max_depth)
+        seconds = time.perf_counter() - t0
+        nodes = self.engine.nodes - nodes
+        self.state.play(move)
+        self.moves.append(move)
+        self.last_search = (move, score, depth, nodes, seconds)
+        self.total_nodes += nodes
+        self.search_time += seconds
+        if self.state.outcome() is not None:
+            self.animation_started = False
+        return True
+
+    def result(self):
+        """Describes the game: the winner, a draw, or whose move it is."""
+        state = self.state
+        if state.winner is not None:
+            return f"{SYMBOLS[state.winner]} wins"
+        if state.outcome() is not None:
+            return "Draw"
+        return f"{SYMBOLS[state.player]} to move"
+
+    def move_string(self):
+        """The moves the engine played, in the same 1-based notation as position."""
+        return ''.join(str(move + 1) for move in self.moves)
+
+    def nodes_per_second(self):
+        return self.total_nodes / self.search_time if self.search_time else 0.0
+
+    def draw(self):
+        self.screen.fill(WHITE)
+        self.draw_board()
+        board_width = self.screen.get_width() - PANEL_WIDTH
+        self.draw_ui(board_width + 20, 20)
+
+        # Draw Start and Reset buttons
+        self.start_button.draw(self.screen)
+        self.reset_button.draw(self.screen)
+        # The board and panel are small, so every frame repaints the whole window
+        self.mark_dirty(self.screen.get_rect())
+        self.present()
+
+    def draw_board(self):
+        state = self.state
+        window_width, window_height = self.screen.get_size()
+        cell_size = max(1, min((window_width - PANEL_WIDTH) // state.width, window_height // state.height))
+        pygame.draw.rect(self.screen, BLUE, pygame.Rect(0, 0, state.width * cell_size, state.height * cell_size))
+        radius = max(1, cell_size * 2 // 5)
+        for y, row in enumerate(state.cells()):
+            for x, cell in enumerate(row):
+                color = WHITE if cell is None else PLAYER_COLORS[cell]
+                center = (x * cell_size + cell_size // 2, y * cell_size + cell_size // 2)
+                pygame.draw.circle(self.screen, color, center, radius)
+
+    def draw_ui(self, panel_x, y_offset):
+        title_text = render_text("Game Status", self.font_medium, BLACK)
+        self.screen.blit(title_text, (panel_x, y_offset))
+        y_offset += int(self.font_size * 1.5)
+
+        lines = [
+            f"Game: {self.game}  (X red, O yellow)",
+            f"Engine: {'alpha-beta' if self.workers is None else f'root split, {self.engine.workers} workers'}",
+            self.result(),
+            f"Moves Played: {self.state.moves_played}",
+        ]
+        if self.last_search is not None:
+            move, score, depth, nodes, seconds = self.last_search
+            lines += [
+                f"Last Move: {move + 1}",
+                f"Depth: {depth}  Score: {format_score(score)}",
+                f"Nodes: {nodes}  ({nodes / seconds / 1000 if seconds else 0:.1f} kN/s)",
+            ]
+        lines.append(f"Total Nodes: {self.total_nodes}")
+        table = self.engine.table
+        if table is not None and table.hits + table.misses:
+            lines.append(f"Table Hit Rate: {table.hits / (table.hits + table.misses):.0%}")
+        lines.append("Status: Thinking" if self.animation_started else "Status: Idle")
+        for line in lines:
+            self.screen.blit(render_text(line, self.font_small, BLACK), (panel_x, y_offset))
+            y_offset += int(self.font_size)
+
+    def close(self):
+        """Shuts down the worker processes of a parallel engine."""
+        if isinstance(self.engine, ParallelSearch):
+            self.engine.close()
+
+    def quit(self):
+        """Exit the simulation."""
+        self.running = False
@@ -0,0 +1,199 @@
+# modules/simulations/fleet_simulation.py
+
+import pygame
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(parent_dir)
+
+from modules.simulations.simulation_base import SimulationBase
+from modules.simulations.search_simulation import Button
+from modules.environments.grid_environment import GridEnvironment
+from modules.agents.robot_fleet import RobotFleet
+from modules.search_algorithms.instrumentation import SearchStats
+from modules.utils.text_cache import get_font, render_text
+from modules.utils.constants import (
+    DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, WHITE, BLACK, BLUE, GREEN, RED, PANEL_WIDTH, LIGHT_GRAY, GRAY
+)
+
+class FleetSimulation(SimulationBase):
+    def __init__(self, screen, grid_size=32, num_agents=20, tasks_per_agent=3, seed=None,
+                 steps_per_second=5, render_every=1):
+        super().__init__(screen, steps_per_second=steps_per_second, render_every=render_every)
+        self.grid_size = grid_size
+        self.num_agents = num_agents
+        self.tasks_per_agent = tasks_per_agent
+        self.seed = seed
+
+        # Initialize fonts
+        self.font_size = 20
+        self.font_small = get_font(None, self.font_size)
+        self.font_medium = get_font(None, int(self.font_size * 1.2))
+
+        # Start and Reset buttons
+        self.update_buttons()
+
+        # Generate environment and fleet
+        self.reset_simulation()
+        self.layout = None  # (window width, window height, cell size) the background was built for
+
+    def update_buttons(self):
+        window_width, window_height = self.screen.get_size()
+        button_width = 100
+        button_height = 40
+        margin = 10  # Margin from the edges
+        button_x = window_width - PANEL_WIDTH - button_width - margin
+        button_y = window_height - button_height - margin
+        self.start_button = Button(pygame.Rect(button_x, button_y, button_width, button_height),
+                                   LIGHT_GRAY, "Start", BLACK, self.font_medium)
+        self.reset_button = Button(pygame.Rect(button_x, button_y - button_height - margin, button_width,
+                                               button_height),
+                                   LIGHT_GRAY, "Reset", BLACK, self.font_medium)
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.quit()
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if self.start_button.is_clicked(event.pos):
+                    self.start()
+                elif self.reset_button.is_clicked(event.pos):
+                    self.reset_simulation()
+
+            # Exit on pressing ESC key
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.quit()
+
+    def reset_simulation(self):
+        # Generate a new environment with tasks for every robot
+        self.env = GridEnvironment(self.grid_size, num_tasks=self.num_agents * self.tasks_per_agent, seed=self.seed)
+        self.grid = self.env.get_grid()
+        self.search_stats = SearchStats()
+        self.fleet = RobotFleet.from_environment(self.env, self.num_agents, seed=self.seed, stats=self.search_stats)
+        self.cell_size = min((DEFAULT_WINDOW_WIDTH - PANEL_WIDTH) // self.grid_size,
+                             DEFAULT_WINDOW_HEIGHT // self.grid_size)
+        self.margin = 1
+        self.animation_started = False
+        # The new grid needs a new background and a full repaint
+        self.background = None
+        self.full_redraw = True
+
+    def update(self):
+        # Handle window resize
+        window_width, window_height = self.screen.get_size()
+        self.cell_size = max(1, min((window_width - PANEL_WIDTH) // self.grid_size, window_height // self.grid_size))
+        if (window_width, window_height, self.cell_size) != self.layout:
+            self.layout = (window_width, window_height, self.cell_size)
+            self.background = None
+            self.full_redraw = True
+            self.update_buttons()
+
+    def start(self):
+        """Let the fleet plan and move; robots plan their first task in the first step."""
+        self.animation_started = True
+
+    def step(self):
+        """Advance every robot one time step."""
+        if not self.animation_started:
+            return False
+        if not self.fleet.step():
+            self.animation_started = False
+        return True
+
+    def draw(self):
+        if self.background is None:
+            self.build_background()
+        if self.full_redraw:
+            self.screen.fill(WHITE)
+            self.screen.blit(self.background, (0, 0))
+            self.completed_drawn = [0] * len(self.fleet.agents)
+            self.robots_drawn_at = {}
+            self.mark_dirty(self.screen.get_rect())
+            self.full_redraw = False
+        self.draw_environment()
+        self.present()
+
+    def build_background(self):
+        """Pre-render the obstacles, free cells and tasks into an off-screen Surface."""
+        self.background = pygame.Surface((self.grid_size * self.cell_size, self.grid_size * self.cell_size))
+        self.background.fill(WHITE)
+        for y in range(self.grid_size):
+            for x in range(self.grid_size):
+                pygame.draw.rect(self.background, BLACK if self.grid[y][x] == 1 else GRAY, self.cell_rect((x, y)))
+        for task in self.env.get_tasks():
+            pygame.draw.rect(self.background, RED, self.cell_rect(task))
+
+    def cell_rect(self, position):
+        x, y = position
+        return pygame.Rect(
+            x * self.cell_size, y * self.cell_size, self.cell_size - self.margin, self.cell_size - self.margin
+        )
+
+    def draw_environment(self):
+        agents = self.fleet.agents
+        # Paint the tasks completed since the last frame
+        for robot, agent in enumerate(agents):
+            for task in agent.completed_tasks[self.completed_drawn[robot]:]:
+                rect = self.cell_rect(task)
+                pygame.draw.rect(self.background, GREEN, rect)
+                self.screen.blit(self.background, rect, rect)
+                self.mark_dirty(rect)
+            self.completed_drawn[robot] = len(agent.completed_tasks)
+
+        # Restore the cells the robots left, then draw every robot that moved
+        positions = {agent.position for agent in agents}
+        for robot, position in list(self.robots_drawn_at.items()):
+            if agents[robot].position != position:
+                if position not in positions:
+                    rect = self.cell_rect(position)
+                    self.screen.blit(self.background, rect, rect)
+                    self.mark_dirty(rect)
+                del self.robots_drawn_at[robot]
+        for robot, agent in enumerate(agents):
+            if robot not in self.robots_drawn_at:
+                rect = self.cell_rect(agent.position)
+                pygame.draw.rect(self.screen, BLUE, rect)
+                self.mark_dirty(rect)
+                self.robots_drawn_at[robot] = agent.position
+
+        # Draw right panel background and counters
+        panel_rect = pygame.Rect(self.grid_size * self.cell_size, 0, PANEL_WIDTH, self.screen.get_height())
+        pygame.draw.rect(self.screen, WHITE, panel_rect)
+        self.mark_dirty(panel_rect)
+        self.draw_ui(panel_rect.x + 20, 20)
+
+        # Draw Start and Reset buttons
+        self.start_button.draw(self.screen)
+        self.reset_button.draw(self.screen)
+        self.mark_dirty(self.start_button.rect)
+        self.mark_dirty(self.reset_button.rect)
+
+    def draw_ui(self, panel_x, y_offset):
+        fleet = self.fleet
+        title_text = render_text("Fleet Status", self.font_medium, BLACK)
+        self.screen.blit(title_text, (panel_x, y_offset))
+        y_offset += int(self.font_size * 1.5)
+
+        lines = [
+            f"Robots: {len(fleet.agents)}",
+            f"Time Step: {fleet.time}",
+            f"Tasks Completed: {fleet.tasks_completed()}/{self.num_agents * self.tasks_per_agent}",
+            f"Moves: {fleet.moves}  Waits: {fleet.waits}",
+            f"Plans: {fleet.plans}  Failed: {fleet.failed_plans}",
+            f"Planning Time: {fleet.planning_time * 1000:.0f} ms",
+            f"Nodes Expanded: {self.search_stats.get('nodes_expanded', 0)}",
+            f"Conflicts: {fleet.conflicts}",
+            "Status: Moving" if self.animation_started else "Status: Idle",
+        ]
+        for line in lines:
+            self.screen.blit(render_text(line, self.font_small, BLACK), (panel_x, y_offset))
+            y_offset += int(self.font_size)
+
+    def quit(self):
+        """Exit the simulation."""
+        self.running = False
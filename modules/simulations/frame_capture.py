@@ -0,0 +1,123 @@
+# modules/simulations/frame_capture.py
+
+"""
+Records simulation frames without blocking the render loop.
+
+submit() copies the screen's pixels and hands them to a background writer
+thread through a bounded queue. When the queue is full the frame is
+dropped and counted rather than stalling the simulation. The writer saves
+a numbered PNG sequence, or pipes raw RGB frames to ffmpeg when the output
+path has a video extension and ffmpeg is on the PATH. A frame that fails
+to write (ffmpeg exited, disk full) is counted and the writer keeps
+draining the queue, so close() always returns.
+"""
+
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+
+import pygame
+
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.avi', '.mov', '.webm')
+
+# pygame 2.1.3 renamed tostring/fromstring to tobytes/frombytes
+_to_bytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+_from_bytes = getattr(pygame.image, 'frombytes', None) or pygame.image.fromstring
+
+
+class FrameWriter:
+    def __init__(self, path, fps=30, max_queue=64):
+        self.path = path
+        self.fps = fps
+        self.frames = queue.Queue(maxsize=max_queue)
+        self.encoder = None
+        root, extension = os.path.splitext(path)
+        if extension.lower() in VIDEO_EXTENSIONS and shutil.which('ffmpeg'):
+            self.mode = 'video'
+        else:
+            # Without an encoder a video path falls back to a PNG directory of the same name
+            self.mode = 'png'
+            self.directory = root if extension.lower() in VIDEO_EXTENSIONS else path
+            os.makedirs(self.directory, exist_ok=True)
+        self.frames_submitted = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.frames_failed = 0
+        self.error = None  # First exception raised while writing a frame
+        self.encode_seconds = 0.0
+        self.max_encode_seconds = 0.0
+        self.thread = threading.Thread(target=self.write_frames, name='FrameWriter', daemon=True)
+        self.thread.start()
+
+    def submit(self, surface):
+        """Queue a copy of surface for writing. Returns False if the frame was dropped."""
+        self.frames_submitted += 1
+        frame = (surface.get_size(), _to_bytes(surface, 'RGB'))
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+        return True
+
+    def write_frames(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            size, pixels = frame
+            t0 = time.perf_counter()
+            try:
+                if self.mode == 'video':
+                    self.encode_video(size, pixels)
+                else:
+                    image = _from_bytes(pixels, size, 'RGB')
+                    pygame.image.save(image, os.path.join(self.directory, f"frame_{self.frames_written:06d}.png"))
+            except (OSError, ValueError, pygame.error) as error:
+                self.frames_failed += 1
+                if self.error is None:
+                    self.error = error
+                continue
+            elapsed = time.perf_counter() - t0
+            self.encode_seconds += elapsed
+            self.max_encode_seconds = max(self.max_encode_seconds, elapsed)
+            self.frames_written += 1
+
+    def encode_video(self, size, pixels):
+        if self.encoder is None:
+            # The frame size is only known once the first frame arrives
+            width, height = size
+            self.encoder = subprocess.Popen(
+                ['ffmpeg', '-y', '-loglevel', 'error',
+                 '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f"{width}x{height}", '-r', str(self.fps),
+                 '-i', '-', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', self.path],
+                stdin=subprocess.PIPE)
+        self.encoder.stdin.write(pixels)
+
+    def stats(self):
+        written = self.frames_written
+        return {'mode': self.mode, 'submitted': self.frames_submitted, 'written': written,
+                'dropped': self.frames_dropped, 'failed': self.frames_failed,
+                'mean_encode_ms': self.encode_seconds * 1000 / written if written else 0.0,
+                'max_encode_ms': self.max_encode_seconds * 1000}
+
+    def close(self):
+        """Flush the queued frames and stop the writer thread."""
+        # Never block on a full queue whose writer thread is gone
+        while self.thread.is_alive():
+            try:
+                self.frames.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self.thread.join()
+        if self.encoder is not None:
+            try:
+                self.encoder.stdin.close()
+            except OSError:
+                pass  # ffmpeg already exited; the error was counted in write_frames
+            self.encoder.wait()
+            self.encoder = None
@@ -12,15 +12,19 @@ sys.path.append(parent_dir)
 from modules.simulations.simulation_base import SimulationBase
 from modules.environments.maze_environment import MazeEnvironment
 from modules.agents.maze_agent import MazeAgent
+from modules.search_algorithms.path_cache import PathCache
+from modules.search_algorithms.instrumentation import SearchStats
+from modules.utils.text_cache import get_font, render_text
 from modules.utils.constants import (
     DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, WHITE, BLACK, BLUE, GREEN, RED,
-    PANEL_WIDTH, LIGHT_GRAY, BLACK, GRAY
+    PANEL_WIDTH, LIGHT_BLUE, PALE_YELLOW, LIGHT_GRAY, BLACK, GRAY
 )
 
 class MazeSimulation(SimulationBase):
     def __init__(self, screen, algorithm='dfs', maze_width=21, maze_height=21,
-                 complexity=0.75, density=0.75):
-        super().__init__(screen)
+                 complexity=0.75, density=0.75, steps_per_second=5, render_every=1, expansions_per_frame=64):
+        super().__init__(screen, steps_per_second=steps_per_second, render_every=render_every)
+        self.expansions_per_frame = expansions_per_frame  # Search expansions animated per frame, 0 finds the path at once
         self.algorithm = algorithm
         self.maze_width = maze_width
         self.maze_height = maze_height
@@ -29,13 +33,16 @@ class MazeSimulation(SimulationBase):
 
         # Initialize fonts
         self.font_size = 20
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
+        self.font_small = get_font(None, self.font_size)
+        self.font_medium = get_font(None, int(self.font_size * 1.2))
+        self.font_large = get_font(None, int(self.font_size * 1.5))
 
         # Initialize clock for controlling animation speed
         self.clock = pygame.time.Clock()
 
+        # Path cache shared by every agent created on reset
+        self.path_cache = PathCache()
+
         # Start and Reset buttons
         self.update_buttons()
 
@@ -44,6 +51,7 @@ class MazeSimulation(SimulationBase):
 
         # Variables for UI
         self.mouse_grid_pos = None
+        self.layout = None  # (window width, window height, cell size) the background was built for
 
     def update_buttons(self):
         window_width, window_height = self.screen.get_size()
@@ -69,14 +77,7 @@ class MazeSimulation(SimulationBase):
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if self.start_button.is_clicked(event.pos):
-                    self.animation_started = True
-                    # Find path when start button is clicked
-                    self.agent.find_path(self.grid)
-                    if not self.agent.path:
-                        print(f"No path found using {self.algorithm.upper()}")
-                        self.animation_started = False
-                    else:
-                        self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
+                    self.start()
                 elif self.reset_button.is_clicked(event.pos):
                     self.reset_simulation()
 
@@ -100,19 +101,28 @@ class MazeSimulation(SimulationBase):
         # Generate new maze and reset agent
         self.maze_env = MazeEnvironment(self.maze_width, self.maze_height,
                                         complexity=self.complexity, density=self.density)
-        self.grid = self.maze_env.get_grid()
+        # Compact grid: the path cache fingerprints it once instead of rehashing a list grid per query
+        self.grid = self.maze_env.get_compact_grid()
         # Set cell size
         self.cell_size = min((DEFAULT_WINDOW_WIDTH - PANEL_WIDTH) // self.maze_width, DEFAULT_WINDOW_HEIGHT // self.maze_height)
         self.margin = 1
         # Set start and goal positions
         self.start_pos = (1, 0)
         self.goal_pos = (self.maze_width - 2, self.maze_height - 1)
-        # Initialize agent
-        self.agent = MazeAgent(self.start_pos, self.goal_pos, algorithm=self.algorithm)
+        # Initialize agent with fresh search counters
+        self.search_stats = SearchStats()
+        self.agent = MazeAgent(self.start_pos, self.goal_pos, algorithm=self.algorithm,
+                               path_cache=self.path_cache, stats=self.search_stats)
         self.animation_started = False
-        self.agent.path_traveled = []
+        self.agent.path_traveled.clear()
         self.agent.path = []
         self.path_length = None
+        self.search_steps = None  # Generator of the search being animated
+        self.search_overlay = {}  # Position -> color of cells the search expanded or reached
+        self.overlay_pending = []  # Overlay cells not drawn yet
+        # The new maze needs a new background and a full repaint
+        self.background = None
+        self.full_redraw = True
 
     def update(self):
         # Handle window resize
@@ -121,35 +131,96 @@ class MazeSimulation(SimulationBase):
         grid_height = window_height
         self.cell_size = min(grid_width // self.maze_width, grid_height // self.maze_height)
         self.margin = 1
-
-        # Update fonts based on cell_size
-        self.font_size = int(self.cell_size // 2)
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
-
-        self.start_button.font = self.font_medium
-        self.reset_button.font = self.font_medium
-
-        # Update button positions on resize
-        self.update_buttons()
-
-        if self.animation_started:
-            self.agent.move()
-            # Update path length
+        if (window_width, window_height, self.cell_size) != self.layout:
+            # Rebuild the background at the new cell size and repaint everything
+            self.layout = (window_width, window_height, self.cell_size)
+            self.background = None
+            self.full_redraw = True
+
+            # Update fonts based on cell_size
+            self.font_size = int(self.cell_size // 2)
+            self.font_small = get_font(None, self.font_size)
+            self.font_medium = get_font(None, int(self.font_size * 1.2))
+            self.font_large = get_font(None, int(self.font_size * 1.5))
+
+            # Update button positions and fonts on resize
+            self.update_buttons()
+
+        if self.search_steps is not None:
+            self.advance_search()
+
+    def start(self):
+        """Start the agent's search; an animated search advances one batch per frame in update()."""
+        self.animation_started = False
+        self.search_overlay = {}
+        self.overlay_pending = []
+        self.full_redraw = True  # Clear the overlay of an earlier search
+        if self.expansions_per_frame:
+            self.search_steps = self.agent.search_steps(self.grid, batch_size=self.expansions_per_frame)
+        else:
+            # Find path when start button is clicked
+            self.agent.find_path(self.grid)
+            self.finish_search()
+
+    def advance_search(self):
+        """Run one batch of the animated search and queue its cells for drawing."""
+        try:
+            expanded, frontier = next(self.search_steps)
+        except StopIteration:
+            self.finish_search()
+            return
+        for pos in frontier:
+            if pos not in self.search_overlay:
+                self.search_overlay[pos] = LIGHT_BLUE
+                self.overlay_pending.append(pos)
+        for pos in expanded:
+            self.search_overlay[pos] = PALE_YELLOW
+            self.overlay_pending.append(pos)
+
+    def finish_search(self):
+        self.search_steps = None
+        if not self.agent.path:
+            print(f"No path found using {self.algorithm.upper()}")
+        else:
+            self.animation_started = True
             self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
-            # Stop the simulation when the agent reaches the goal
-            if self.agent.position == self.goal_pos:
-                self.animation_started = False
+
+    def step(self):
+        """Move the agent one cell along its path."""
+        if self.search_steps is not None:
+            return True  # update() is still advancing the search
+        if not self.animation_started:
+            return False
+        self.agent.move()
+        # Update path length
+        self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
+        # Stop the simulation when the agent reaches the goal
+        if self.agent.position == self.goal_pos:
+            self.animation_started = False
+        return True
 
     def draw(self):
-        self.screen.fill(WHITE)
+        if self.background is None:
+            self.build_background()
+        if self.full_redraw:
+            # Repaint the static maze, then let draw_environment add everything that moves
+            self.screen.fill(WHITE)
+            self.screen.blit(self.background, (0, 0))
+            self.traveled_drawn = 0
+            self.traveled_cells = set()
+            self.agent_drawn_at = None
+            self.overlay_pending = list(self.search_overlay)
+            self.mark_dirty(self.screen.get_rect())
+            self.full_redraw = False
         self.draw_environment()
-        pygame.display.flip()
+        self.present()
 
-    def draw_environment(self):
+    def build_background(self):
+        """Pre-render the walls, passages and goal into an off-screen Surface."""
         CELL_SIZE = self.cell_size
         MARGIN = self.margin
+        self.background = pygame.Surface((self.maze_width * CELL_SIZE, self.maze_height * CELL_SIZE))
+        self.background.fill(WHITE)
 
         # Draw the maze grid
         for y in range(self.maze_height):
@@ -158,28 +229,55 @@ class MazeSimulation(SimulationBase):
                     x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
                 )
                 if self.grid[y][x] == 1:
-                    pygame.draw.rect(self.screen, BLACK, rect)
+                    pygame.draw.rect(self.background, BLACK, rect)
                 else:
-                    pygame.draw.rect(self.screen, GRAY, rect)
+                    pygame.draw.rect(self.background, GRAY, rect)
 
         # Draw the goal
         gx, gy = self.goal_pos
         rect = pygame.Rect(
             gx * CELL_SIZE, gy * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
         )
-        pygame.draw.rect(self.screen, RED, rect)
-
-        # Draw the path traveled
-        for pos in self.agent.path_traveled:
-            x, y = pos
-            rect = pygame.Rect(
-                x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-            )
+        pygame.draw.rect(self.background, RED, rect)
+
+    def cell_rect(self, position):
+        x, y = position
+        return pygame.Rect(
+            x * self.cell_size, y * self.cell_size, self.cell_size - self.margin, self.cell_size - self.margin
+        )
+
+    def draw_environment(self):
+        # Restore the cell the agent left from the background and the traveled path
+        if self.agent_drawn_at is not None and self.agent_drawn_at != self.agent.position:
+            rect = self.cell_rect(self.agent_drawn_at)
+            self.screen.blit(self.background, rect, rect)
+            color = self.search_overlay.get(self.agent_drawn_at)
+            if color is not None and self.agent_drawn_at != self.goal_pos:
+                pygame.draw.rect(self.screen, color, rect)
+            if self.agent_drawn_at in self.traveled_cells:
+                pygame.draw.rect(self.screen, GREEN, rect)
+            self.mark_dirty(rect)
+
+        # Draw the cells the search expanded or reached since the last frame
+        for pos in self.overlay_pending:
+            if pos != self.goal_pos:
+                rect = self.cell_rect(pos)
+                pygame.draw.rect(self.screen, self.search_overlay[pos], rect)
+                self.mark_dirty(rect)
+        self.overlay_pending = []
+
+        # Draw only the part of the path traveled since the last frame
+        for pos in self.agent.path_traveled.since(self.traveled_drawn):
+            rect = self.cell_rect(pos)
             pygame.draw.rect(self.screen, GREEN, rect)
+            self.traveled_cells.add(pos)
+            self.mark_dirty(rect)
+        self.traveled_drawn = len(self.agent.path_traveled)
 
         # Draw right panel background
-        panel_rect = pygame.Rect(self.maze_width * CELL_SIZE, 0, PANEL_WIDTH, self.screen.get_height())
+        panel_rect = pygame.Rect(self.maze_width * self.cell_size, 0, PANEL_WIDTH, self.screen.get_height())
         pygame.draw.rect(self.screen, WHITE, panel_rect)
+        self.mark_dirty(panel_rect)
 
         # Draw UI elements on the right panel
         self.draw_ui(panel_rect.x + 20, 20)
@@ -187,41 +285,51 @@ class MazeSimulation(SimulationBase):
         # Draw Start and Reset buttons
         self.start_button.draw(self.screen)
         self.reset_button.draw(self.screen)
+        self.mark_dirty(self.start_button.rect)
+        self.mark_dirty(self.reset_button.rect)
 
         # Draw the agent
         self.draw_agent()
 
     def draw_ui(self, panel_x, y_offset):
         # Display Agent Status
-        status_text = self.font_medium.render("Agent Status", True, BLACK)
+        status_text = render_text("Agent Status", self.font_medium, BLACK)
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
-        position_text = self.font_small.render(f"Position: {self.agent.position}", True, BLACK)
+        position_text = render_text(f"Position: {self.agent.position}", self.font_small, BLACK)
         self.screen.blit(position_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
         if self.animation_started:
-            status_text = self.font_small.render("Status: Moving", True, BLACK)
+            status_text = render_text("Status: Moving", self.font_small, BLACK)
         else:
-            status_text = self.font_small.render("Status: Idle", True, BLACK)
+            status_text = render_text("Status: Idle", self.font_small, BLACK)
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
         # Display Path Length
         if self.path_length is not None:
-            path_length_text = self.font_small.render(f"Path Length: {self.path_length}", True, BLACK)
+            path_length_text = render_text(f"Path Length: {self.path_length}", self.font_small, BLACK)
             self.screen.blit(path_length_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
 
         # Display Algorithm Used
-        algorithm_text = self.font_small.render(f"Algorithm: {self.algorithm.upper()}", True, BLACK)
+        algorithm_text = render_text(f"Algorithm: {self.algorithm.upper()}", self.font_small, BLACK)
         self.screen.blit(algorithm_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
+        # Display search counters
+        for name, label in (('nodes_expanded', "Nodes Expanded"), ('peak_frontier', "Peak Frontier"),
+                            ('heap_pushes', "Heap Pushes")):
+            if name in self.search_stats:
+                counter_text = render_text(f"{label}: {self.search_stats[name]}", self.font_small, BLACK)
+                self.screen.blit(counter_text, (panel_x, y_offset))
+                y_offset += int(self.font_size)
+
         # Display Mouse Grid Position
         if self.mouse_grid_pos is not None:
-            mouse_pos_text = self.font_small.render(f"Cursor Position: {self.mouse_grid_pos}", True, BLACK)
+            mouse_pos_text = render_text(f"Cursor Position: {self.mouse_grid_pos}", self.font_small, BLACK)
             self.screen.blit(mouse_pos_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
         else:
@@ -229,22 +337,10 @@ class MazeSimulation(SimulationBase):
 
     def draw_agent(self):
         # Draw agent on top of the maze
-        CELL_SIZE = self.cell_size
-        MARGIN = self.margin
-        x, y = self.agent.position
-        rect = pygame.Rect(
-            x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-        )
+        rect = self.cell_rect(self.agent.position)
         pygame.draw.rect(self.screen, BLUE, rect)
-
-    def run(self):
-        """Main loop of the simulation."""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(5)  # Set to 5 FPS to slow down the animation
+        self.mark_dirty(rect)
+        self.agent_drawn_at = self.agent.position
 
     def quit(self):
         """Exit the simulation."""
@@ -260,7 +356,7 @@ class Button:
 
     def draw(self, surface):
         pygame.draw.rect(surface, self.color, self.rect)
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = render_text(self.text, self.font, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
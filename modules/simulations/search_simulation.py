@@ -12,28 +12,37 @@ sys.path.append(parent_dir)
 from modules.simulations.simulation_base import SimulationBase
 from modules.environments.grid_environment import GridEnvironment
 from modules.agents.robot_agent import RobotAgent
+from modules.search_algorithms.path_cache import PathCache
+from modules.search_algorithms.instrumentation import SearchStats
+from modules.utils.text_cache import get_font, render_text
 from modules.utils.constants import (
     DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, WHITE, BLACK, BLUE, GREEN, RED,
-    PANEL_WIDTH, LIGHT_GRAY, GRAY
+    PANEL_WIDTH, LIGHT_BLUE, PALE_YELLOW, LIGHT_GRAY, GRAY
 )
 
 class SearchSimulation(SimulationBase):
-    def __init__(self, screen, algorithm='astar', grid_size=16, num_tasks=5, nearest_task=False):
-        super().__init__(screen)
+    def __init__(self, screen, algorithm='astar', grid_size=16, num_tasks=5, nearest_task=False, plan_tour=False,
+                 steps_per_second=5, render_every=1, expansions_per_frame=64):
+        super().__init__(screen, steps_per_second=steps_per_second, render_every=render_every)
+        self.expansions_per_frame = expansions_per_frame  # Search expansions animated per frame, 0 finds the path at once
         self.algorithm = algorithm
         self.grid_size = grid_size
         self.num_tasks = num_tasks
         self.nearest_task = nearest_task  # New parameter
+        self.plan_tour = plan_tour  # Plan the task order over true path distances
 
         # Initialize fonts
         self.font_size = 20
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
+        self.font_small = get_font(None, self.font_size)
+        self.font_medium = get_font(None, int(self.font_size * 1.2))
+        self.font_large = get_font(None, int(self.font_size * 1.5))
 
         # Initialize clock for controlling animation speed
         self.clock = pygame.time.Clock()
 
+        # Path cache shared by every agent created on reset
+        self.path_cache = PathCache()
+
         # Start and Reset buttons
         self.update_buttons()
 
@@ -42,6 +51,7 @@ class SearchSimulation(SimulationBase):
 
         # Variables for UI
         self.mouse_grid_pos = None
+        self.layout = None  # (window width, window height, cell size) the background was built for
 
     def update_buttons(self):
         window_width, window_height = self.screen.get_size()
@@ -67,14 +77,7 @@ class SearchSimulation(SimulationBase):
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if self.start_button.is_clicked(event.pos):
-                    self.animation_started = True
-                    # Find initial path when start button is clicked
-                    self.agent.find_initial_path(self.grid)
-                    if not self.agent.path:
-                        print(f"No path found using {self.algorithm.upper()}")
-                        self.animation_started = False
-                    else:
-                        self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
+                    self.start()
                 elif self.reset_button.is_clicked(event.pos):
                     self.reset_simulation()
 
@@ -97,7 +100,8 @@ class SearchSimulation(SimulationBase):
     def reset_simulation(self):
         # Generate new environment and reset agent
         self.env = GridEnvironment(self.grid_size, num_tasks=self.num_tasks)
-        self.grid = self.env.get_grid()
+        # Compact grid: the path cache fingerprints it once instead of rehashing a list grid per query
+        self.grid = self.env.get_compact_grid()
         self.tasks = self.env.get_tasks()
         # Keep a copy of all tasks and assign numbers
         self.all_tasks = self.tasks.copy()
@@ -108,14 +112,22 @@ class SearchSimulation(SimulationBase):
         self.margin = 1
         # Set start position
         self.start_pos = self.env.get_start_position()
-        # Initialize agent
+        # Initialize agent with fresh search counters
+        self.search_stats = SearchStats()
         self.agent = RobotAgent(self.start_pos, self.tasks.copy(), algorithm=self.algorithm,
-                                nearest_task=self.nearest_task)
+                                nearest_task=self.nearest_task, plan_tour=self.plan_tour,
+                                path_cache=self.path_cache, stats=self.search_stats)
         self.animation_started = False
-        self.agent.path_traveled = []
+        self.agent.path_traveled.clear()
         self.agent.path = []
         self.agent.completed_tasks = []
         self.path_length = None
+        self.search_steps = None  # Generator of the search being animated
+        self.search_overlay = {}  # Position -> color of cells the search expanded or reached
+        self.overlay_pending = []  # Overlay cells not drawn yet
+        # The new grid needs a new background and a full repaint
+        self.background = None
+        self.full_redraw = True
 
     def update(self):
         # Handle window resize
@@ -124,35 +136,95 @@ class SearchSimulation(SimulationBase):
         grid_height = window_height
         self.cell_size = min(grid_width // self.grid_size, grid_height // self.grid_size)
         self.margin = 1
-
-        # Update fonts based on cell_size
-        self.font_size = int(self.cell_size // 2)
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
-
-        self.start_button.font = self.font_medium
-        self.reset_button.font = self.font_medium
-
-        # Update button positions on resize
-        self.update_buttons()
-
-        if self.animation_started:
-            self.agent.move()
-            # Update path length
+        if (window_width, window_height, self.cell_size) != self.layout:
+            # Rebuild the background at the new cell size and repaint everything
+            self.layout = (window_width, window_height, self.cell_size)
+            self.background = None
+            self.full_redraw = True
+
+            # Update fonts based on cell_size
+            self.font_size = int(self.cell_size // 2)
+            self.font_small = get_font(None, self.font_size)
+            self.font_medium = get_font(None, int(self.font_size * 1.2))
+            self.font_large = get_font(None, int(self.font_size * 1.5))
+
+            # Update button positions and fonts on resize
+            self.update_buttons()
+
+        if self.search_steps is not None:
+            self.advance_search()
+
+    def start(self):
+        """Start the agent's search; an animated search advances one batch per frame in update()."""
+        self.animation_started = False
+        self.search_overlay = {}
+        self.overlay_pending = []
+        self.full_redraw = True  # Clear the overlay of an earlier search
+        if self.expansions_per_frame:
+            self.search_steps = self.agent.initial_path_steps(self.grid, batch_size=self.expansions_per_frame)
+        else:
+            # Find initial path when start button is clicked
+            self.agent.find_initial_path(self.grid)
+            self.finish_search()
+
+    def advance_search(self):
+        """Run one batch of the animated search and queue its cells for drawing."""
+        try:
+            expanded, frontier = next(self.search_steps)
+        except StopIteration:
+            self.finish_search()
+            return
+        for pos in frontier:
+            if pos not in self.search_overlay:
+                self.search_overlay[pos] = LIGHT_BLUE
+                self.overlay_pending.append(pos)
+        for pos in expanded:
+            self.search_overlay[pos] = PALE_YELLOW
+            self.overlay_pending.append(pos)
+
+    def finish_search(self):
+        self.search_steps = None
+        if not self.agent.path:
+            print(f"No path found using {self.algorithm.upper()}")
+        else:
+            self.animation_started = True
             self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
-            # Stop the simulation when all tasks are completed
-            if len(self.agent.completed_tasks) == len(self.tasks):
-                self.animation_started = False
+
+    def step(self):
+        """Move the agent one cell along its path."""
+        if self.search_steps is not None:
+            return True  # update() is still advancing the search
+        if not self.animation_started:
+            return False
+        self.agent.move()
+        # Update path length
+        self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
+        # Stop once the agent has no path left: every task is completed or the rest cannot be reached
+        if not self.agent.path:
+            self.animation_started = False
+        return True
 
     def draw(self):
-        self.screen.fill(WHITE)
+        if self.background is None:
+            self.build_background()
+        if self.full_redraw:
+            # Repaint the static grid, then let draw_environment add everything that moves
+            self.screen.fill(WHITE)
+            self.screen.blit(self.background, (0, 0))
+            self.completed_drawn = 0
+            self.agent_drawn_at = None
+            self.overlay_pending = list(self.search_overlay)
+            self.mark_dirty(self.screen.get_rect())
+            self.full_redraw = False
         self.draw_environment()
-        pygame.display.flip()
+        self.present()
 
-    def draw_environment(self):
+    def build_background(self):
+        """Pre-render the obstacles, free cells and uncompleted tasks into an off-screen Surface."""
         CELL_SIZE = self.cell_size
         MARGIN = self.margin
+        self.background = pygame.Surface((self.grid_size * CELL_SIZE, self.grid_size * CELL_SIZE))
+        self.background.fill(WHITE)
 
         # Draw the grid
         for y in range(self.grid_size):
@@ -161,29 +233,59 @@ class SearchSimulation(SimulationBase):
                     x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
                 )
                 if self.grid[y][x] == 1:
-                    pygame.draw.rect(self.screen, BLACK, rect)
+                    pygame.draw.rect(self.background, BLACK, rect)
                 else:
-                    pygame.draw.rect(self.screen, GRAY, rect)
+                    pygame.draw.rect(self.background, GRAY, rect)
 
-        # Draw all tasks (both completed and uncompleted)
+        # Draw all tasks as uncompleted; completed ones are painted over on screen
         for task in self.all_tasks:
-            tx, ty = task
-            rect = pygame.Rect(
-                tx * CELL_SIZE, ty * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-            )
-            if task in self.agent.completed_tasks:
-                pygame.draw.rect(self.screen, GREEN, rect)
-            else:
-                pygame.draw.rect(self.screen, RED, rect)
-            # Draw task number
-            task_number = self.task_numbers[task]
-            text_surface = self.font_small.render(str(task_number), True, BLACK)
-            text_rect = text_surface.get_rect(center=rect.center)
-            self.screen.blit(text_surface, text_rect)
+            self.draw_task(self.background, task, RED)
+
+    def cell_rect(self, position):
+        x, y = position
+        return pygame.Rect(
+            x * self.cell_size, y * self.cell_size, self.cell_size - self.margin, self.cell_size - self.margin
+        )
+
+    def draw_task(self, surface, task, color):
+        rect = self.cell_rect(task)
+        pygame.draw.rect(surface, color, rect)
+        # Draw task number
+        task_number = self.task_numbers[task]
+        text_surface = render_text(str(task_number), self.font_small, BLACK)
+        text_rect = text_surface.get_rect(center=rect.center)
+        surface.blit(text_surface, text_rect)
+        return rect
+
+    def draw_environment(self):
+        # Restore the cell the agent left from the background
+        if self.agent_drawn_at is not None and self.agent_drawn_at != self.agent.position:
+            rect = self.cell_rect(self.agent_drawn_at)
+            self.screen.blit(self.background, rect, rect)
+            color = self.search_overlay.get(self.agent_drawn_at)
+            if color is not None and self.agent_drawn_at not in self.task_numbers:
+                pygame.draw.rect(self.screen, color, rect)
+            if self.agent_drawn_at in self.agent.completed_tasks:
+                self.draw_task(self.screen, self.agent_drawn_at, GREEN)
+            self.mark_dirty(rect)
+
+        # Draw the cells the search expanded or reached since the last frame
+        for pos in self.overlay_pending:
+            if pos not in self.task_numbers:
+                rect = self.cell_rect(pos)
+                pygame.draw.rect(self.screen, self.search_overlay[pos], rect)
+                self.mark_dirty(rect)
+        self.overlay_pending = []
+
+        # Draw only the tasks completed since the last frame
+        for task in self.agent.completed_tasks[self.completed_drawn:]:
+            self.mark_dirty(self.draw_task(self.screen, task, GREEN))
+        self.completed_drawn = len(self.agent.completed_tasks)
 
         # Draw right panel background
-        panel_rect = pygame.Rect(self.grid_size * CELL_SIZE, 0, PANEL_WIDTH, self.screen.get_height())
+        panel_rect = pygame.Rect(self.grid_size * self.cell_size, 0, PANEL_WIDTH, self.screen.get_height())
         pygame.draw.rect(self.screen, WHITE, panel_rect)
+        self.mark_dirty(panel_rect)
 
         # Draw UI elements on the right panel
         self.draw_ui(panel_rect.x + 20, 20)
@@ -191,47 +293,57 @@ class SearchSimulation(SimulationBase):
         # Draw Start and Reset buttons
         self.start_button.draw(self.screen)
         self.reset_button.draw(self.screen)
+        self.mark_dirty(self.start_button.rect)
+        self.mark_dirty(self.reset_button.rect)
 
         # Draw the agent
         self.draw_agent()
 
     def draw_ui(self, panel_x, y_offset):
         # Display Agent Status
-        status_text = self.font_medium.render("Agent Status", True, BLACK)
+        status_text = render_text("Agent Status", self.font_medium, BLACK)
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
-        position_text = self.font_small.render(f"Position: {self.agent.position}", True, BLACK)
+        position_text = render_text(f"Position: {self.agent.position}", self.font_small, BLACK)
         self.screen.blit(position_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
         if self.animation_started:
-            status_text = self.font_small.render("Status: Moving", True, BLACK)
+            status_text = render_text("Status: Moving", self.font_small, BLACK)
         else:
-            status_text = self.font_small.render("Status: Idle", True, BLACK)
+            status_text = render_text("Status: Idle", self.font_small, BLACK)
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
         # Display Path Length
         if self.path_length is not None:
-            path_length_text = self.font_small.render(f"Path Length: {self.path_length}", True, BLACK)
+            path_length_text = render_text(f"Path Length: {self.path_length}", self.font_small, BLACK)
             self.screen.blit(path_length_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
 
         # Display Algorithm Used
-        algorithm_text = self.font_small.render(f"Algorithm: {self.algorithm.upper()}", True, BLACK)
+        algorithm_text = render_text(f"Algorithm: {self.algorithm.upper()}", self.font_small, BLACK)
         self.screen.blit(algorithm_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
+        # Display search counters
+        for name, label in (('nodes_expanded', "Nodes Expanded"), ('peak_frontier', "Peak Frontier"),
+                            ('heap_pushes', "Heap Pushes")):
+            if name in self.search_stats:
+                counter_text = render_text(f"{label}: {self.search_stats[name]}", self.font_small, BLACK)
+                self.screen.blit(counter_text, (panel_x, y_offset))
+                y_offset += int(self.font_size)
+
         # Display Tasks Remaining
         tasks_remaining = len(self.tasks) - len(self.agent.completed_tasks)
-        tasks_remaining_text = self.font_small.render(f"Tasks Remaining: {tasks_remaining}", True, BLACK)
+        tasks_remaining_text = render_text(f"Tasks Remaining: {tasks_remaining}", self.font_small, BLACK)
         self.screen.blit(tasks_remaining_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
         # Display Mouse Grid Position
         if self.mouse_grid_pos is not None:
-            mouse_pos_text = self.font_small.render(f"Cursor Position: {self.mouse_grid_pos}", True, BLACK)
+            mouse_pos_text = render_text(f"Cursor Position: {self.mouse_grid_pos}", self.font_small, BLACK)
             self.screen.blit(mouse_pos_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
         else:
@@ -239,22 +351,10 @@ class SearchSimulation(SimulationBase):
 
     def draw_agent(self):
         # Draw agent on top of the grid
-        CELL_SIZE = self.cell_size
-        MARGIN = self.margin
-        x, y = self.agent.position
-        rect = pygame.Rect(
-            x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-        )
+        rect = self.cell_rect(self.agent.position)
         pygame.draw.rect(self.screen, BLUE, rect)
-
-    def run(self):
-        """Main loop of the simulation."""
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(5)  # Set to 5 FPS to slow down the animation
+        self.mark_dirty(rect)
+        self.agent_drawn_at = self.agent.position
 
     def quit(self):
         """Exit the simulation."""
@@ -270,7 +370,7 @@ class Button:
 
     def draw(self, surface):
         pygame.draw.rect(surface, self.color, self.rect)
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = render_text(self.text, self.font, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -1,34 +1,126 @@
 # modules/simulations/simulation_base.py
 
+import time
+
 import pygame
 
+MAX_STEPS_PER_FRAME = 1000  # Catch-up limit so a slow frame cannot stall the event loop
+
 class SimulationBase:
-    def __init__(self, screen):
+    def __init__(self, screen, steps_per_second=60, render_every=1, max_fps=60):
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.running = True
+        self.dirty_rects = []  # Screen areas changed since the last present()
+        self.full_redraw = True  # Set when the whole window must be repainted
+        self.steps_per_second = steps_per_second  # None or 0 runs steps as fast as the CPU allows
+        self.render_every = max(1, render_every)  # Draw once per this many simulation steps
+        self.max_fps = max_fps
+        self.capture = None  # Optional FrameWriter fed by present()
 
     def run(self):
-        """Main loop of the simulation."""
+        """
+        Main loop of the simulation. Events and layout are handled every
+        frame, while step() runs on a fixed timestep of steps_per_second,
+        independent of the frame rate. With render_every=N the window is only
+        redrawn after N steps (or on frames where no step ran, so the UI
+        stays responsive while idle).
+        """
+        accumulator = 0.0
+        steps_since_render = 0
+        previous = time.perf_counter()
         while self.running:
             self.handle_events()
             self.update()
+
+            now = time.perf_counter()
+            accumulator += now - previous
+            previous = now
+            steps = 0  # Steps that advanced the simulation this frame
+            if self.steps_per_second:
+                step_time = 1.0 / self.steps_per_second
+                ticks = 0
+                while accumulator >= step_time and ticks < MAX_STEPS_PER_FRAME:
+                    accumulator -= step_time
+                    ticks += 1
+                    if self.step():
+                        steps += 1
+                if ticks == MAX_STEPS_PER_FRAME:
+                    accumulator = 0.0  # Drop the backlog instead of spiralling
+            else:
+                # Fast-forward: step for one frame's worth of time, then yield to the UI
+                deadline = now + 1.0 / self.max_fps
+                while self.running and self.step():
+                    steps += 1
+                    if time.perf_counter() >= deadline:
+                        break
+                accumulator = 0.0
+
+            steps_since_render += steps
+            if steps == 0 or steps_since_render >= self.render_every:
+                self.draw()
+                steps_since_render = 0
+            self.clock.tick(self.max_fps)
+
+    def run_headless(self, max_steps=None):
+        """
+        Runs the simulation without handling events: start() is called once,
+        then update() and step() repeat until step() has nothing left to
+        advance, quit() is called or max_steps is reached. Nothing is drawn
+        unless a capture is attached, in which case every render_every-th
+        step is rendered (to an off-screen Surface or the dummy video
+        driver) and recorded. Returns the number of steps taken.
+        """
+        self.start()
+        steps = 0
+        if self.capture is not None:
+            self.update()
+            self.draw()
+        while self.running and (max_steps is None or steps < max_steps):
+            self.update()
+            if not self.step():
+                break
+            steps += 1
+            if self.capture is not None and steps % self.render_every == 0:
+                self.draw()
+        if self.capture is not None and steps % self.render_every:
+            # Record the final state as well
             self.draw()
-            pygame.display.flip()
-            self.clock.tick(60)  # Adjust the frame rate as needed
+        return steps
 
     def handle_events(self):
         """Handle user input and system events."""
         raise NotImplementedError("Subclasses should implement this method.")
 
     def update(self):
-        """Update the simulation state."""
+        """Update per-frame state such as the layout; called once per loop iteration."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def start(self):
+        """Begin the animation, e.g. by planning the agent's path."""
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def step(self):
+        """Advance the simulation by one step. Returns False if there was nothing to advance."""
         raise NotImplementedError("Subclasses should implement this method.")
 
     def draw(self):
-        """Draw the simulation elements on the screen."""
+        """Draw the simulation elements and present them with present()."""
         raise NotImplementedError("Subclasses should implement this method.")
 
+    def mark_dirty(self, rect):
+        """Queue a screen area to be pushed to the display by present()."""
+        self.dirty_rects.append(rect)
+
+    def present(self):
+        """Push the dirty areas to the display in a single update call and record the frame."""
+        if self.dirty_rects:
+            if self.screen is pygame.display.get_surface():
+                pygame.display.update(self.dirty_rects)
+            self.dirty_rects = []
+        if self.capture is not None:
+            self.capture.submit(self.screen)
+
     def quit(self):
         """Exit the simulation."""
         self.running = False
@@ -4,8 +4,12 @@ from .constants import (
     PANEL_WIDTH, DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT,
     WHITE, GRAY, GREEN, BLUE, PURPLE, BLACK, YELLOW, BROWN, LIGHT_GRAY
 )
+from .compact_grid import CompactGrid, as_compact
+from .path_history import PathHistory
+from .spatial_hash import SpatialHash
 
 __all__ = [
     'PANEL_WIDTH', 'DEFAULT_WINDOW_WIDTH', 'DEFAULT_WINDOW_HEIGHT',
-    'WHITE', 'GRAY', 'GREEN', 'BLUE', 'PURPLE', 'BLACK', 'YELLOW', 'BROWN', 'LIGHT_GRAY'
+    'WHITE', 'GRAY', 'GREEN', 'BLUE', 'PURPLE', 'BLACK', 'YELLOW', 'BROWN', 'LIGHT_GRAY',
+    'CompactGrid', 'as_compact', 'PathHistory', 'SpatialHash'
 ]
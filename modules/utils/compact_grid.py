@@ -0,0 +1,195 @@
+# modules/utils/compact_grid.py
+
+"""
+Compact one-byte-per-cell grid shared by the environments and the search algorithms.
+
+Cells are stored row by row in a bytearray that is padded with a border of
+walls, so the four neighbours of the cell at flat index i are always at
+i + offset for offset in CompactGrid.offsets and never need a bounds check.
+"""
+
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+WALL = 1
+OPEN = 0
+
+
+class CompactGrid:
+    def __init__(self, width, height, fill=OPEN):
+        self.width = width
+        self.height = height
+        self.stride = width + 2  # Row length including the two border walls
+        self.cells = bytearray([WALL]) * (self.stride * (height + 2))
+        if fill != WALL:
+            row = bytearray([WALL]) + bytearray([fill]) * width + bytearray([WALL])
+            for y in range(height):
+                start = (y + 1) * self.stride
+                self.cells[start:start + self.stride] = row
+        # Flat index offsets of the Left, Right, Up and Down neighbours
+        self.offsets = (-1, 1, -self.stride, self.stride)
+        self._fingerprint = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Builds a CompactGrid from a list-of-lists grid indexed as rows[y][x]."""
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        grid = cls(width, height, fill=WALL)
+        for y, row in enumerate(rows):
+            start = (y + 1) * grid.stride + 1
+            grid.cells[start:start + width] = bytes(row)
+        return grid
+
+    def copy(self):
+        grid = CompactGrid.__new__(CompactGrid)
+        grid.width = self.width
+        grid.height = self.height
+        grid.stride = self.stride
+        grid.cells = bytearray(self.cells)
+        grid.offsets = self.offsets
+        grid._fingerprint = self._fingerprint
+        return grid
+
+    def index(self, position):
+        """Returns the flat index of an (x, y) position."""
+        x, y = position
+        return (y + 1) * self.stride + x + 1
+
+    def position(self, index):
+        """Returns the (x, y) position of a flat index."""
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def contains(self, position):
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x, y):
+        return self.cells[(y + 1) * self.stride + x + 1]
+
+    def set(self, x, y, value):
+        index = (y + 1) * self.stride + x + 1
+        if self._fingerprint is not None and self.cells[index] != value:
+            # Zobrist-style update: toggling a cell XORs in a key for its index
+            self._fingerprint ^= cell_key(index)
+        self.cells[index] = value
+
+    @property
+    def fingerprint(self):
+        """
+        64-bit hash of the grid contents.
+
+        It is computed once from the cells and then kept up to date in O(1)
+        by set(). Two grids with equal fingerprints have equal contents
+        (barring a hash collision). Equal contents reached through different
+        edit histories may hash differently, which only costs a cache miss.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hash_bytes(self.width.to_bytes(4, 'little') + bytes(self.cells))
+        return self._fingerprint
+
+    def touch(self):
+        """Forgets the cached fingerprint after cells were written directly."""
+        self._fingerprint = None
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        # Zero-copy read-only row view so that existing grid[y][x] reads keep working;
+        # writes must go through set() so the fingerprint stays current
+        if not 0 <= y < self.height:
+            raise IndexError("row index out of range")
+        start = (y + 1) * self.stride + 1
+        return memoryview(self.cells)[start:start + self.width].toreadonly()
+
+    def to_rows(self):
+        """Returns the grid as a list of lists of ints."""
+        return [list(self[y]) for y in range(self.height)]
+
+    def as_numpy(self):
+        """
+        Returns a (height, width) uint8 NumPy view that shares memory with the grid.
+
+        Writes through the view bypass set(), so call touch() afterwards to
+        drop the cached fingerprint.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for CompactGrid.as_numpy()")
+        padded = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height + 2, self.stride)
+        return padded[1:-1, 1:-1]
+
+    def neighbors(self, position, blocked_positions=(), grid_size=None):
+        """Returns the open 4-connected neighbours of an (x, y) position."""
+        x, y = position
+        index = (y + 1) * self.stride + x + 1
+        cells = self.cells
+        neighbors = []
+        for (dx, dy), offset in zip(MOVES, self.offsets):
+            if not cells[index + offset]:
+                neighbor = (x + dx, y + dy)
+                if grid_size is not None and not (neighbor[0] < grid_size and neighbor[1] < grid_size):
+                    continue
+                if neighbor not in blocked_positions:
+                    neighbors.append(neighbor)
+        return neighbors
+
+
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))  # Left, Right, Up, Down
+
+
+def hash_bytes(data):
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def cell_key(index):
+    """Pseudo-random 64-bit key for a flat cell index (splitmix64 finaliser)."""
+    z = (index + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return z ^ (z >> 31)
+
+
+def grid_fingerprint(grid):
+    """Returns a 64-bit fingerprint of a CompactGrid or a list-of-lists grid."""
+    if isinstance(grid, CompactGrid):
+        return grid.fingerprint
+    # List grids have no change tracking, so they are hashed in full each time
+    width = len(grid[0]) if grid else 0
+    return hash_bytes(width.to_bytes(4, 'little') + b''.join(bytes(row) for row in grid))
+
+
+def as_compact(grid, blocked_positions=(), grid_size=None):
+    """
+    Returns a CompactGrid view of grid suitable for index-based search.
+
+    A CompactGrid is returned as is when nothing needs to change. Otherwise a
+    copy is made with the blocked positions, and any cells outside the
+    grid_size x grid_size square the searches are limited to, turned into walls.
+    """
+    if isinstance(grid, CompactGrid):
+        compact = grid
+    else:
+        compact = CompactGrid.from_rows(grid)
+    clip = grid_size is not None and (grid_size < compact.width or grid_size < compact.height)
+    if not blocked_positions and not clip:
+        return compact
+    if compact is grid:
+        compact = compact.copy()
+    for position in blocked_positions:
+        if compact.contains(position):
+            compact.set(position[0], position[1], WALL)
+    if clip:
+        for y in range(compact.height):
+            start = (y + 1) * compact.stride + 1
+            first_clipped = 0 if y >= grid_size else grid_size
+            if first_clipped < compact.width:
+                compact.cells[start + first_clipped:start + compact.width] = (
+                    bytearray([WALL]) * (compact.width - first_clipped))
+        compact._fingerprint = None  # Written directly, so rehash on demand
+    return compact
@@ -20,4 +20,5 @@ LIGHT_GRAY = (220, 220, 220)
 DARK_BLUE = (0, 0, 139)
 # Additional colors
 RED = (255, 0, 0)  # For the goal position in the maze
-
+LIGHT_BLUE = (173, 216, 230)  # Cells on the search frontier
+PALE_YELLOW = (250, 240, 170)  # Cells expanded by the search
@@ -0,0 +1,60 @@
+# modules/utils/path_history.py
+
+"""
+Append-only record of the positions an agent has visited.
+
+Positions are packed as x, y pairs into one array('i'), eight bytes per
+step instead of a tuple per step. len() is the total number of positions
+ever appended, so it still counts the steps taken. With max_length set, at
+least the newest max_length positions are kept; once twice that many are
+held, the oldest surplus is dropped in one slice, so appends stay
+amortized O(1) and memory stays bounded on arbitrarily long runs.
+"""
+
+from array import array
+
+
+class PathHistory:
+    def __init__(self, positions=(), max_length=None):
+        self.max_length = max_length
+        self.cells = array('i')  # x0, y0, x1, y1, ...
+        self.dropped = 0  # Positions discarded from the front because of max_length
+        for position in positions:
+            self.append(position)
+
+    def append(self, position):
+        self.cells.extend(position)
+        if self.max_length is not None and len(self.cells) > 4 * self.max_length:
+            surplus = len(self.cells) // 2 - self.max_length
+            del self.cells[:2 * surplus]
+            self.dropped += surplus
+
+    def since(self, index):
+        """Yields the retained positions from absolute index onwards."""
+        cells = self.cells
+        first = max(index - self.dropped, 0)
+        for i in range(2 * first, len(cells), 2):
+            yield (cells[i], cells[i + 1])
+
+    def clear(self):
+        del self.cells[:]
+        self.dropped = 0
+
+    def retained(self):
+        """Number of positions still held in memory."""
+        return len(self.cells) // 2
+
+    def __len__(self):
+        return self.dropped + len(self.cells) // 2
+
+    def __iter__(self):
+        return self.since(0)
+
+    def __getitem__(self, index):
+        """Returns the position at an absolute index; negative indexes count from the newest."""
+        if index < 0:
+            index += len(self)
+        offset = index - self.dropped
+        if not 0 <= offset < len(self.cells) // 2:
+            raise IndexError("position not retained in the path history")
+        return (self.cells[2 * offset], self.cells[2 * offset + 1])
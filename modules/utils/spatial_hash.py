@@ -0,0 +1,66 @@
+# modules/utils/spatial_hash.py
+
+"""
+Spatial hash of items on a grid.
+
+Items are bucketed by the bucket_size x bucket_size block of cells they
+stand on, so finding the items near a cell only looks at the few buckets
+around it instead of at every item. Moving an item within its block is a
+dict update; moving across blocks touches two buckets.
+"""
+
+
+class SpatialHash:
+    def __init__(self, bucket_size=8):
+        self.bucket_size = bucket_size
+        self.buckets = {}  # (bucket x, bucket y) -> {item: position}
+        self.positions = {}  # item -> position
+
+    def bucket(self, position):
+        return (position[0] // self.bucket_size, position[1] // self.bucket_size)
+
+    def insert(self, item, position):
+        self.positions[item] = position
+        self.buckets.setdefault(self.bucket(position), {})[item] = position
+
+    def remove(self, item):
+        self.remove_from_bucket(self.bucket(self.positions.pop(item)), item)
+
+    def move(self, item, position):
+        old_key = self.bucket(self.positions[item])
+        new_key = self.bucket(position)
+        self.positions[item] = position
+        if old_key == new_key:
+            self.buckets[new_key][item] = position
+        else:
+            self.remove_from_bucket(old_key, item)
+            self.buckets.setdefault(new_key, {})[item] = position
+
+    def remove_from_bucket(self, key, item):
+        bucket = self.buckets[key]
+        del bucket[item]
+        if not bucket:
+            del self.buckets[key]
+
+    def at(self, position):
+        """Returns the items standing exactly on position."""
+        bucket = self.buckets.get(self.bucket(position), {})
+        return [item for item, item_position in bucket.items() if item_position == position]
+
+    def nearby(self, position, radius):
+        """Returns the items within radius cells of position along both axes."""
+        x, y = position
+        size = self.bucket_size
+        items = []
+        for bx in range((x - radius) // size, (x + radius) // size + 1):
+            for by in range((y - radius) // size, (y + radius) // size + 1):
+                bucket = self.buckets.get((bx, by))
+                if bucket is None:
+                    continue
+                for item, (ix, iy) in bucket.items():
+                    if abs(ix - x) <= radius and abs(iy - y) <= radius:
+                        items.append(item)
+        return items
+
+    def __len__(self):
+        return len(self.positions)
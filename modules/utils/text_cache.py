@@ -0,0 +1,92 @@
+# modules/utils/text_cache.py
+
+"""
+Shared caches for pygame fonts and rendered text surfaces.
+
+pygame.font.SysFont scans the installed system fonts on every call, and
+Font.render rasterizes the string again each time, so the UI panels keep
+both behind small LRU caches. Fonts are keyed by (name, size); rendered
+text by (text, font, color, antialias). Both caches evict the least
+recently used entry once they hold max_entries items.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class FontCache:
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (name, size) -> Font, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, name, size):
+        """Returns pygame.font.SysFont(name, size), loading it only on a cache miss."""
+        key = (name, max(1, int(size)))
+        font = self.entries.get(key)
+        if font is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return font
+        self.misses += 1
+        font = pygame.font.SysFont(name, key[1])
+        self.entries[key] = font
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return font
+
+    def stats(self):
+        return {'entries': len(self.entries), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+    def clear(self):
+        self.entries.clear()
+
+
+class TextCache:
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (text, font, color, antialias) -> Surface, oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, font, color, antialias=True):
+        """Returns font.render(text, antialias, color), rasterizing only on a cache miss."""
+        key = (text, font, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        return {'entries': len(self.entries), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+    def clear(self):
+        self.entries.clear()
+
+
+# Process-wide caches shared by the simulations and examples
+font_cache = FontCache()
+text_cache = TextCache()
+
+
+def get_font(name, size):
+    return font_cache.get(name, size)
+
+
+def render_text(text, font, color, antialias=True):
+    return text_cache.render(text, font, color, antialias)